@@ -0,0 +1,54 @@
+# coding=utf-8
+"""Benchmark the number of IDF object strings that can be generated per second.
+
+Strings are generated for the same number of EnergyMaterial objects one at a time
+with generate_idf_string and all at once with generate_idf_strings, both with
+comments and in compact form.
+
+Usage:
+    python benchmarks/idf_strings.py [number_of_objects] [number_of_runs]
+"""
+from __future__ import print_function
+import sys
+import timeit
+
+from honeybee_energy.material.opaque import EnergyMaterial
+from honeybee_energy.writer import generate_idf_string, generate_idf_strings
+
+
+def material_values(object_count):
+    """Get a list of the IDF values of different EnergyMaterials."""
+    values_list = []
+    for i in range(object_count):
+        mat = EnergyMaterial('Material {}'.format(i), 0.01 + i * 1e-6, 0.5, 1000,
+                             900, 'MediumRough', 0.9, 0.7, 0.7)
+        values_list.append((mat.name, mat.roughness, mat.thickness, mat.conductivity,
+                            mat.density, mat.specific_heat, mat.thermal_absorptance,
+                            mat.solar_absorptance, mat.visible_absorptance))
+    return values_list
+
+
+def benchmark(object_count=10000, runs=3):
+    """Print the number of IDF strings generated per second by each method."""
+    values_list = material_values(object_count)
+    comments = ('name', 'roughness', 'thickness {m}', 'conductivity {W/m-K}',
+                'density {kg/m3}', 'specific heat {J/kg-K}', 'thermal absorptance',
+                'solar absorptance', 'visible absorptance')
+    cases = (
+        ('generate_idf_string', lambda: [generate_idf_string(
+            'Material', values, comments) for values in values_list]),
+        ('generate_idf_string compact', lambda: [generate_idf_string(
+            'Material', values, comments, True) for values in values_list]),
+        ('generate_idf_strings', lambda: generate_idf_strings(
+            'Material', values_list, comments)),
+        ('generate_idf_strings compact', lambda: generate_idf_strings(
+            'Material', values_list, comments, True)))
+    print('{} Material objects'.format(object_count))
+    for name, func in cases:
+        run_time = min(timeit.repeat(func, number=1, repeat=runs))
+        print('{:30} {:10.0f} objects/s'.format(name, object_count / run_time))
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+              int(sys.argv[2]) if len(sys.argv) > 2 else 3)
@@ -0,0 +1,55 @@
+# coding=utf-8
+"""Benchmark the time to index the standards library with and without the cache.
+
+Usage:
+    python benchmarks/library_load.py [number_of_runs]
+"""
+from __future__ import print_function
+import os
+import sys
+import timeit
+
+from honeybee_energy.lib._librarycache import library_files, index_json_files, \
+    load_cached_index
+from honeybee_energy.lib._loadconstructions import _index_construction_files
+from honeybee_energy.lib._loadtypelimits import _index_type_limit_files
+from honeybee_energy.lib._loadschedules import _index_schedule_files
+
+
+LIBRARY_FOLDER = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'honeybee_energy', 'lib', 'library')
+
+LIBRARIES = (
+    ('constructions', 'constructions', '.idf', _index_construction_files),
+    ('scheduletypelimits', 'schedules', '.idf', _index_type_limit_files),
+    ('schedules', 'schedules', '.idf', _index_schedule_files),
+    ('constructionsets', 'constructionsets', '.json', index_json_files),
+    ('programtypes', 'programtypes', '.json', index_json_files)
+)
+
+
+def index_without_cache():
+    """Parse all of the library files."""
+    for _, folder, extension, index_function in LIBRARIES:
+        index_function(library_files(os.path.join(LIBRARY_FOLDER, folder), extension))
+
+
+def index_with_cache():
+    """Load all of the library indices from the cache."""
+    for cache_name, folder, extension, index_function in LIBRARIES:
+        file_paths = library_files(os.path.join(LIBRARY_FOLDER, folder), extension)
+        load_cached_index(cache_name, file_paths, index_function)
+
+
+def benchmark(runs=20):
+    """Print the best times to index the library without and with the cache."""
+    index_with_cache()  # make sure that the cache is written
+    for label, func in (('without cache:', index_without_cache),
+                        ('with cache:   ', index_with_cache)):
+        best_time = min(timeit.repeat(func, number=1, repeat=runs))
+        print('Library index {} {:.2f} ms'.format(label, best_time * 1000))
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,83 @@
+# coding=utf-8
+"""Benchmark the time to re-create a large generated Model from a dictionary.
+
+The generated Model has Rooms with their own constructions, schedules, apertures,
+doors and shades so that both the resource dictionaries and the geometry property
+dictionaries are large. The time to apply the energy properties is reported
+separately from the time to re-create the Model with all of its geometry. The
+time to apply the energy properties is also reported for each number of loader
+processes, which create the materials and schedules in a process pool.
+
+Usage:
+    python benchmarks/model_from_dict.py [number_of_rooms] [number_of_runs]
+        [loader_processes...]
+"""
+from __future__ import print_function
+import sys
+import timeit
+import multiprocessing
+
+from honeybee.model import Model
+from honeybee.room import Room
+from honeybee.door import Door
+from ladybug_geometry.geometry3d.pointvector import Point3D
+from ladybug_geometry.geometry3d.face import Face3D
+
+from honeybee_energy.construction.opaque import OpaqueConstruction
+from honeybee_energy.load.lighting import Lighting
+from honeybee_energy.schedule.ruleset import ScheduleRuleset
+from honeybee_energy.lib.materials import wood, insulation
+from honeybee_energy.lib.programtypes import office_program
+import honeybee_energy.lib.scheduletypelimits as schedule_types
+
+
+def generated_model_dict(room_count):
+    """Get the dictionary of a Model with the input number of shoe box Rooms."""
+    rooms = []
+    for i in range(room_count):
+        room = Room.from_box('Room {}'.format(i), 5, 5, 3, origin=Point3D(5 * i, 0, 0))
+        room.properties.energy.program_type = office_program
+        room[1].properties.energy.construction = OpaqueConstruction(
+            'Wall {}'.format(i), [wood, insulation, wood])
+        door_verts = [Point3D(5 * i + 2, 5, 0.1), Point3D(5 * i + 1, 5, 0.1),
+                      Point3D(5 * i + 1, 5, 2.5), Point3D(5 * i + 2, 5, 2.5)]
+        door = Door('Door {}'.format(i), Face3D(door_verts))
+        door.properties.energy.construction = OpaqueConstruction(
+            'Door {}'.format(i), [wood])
+        room[1].add_door(door)
+        room[3].apertures_by_ratio(0.4, 0.01)
+        room[3].apertures[0].overhang(0.5)
+        weekday = [0.1] * 8 + [1] * 10 + [0.1] * 6
+        weekend = [0.1] * 9 + [0.5] * 6 + [0.1] * 9
+        schedule = ScheduleRuleset.from_week_daily_values(
+            'Lighting {}'.format(i), weekend, weekday, weekday, weekday, weekday,
+            weekday, weekend, weekend, schedule_type_limit=schedule_types.fractional)
+        room.properties.energy.lighting = Lighting('Lights {}'.format(i), 5, schedule)
+        rooms.append(room)
+    return Model('Generated Model', rooms).to_dict()
+
+
+def benchmark(room_count=2000, runs=3, loader_processes=(2, 4)):
+    """Print the best times to apply energy properties and to re-create the Model."""
+    model_dict = generated_model_dict(room_count)
+    model = Model.from_dict(model_dict)
+    energy_time = min(timeit.repeat(
+        lambda: model.properties.energy.apply_properties_from_dict(model_dict),
+        number=1, repeat=runs))
+    model_time = min(timeit.repeat(
+        lambda: Model.from_dict(model_dict), number=1, repeat=runs))
+    print('{} rooms on {} CPUs'.format(room_count, multiprocessing.cpu_count()))
+    print('Apply energy properties: {:8.1f} ms'.format(energy_time * 1000))
+    print('Model.from_dict:         {:8.1f} ms'.format(model_time * 1000))
+    for processes in loader_processes:
+        pool_time = min(timeit.repeat(
+            lambda: model.properties.energy.apply_properties_from_dict(
+                model_dict, processes), number=1, repeat=runs))
+        print('Apply with {} processes: {:8.1f} ms'.format(
+            processes, pool_time * 1000))
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+              int(sys.argv[2]) if len(sys.argv) > 2 else 3,
+              [int(arg) for arg in sys.argv[3:]] or (2, 4))
@@ -0,0 +1,64 @@
+# coding=utf-8
+"""Benchmark the time to collect the unique energy resources of synthetic Models.
+
+Each Room of the synthetic Models has its own construction on one of its Faces and
+its own lighting schedule so that the number of unique resources grows along with
+the number of Faces. The time per Face should stay about the same as the Models
+get larger.
+
+Usage:
+    python benchmarks/model_resources.py [number_of_runs]
+"""
+from __future__ import print_function
+import sys
+import timeit
+
+from honeybee.model import Model
+from honeybee.room import Room
+from ladybug_geometry.geometry3d.pointvector import Point3D
+
+from honeybee_energy.construction.opaque import OpaqueConstruction
+from honeybee_energy.load.lighting import Lighting
+from honeybee_energy.schedule.ruleset import ScheduleRuleset
+from honeybee_energy.lib.materials import wood, insulation
+from honeybee_energy.lib.programtypes import office_program
+import honeybee_energy.lib.scheduletypelimits as schedule_types
+
+
+FACE_COUNTS = (1000, 10000, 100000)
+
+
+def synthetic_model(face_count):
+    """Get a Model of shoe box Rooms with about the input number of Faces."""
+    rooms = []
+    for i in range(face_count // 6):
+        room = Room.from_box('Room {}'.format(i), 5, 5, 3, origin=Point3D(5 * i, 0, 0))
+        room.properties.energy.program_type = office_program
+        room[1].properties.energy.construction = OpaqueConstruction(
+            'Wall {}'.format(i), [wood, insulation, wood])
+        schedule = ScheduleRuleset.from_constant_value(
+            'Lighting {}'.format(i), 0.5, schedule_types.fractional)
+        room.properties.energy.lighting = Lighting('Lights {}'.format(i), 5, schedule)
+        rooms.append(room)
+    return Model('Synthetic Model', rooms)
+
+
+def collect_resources(model):
+    """Get all of the unique resources that are written to a Model dictionary."""
+    energy = model.properties.energy
+    return energy.constructions, energy.materials, energy.schedules, \
+        energy.schedule_type_limits, energy.program_types
+
+
+def benchmark(runs=3):
+    """Print the best time to collect the resources of each synthetic Model."""
+    for face_count in FACE_COUNTS:
+        model = synthetic_model(face_count)
+        best_time = min(timeit.repeat(
+            lambda: collect_resources(model), number=1, repeat=runs))
+        print('{:>7} faces: {:8.1f} ms ({:.2f} us per face)'.format(
+            face_count, best_time * 1000, best_time * 1e6 / face_count))
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
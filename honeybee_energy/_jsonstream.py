@@ -0,0 +1,138 @@
+# coding=utf-8
+"""Incremental reader of the values within a JSON file."""
+import json
+
+
+class JSONStream(object):
+    """Incremental reader that parses a JSON file one value at a time.
+
+    Only the part of the file that contains the value currently being parsed is
+    held in memory. So the members of a large object or array can be decoded
+    and discarded one after the other without loading the whole document.
+
+    Args:
+        file_object: A file object open for reading text.
+        chunk_size: An integer for the minimum number of characters read from
+            the file each time more text is needed. Default: 65536.
+
+    Usage:
+
+    .. code-block:: python
+
+        with open('model.json') as inf:
+            stream = JSONStream(inf)
+            for key in stream.iter_object():
+                if key == 'rooms':
+                    for room_dict in stream.iter_array():
+                        print(room_dict['name'])
+    """
+    __slots__ = ('_file', '_chunk_size', '_buffer', '_position', '_offset', '_eof',
+                 '_decoder')
+    _whitespace = ' \t\n\r'
+    _value_ends = ' \t\n\r,:]}'
+
+    def __init__(self, file_object, chunk_size=65536):
+        self._file = file_object
+        self._chunk_size = int(chunk_size)
+        self._buffer = ''
+        self._position = 0  # position of the next character in the buffer
+        self._offset = 0  # position of the start of the buffer in the file
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def read_value(self):
+        """Decode the next complete JSON value of the stream and return it."""
+        self._next_char()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except ValueError:  # the value is incomplete or invalid
+                if self._eof:
+                    raise
+                self._fill()
+                continue
+            if not self._eof and (end == len(self._buffer) or
+                                  self._buffer[end] not in self._value_ends):
+                self._fill()  # a number at the end of the buffer may be incomplete
+                continue
+            self._position = end
+            return value
+
+    def iter_array(self):
+        """Iterate over the decoded values of the JSON array next in the stream."""
+        self._expect('[')
+        if self._next_char() == ']':
+            self._position += 1
+            return
+        while True:
+            yield self.read_value()
+            if self._end_of_container(']'):
+                return
+
+    def iter_object(self):
+        """Iterate over the keys of the JSON object next in the stream.
+
+        After each key is yielded, its value is the next value of the stream and
+        it can be read with read_value, iter_array or iter_object. Values that are
+        not read before the iteration continues are decoded and discarded.
+        """
+        self._expect('{')
+        if self._next_char() == '}':
+            self._position += 1
+            return
+        while True:
+            key = self.read_value()
+            self._expect(':')
+            value_start = self._offset + self._position
+            yield key
+            if self._offset + self._position == value_start:
+                self.read_value()  # skip the value that was not read
+            if self._end_of_container('}'):
+                return
+
+    def _end_of_container(self, closing_char):
+        """Consume the separator after a member and return True if it was the last."""
+        char = self._next_char()
+        self._position += 1
+        if char == closing_char:
+            return True
+        if char != ',':
+            raise ValueError('Expected "," or "{}" at character {} of the JSON '
+                             'file. Got "{}".'.format(
+                                 closing_char, self._offset + self._position - 1,
+                                 char))
+        return False
+
+    def _expect(self, char):
+        """Consume the next non-whitespace character, checking that it is char."""
+        next_char = self._next_char()
+        if next_char != char:
+            raise ValueError('Expected "{}" at character {} of the JSON file. '
+                             'Got "{}".'.format(char, self._offset + self._position,
+                                                next_char))
+        self._position += 1
+
+    def _next_char(self):
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            buffer, position = self._buffer, self._position
+            while position < len(buffer) and buffer[position] in self._whitespace:
+                position += 1
+            self._position = position
+            if position < len(buffer) or self._eof:
+                return buffer[position] if position < len(buffer) else ''
+            self._fill()
+
+    def _fill(self):
+        """Read more text from the file, discarding the text that has been parsed.
+
+        The amount of text read grows with the length of the unparsed text so that
+        repeatedly retrying a large incomplete value takes linear time.
+        """
+        remaining = self._buffer[self._position:]
+        chunk = self._file.read(max(self._chunk_size, len(remaining)))
+        if not chunk:
+            self._eof = True
+        self._offset += self._position
+        self._buffer = remaining + chunk
+        self._position = 0
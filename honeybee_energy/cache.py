@@ -0,0 +1,116 @@
+# coding=utf-8
+"""Cached properties for lockable objects that are computed once while locked.
+
+Derived values like the R-value of a construction are computed from other
+properties every time that they are accessed. Locked objects cannot be edited
+and so the result of such properties will not change while an object is locked.
+Properties decorated with cached_property are therefore computed once while an
+object is locked and the result is reused until the object is unlocked.
+
+Classes that use cached_property must be decorated with lockable_cache (above
+the lockable decorator) and they must have a '_cache' dictionary, which should
+be included in the __slots__ of the class before '_locked'.
+
+Usage:
+
+.. code-block:: python
+
+    @lockable_cache
+    @lockable
+    class Slab(object):
+        __slots__ = ('_thickness', '_conductivity', '_cache', '_locked')
+
+        def __init__(self, thickness, conductivity):
+            self._locked = False
+            self._cache = {}
+            self.thickness = thickness
+            self.conductivity = conductivity
+
+        @cached_property
+        def r_value(self):
+            return self.thickness / self.conductivity
+"""
+from functools import wraps
+
+# whether cached_property values are stored on locked objects
+_caching_enabled = True
+
+# number of times that any object decorated with lockable_cache has been unlocked
+_unlock_count = 0
+
+
+def set_property_caching(enabled=True):
+    """Set whether the values of cached properties are stored on locked objects.
+
+    Turning off caching can be useful when debugging since every cached property
+    will then be computed each time that it is accessed.
+
+    Args:
+        enabled: Boolean to note whether the values of cached properties should be
+            stored on locked objects. Default: True.
+    """
+    global _caching_enabled, _unlock_count
+    _caching_enabled = bool(enabled)
+    _unlock_count += 1  # discard all values stored before the change
+
+
+def lockable_cache(cls):
+    """A decorator for lockable classes that clears cached properties when unlocked.
+
+    Unlocking any object that uses this decorator invalidates the cached properties
+    of all objects. This ensures that the properties of an object are recomputed
+    when the objects that it is derived from (eg. the materials of a construction)
+    are unlocked and edited.
+
+    A class can also define a _cacheable method that returns True when its cached
+    properties can be stored. By default, they are stored when the object is locked.
+    """
+    unlock = cls.unlock
+
+    @wraps(unlock)
+    def unlock_and_clear(self):
+        global _unlock_count
+        unlock(self)
+        _unlock_count += 1
+        try:
+            self._cache.clear()
+        except AttributeError:  # object without any cached properties
+            pass
+
+    cls.unlock = unlock_and_clear
+    if not hasattr(cls, '_cacheable'):
+        cls._cacheable = _is_locked
+    return cls
+
+
+class cached_property(object):
+    """A read-only property that is computed once while an object is locked.
+
+    Args:
+        func: A method of the object that computes the value of the property.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        if not (_caching_enabled and obj._cacheable()):
+            return self.func(obj)
+        try:
+            unlock_count, value = obj._cache[self.name]
+            if unlock_count == _unlock_count:
+                return value
+        except KeyError:  # the value has not yet been computed
+            pass
+        value = self.func(obj)
+        obj._cache[self.name] = (_unlock_count, value)
+        return value
+
+
+def _is_locked(obj):
+    """Default check for whether the cached properties of an object can be stored."""
+    return obj._locked
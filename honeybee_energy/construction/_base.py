@@ -4,6 +4,7 @@ from __future__ import division
 
 from ..material.gas import EnergyWindowMaterialGas
 from ..writer import generate_idf_string
+from ..cache import lockable_cache, cached_property
 
 from honeybee._lockable import lockable
 from honeybee.typing import valid_ep_string
@@ -11,6 +12,7 @@ from honeybee.typing import valid_ep_string
 import math
 
 
+@lockable_cache
 @lockable
 class _ConstructionBase(object):
     """Energy construction.
@@ -28,7 +30,7 @@ class _ConstructionBase(object):
     # generic air material used to compute indoor film coefficients.
     _air = EnergyWindowMaterialGas('generic air', gas_type='Air')
 
-    __slots__ = ('_name', '_materials', '_locked')
+    __slots__ = ('_name', '_materials', '_cache', '_locked')
 
     def __init__(self, name, materials):
         """Initialize energy construction.
@@ -39,6 +41,7 @@ class _ConstructionBase(object):
             materials: List of materials in the construction (from outside to inside).
         """
         self._locked = False  # unlocked by default
+        self._cache = {}  # values of cached properties while locked
         self.name = name
         self.materials = materials
 
@@ -64,17 +67,17 @@ class _ConstructionBase(object):
         """
         return list(set(self._materials))
 
-    @property
+    @cached_property
     def r_value(self):
         """R-value of the construction [m2-K/W] (excluding air films)."""
         return sum(tuple(mat.r_value for mat in self.materials))
 
-    @property
+    @cached_property
     def u_value(self):
         """U-value of the construction [W/m2-K] (excluding air films)."""
         return 1 / self.r_value
 
-    @property
+    @cached_property
     def r_factor(self):
         """Construction R-factor [m2-K/W] (including standard resistances for air films).
 
@@ -84,7 +87,7 @@ class _ConstructionBase(object):
         _int_r = 1 / self.in_h_simple()  # interior film
         return self.r_value + _ext_r + _int_r
 
-    @property
+    @cached_property
     def u_factor(self):
         """Construction U-factor [W/m2-K] (including standard resistances for air films).
 
@@ -185,6 +188,10 @@ class _ConstructionBase(object):
         for mat in self.materials:
             mat.unlock()
 
+    def _cacheable(self):
+        """Check whether cached properties can be stored (if everything is locked)."""
+        return self._locked and all(mat._locked for mat in self._materials)
+
     def _temperature_profile_from_r_values(
             self, r_values, outside_temperature=-18, inside_temperature=21):
         """Get a list of temperatures at each material boundary between R-values."""
@@ -5,13 +5,11 @@ from __future__ import division
 from ._base import _ConstructionBase
 from ..material._base import _EnergyMaterialOpaqueBase
 from ..material.opaque import EnergyMaterial, EnergyMaterialNoMass
-from ..reader import parse_idf_string
+from ..reader import parse_idf_string, parse_idf_file, idf_objects_by_type
+from ..cache import cached_property
 
 from honeybee._lockable import lockable
 
-import re
-import os
-
 
 @lockable
 class OpaqueConstruction(_ConstructionBase):
@@ -57,47 +55,47 @@ class OpaqueConstruction(_ConstructionBase):
         assert len(mats) <= 10, 'Opaque Construction cannot have more than 10 materials.'
         self._materials = mats
 
-    @property
+    @cached_property
     def inside_emissivity(self):
         """"The emissivity of the inside face of the construction."""
         return self.materials[-1].thermal_absorptance
 
-    @property
+    @cached_property
     def inside_solar_reflectance(self):
         """"The solar reflectance of the inside face of the construction."""
         return 1 - self.materials[-1].solar_absorptance
 
-    @property
+    @cached_property
     def inside_visible_reflectance(self):
         """"The visible reflectance of the inside face of the construction."""
         return 1 - self.materials[-1].visible_absorptance
 
-    @property
+    @cached_property
     def outside_emissivity(self):
         """"The emissivity of the outside face of the construction."""
         return self.materials[0].thermal_absorptance
 
-    @property
+    @cached_property
     def outside_solar_reflectance(self):
         """"The solar reflectance of the outside face of the construction."""
         return 1 - self.materials[0].solar_absorptance
 
-    @property
+    @cached_property
     def outside_visible_reflectance(self):
         """"The visible reflectance of the outside face of the construction."""
         return 1 - self.materials[0].visible_absorptance
 
-    @property
+    @cached_property
     def mass_area_density(self):
         """The area density of the construction [kg/m2]."""
         return sum(tuple(mat.mass_area_density for mat in self.materials))
 
-    @property
+    @cached_property
     def area_heat_capacity(self):
         """The heat capacity per unit area of the construction [kg/K-m2]."""
         return sum(tuple(mat.area_heat_capacity for mat in self.materials))
 
-    @property
+    @cached_property
     def thickness(self):
         """Thickness of the construction [m]."""
         thickness = 0
@@ -289,7 +287,9 @@ class OpaqueConstruction(_ConstructionBase):
 
         Args:
             idf_file: A path to an IDF file containing objects for opaque
-                constructions and corresponding materials.
+                constructions and corresponding materials. This can also be a
+                dictionary of IDF objects from the reader.parse_idf_file method,
+                which avoids re-reading a file that is used for several imports.
 
         Returns:
             constructions: A list of all OpaqueConstruction objects in the IDF
@@ -297,22 +297,17 @@ class OpaqueConstruction(_ConstructionBase):
             materials: A list of all opaque materials in the IDF file as
                 honeybee_energy EnergyMaterial objects.
         """
-        # check the file
-        assert os.path.isfile(idf_file), 'Cannot find an idf file at {}'.format(idf_file)
-        with open(idf_file, 'r') as ep_file:
-            file_contents = ep_file.read()
+        # parse the file into a dictionary of objects
+        idf_objects = idf_file if isinstance(idf_file, dict) else \
+            parse_idf_file(idf_file)
         # extract all of the opaque material objects
-        mat_pattern1 = re.compile(r"(?i)(Material,[\s\S]*?;)")
-        mat_pattern2 = re.compile(r"(?i)(Material:NoMass,[\s\S]*?;)")
-        mat_pattern3 = re.compile(r"(?i)(Material:AirGap,[\s\S]*?;)")
-        material_str = mat_pattern1.findall(file_contents) + \
-            mat_pattern2.findall(file_contents) + mat_pattern3.findall(file_contents)
+        material_str = idf_objects_by_type(
+            idf_objects, 'Material', 'Material:NoMass', 'Material:AirGap')
         materials_dict = OpaqueConstruction._idf_materials_dictionary(material_str)
         materials = list(materials_dict.values())
         # extract all of the construction objects
-        constr_pattern = re.compile(r"(?i)(Construction,[\s\S]*?;)")
-        constr_props = tuple(parse_idf_string(idf_string) for
-                             idf_string in constr_pattern.findall(file_contents))
+        constr_props = tuple(parse_idf_string(idf_string) for idf_string in
+                             idf_objects_by_type(idf_objects, 'Construction'))
         constructions = []
         for constr in constr_props:
             try:
@@ -10,13 +10,11 @@ from ..material.gas import _EnergyWindowMaterialGasBase, EnergyWindowMaterialGas
     EnergyWindowMaterialGasMixture, EnergyWindowMaterialGasCustom
 from ..material.shade import _EnergyWindowMaterialShadeBase, EnergyWindowMaterialShade, \
     EnergyWindowMaterialBlind
-from ..reader import parse_idf_string
+from ..reader import parse_idf_string, parse_idf_file, idf_objects_by_type
+from ..cache import cached_property
 
 from honeybee._lockable import lockable
 
-import re
-import os
-
 
 @lockable
 class WindowConstruction(_ConstructionBase):
@@ -40,7 +38,9 @@ class WindowConstruction(_ConstructionBase):
         * has_shade
         * shade_location
     """
-    __slots__ = ('_has_shade',)
+    __slots__ = ('_has_shade', '_solutions')
+    # maximum number of solved conditions that are stored on a locked construction
+    _max_solutions = 100
 
     @property
     def materials(self):
@@ -104,36 +104,31 @@ class WindowConstruction(_ConstructionBase):
                 has_shade = True
         self._has_shade = has_shade
         self._materials = mats
+        self._solutions = {}
 
-    @property
+    @cached_property
     def r_factor(self):
         """Construction R-factor [m2-K/W] (including standard resistances for air films).
 
         Formulas for film coefficients come from EN673 / ISO10292.
         """
-        gap_count = self.gap_count
-        if gap_count == 0:  # single pane or simple glazing system
+        if self.gap_count == 0:  # single pane or simple glazing system
             return self.materials[0].r_value + (1 / self.out_h_simple()) + \
                 (1 / self.in_h_simple())
-        r_vals, emissivities = self._layered_r_value_initial(gap_count)
-        r_vals = self._solve_r_values(r_vals, emissivities)
-        return sum(r_vals)
+        return sum(self._standard_r_values)
 
-    @property
+    @cached_property
     def r_value(self):
         """R-value of the construction [m2-K/W] (excluding air films).
 
         Note that shade materials are currently considered impermeable to air within
         the U-value calculation.
         """
-        gap_count = self.gap_count
-        if gap_count == 0:  # single pane or simple glazing system
+        if self.gap_count == 0:  # single pane or simple glazing system
             return self.materials[0].r_value
-        r_vals, emissivities = self._layered_r_value_initial(gap_count)
-        r_vals = self._solve_r_values(r_vals, emissivities)
-        return sum(r_vals[1:-1])
+        return sum(self._standard_r_values[1:-1])
 
-    @property
+    @cached_property
     def inside_emissivity(self):
         """"The emissivity of the inside face of the construction."""
         if isinstance(self.materials[0], EnergyWindowMaterialSimpleGlazSys):
@@ -143,14 +138,14 @@ class WindowConstruction(_ConstructionBase):
         except AttributeError:
             return self.materials[-1].emissivity
 
-    @property
+    @cached_property
     def outside_emissivity(self):
         """"The emissivity of the outside face of the construction."""
         if isinstance(self.materials[0], EnergyWindowMaterialSimpleGlazSys):
             return 0.84
         return self.materials[0].emissivity
 
-    @property
+    @cached_property
     def unshaded_solar_transmittance(self):
         """The unshaded solar transmittance of the window at normal incidence.
 
@@ -166,7 +161,7 @@ class WindowConstruction(_ConstructionBase):
                 trans *= mat.solar_transmittance
         return trans
 
-    @property
+    @cached_property
     def unshaded_visible_transmittance(self):
         """The unshaded visible transmittance of the window at normal incidence.
 
@@ -181,7 +176,7 @@ class WindowConstruction(_ConstructionBase):
                 trans *= mat.visible_transmittance
         return trans
 
-    @property
+    @cached_property
     def thickness(self):
         """Thickness of the construction [m]."""
         thickness = 0
@@ -193,7 +188,7 @@ class WindowConstruction(_ConstructionBase):
                 thickness += mat.slat_width
         return thickness
 
-    @property
+    @cached_property
     def glazing_count(self):
         """The number of glazing materials contained within the window construction."""
         count = 0
@@ -202,7 +197,7 @@ class WindowConstruction(_ConstructionBase):
                 count += 1
         return count
 
-    @property
+    @cached_property
     def gap_count(self):
         """The number of gas gaps contained within the window construction.
 
@@ -272,6 +267,11 @@ class WindowConstruction(_ConstructionBase):
                 The sum of this list is the R-factor for this construction given
                 the input parameters.
         """
+        conditions = (outside_temperature, inside_temperature, wind_speed, height,
+                      angle, pressure)
+        solution = self._stored_solution(conditions)
+        if solution is not None:
+            return list(solution[0]), list(solution[1])
         if angle != 90 and outside_temperature > inside_temperature:
             angle = abs(180 - angle)
         gap_count = self.gap_count
@@ -285,6 +285,7 @@ class WindowConstruction(_ConstructionBase):
                                          in_delta_t, height, angle, pressure)
             temperatures = self._temperature_profile_from_r_values(
                 r_values, outside_temperature, inside_temperature)
+            self._store_solution(conditions, (temperatures, r_values))
             return temperatures, r_values
         # multi-layered window construction
         guess = abs(inside_temperature - outside_temperature) / 2
@@ -292,19 +293,67 @@ class WindowConstruction(_ConstructionBase):
         avg_guess = ((inside_temperature + outside_temperature) / 2) + 273.15
         r_values, emissivities = self._layered_r_value_initial(
             gap_count, guess, avg_guess, wind_speed)
-        r_last = 0
-        r_next = sum(r_values)
-        while abs(r_next - r_last) > 0.001:  # 0.001 is the r-value tolerance
-            r_last = sum(r_values)
-            temperatures = self._temperature_profile_from_r_values(
-                r_values, outside_temperature, inside_temperature)
-            r_values = self._layered_r_value(
-                temperatures, r_values, emissivities, height, angle, pressure)
-            r_next = sum(r_values)
-        temperatures = self._temperature_profile_from_r_values(
-            r_values, outside_temperature, inside_temperature)
+        temperatures, r_values = self._solve_temperature_profile(
+            r_values, emissivities, outside_temperature, inside_temperature,
+            height, angle, pressure)
+        self._store_solution(conditions, (temperatures, r_values))
         return temperatures, r_values
 
+    def temperature_profiles(self, outside_temperatures, inside_temperatures,
+                             wind_speeds=6.7, heights=1.0, angles=90.0,
+                             pressures=101325):
+        """Get temperature profiles across the construction for many sets of conditions.
+
+        This is faster than calling temperature_profile for each set of conditions
+        since conditions that occur more than once are only solved once. Each set
+        of conditions is solved from the same initial guess as temperature_profile
+        so the results match those of temperature_profile and they do not depend
+        on the order of the conditions.
+
+        Each of the inputs can either be a list of values or a single value that
+        applies to all sets of conditions. All lists must have the same length.
+
+        Args:
+            outside_temperatures: Temperatures on the outside of the construction [C].
+            inside_temperatures: Temperatures on the inside of the construction [C].
+            wind_speeds: Average outdoor wind speeds [m/s]. Default is 6.7 m/s.
+            heights: Heights for the surface in meters. Default is 1.0 m.
+            angles: Angles in degrees between 0 and 180. (See temperature_profile).
+                Default is 90 for a vertical surface.
+            pressures: Average pressures in Pa. Default is 101325 Pa.
+
+        Returns:
+            temperatures: A list with a list of temperature values [C] for each
+                set of conditions. (See temperature_profile).
+            r_values: A list with a list of R-values for each of the material
+                layers [m2-K/W] for each set of conditions. The sum of each list
+                is the R-factor for the construction at the conditions.
+        """
+        conditions = self._condition_series(
+            outside_temperatures, inside_temperatures, wind_speeds, heights,
+            angles, pressures)
+        temperatures, r_values = [], []
+        solutions = {}
+        for cond in conditions:
+            try:
+                temps, r_vals = solutions[cond]
+            except KeyError:
+                temps, r_vals = solutions[cond] = self.temperature_profile(*cond)
+            temperatures.append(list(temps))
+            r_values.append(list(r_vals))
+        return temperatures, r_values
+
+    def u_factors(self, outside_temperatures, inside_temperatures, wind_speeds=6.7,
+                  heights=1.0, angles=90.0, pressures=101325):
+        """Get a list of U-factors [W/m2-K] of the construction for many conditions.
+
+        The inputs are the same as those of the temperature_profiles method.
+        """
+        r_values = self.temperature_profiles(
+            outside_temperatures, inside_temperatures, wind_speeds, heights,
+            angles, pressures)[1]
+        return [1 / sum(r_vals) for r_vals in r_values]
+
     @classmethod
     def from_idf(cls, idf_string, ep_mat_strings):
         """Create an WindowConstruction from an EnergyPlus text string.
@@ -496,20 +545,23 @@ class WindowConstruction(_ConstructionBase):
             idf_file: A path to an IDF file containing objects for window
                 constructions and corresponding materials. For example, the
                 IDF Report output by LBNL WINDOW.
+                This can also be a dictionary of IDF objects from the
+                reader.parse_idf_file method, which avoids re-reading a file
+                that is used for several imports.
         """
-        # check the file
-        assert os.path.isfile(idf_file), 'Cannot find an idf file at {}'.format(idf_file)
-        with open(idf_file, 'r') as ep_file:
-            file_contents = ep_file.read()
+        # parse the file into a dictionary of objects
+        idf_objects = idf_file if isinstance(idf_file, dict) else \
+            parse_idf_file(idf_file)
         # extract all material objects
-        mat_pattern = re.compile(r"(?i)(WindowMaterial:[\s\S]*?;)")
-        material_str = mat_pattern.findall(file_contents)
+        material_str = idf_objects_by_type(
+            idf_objects, 'WindowMaterial:SimpleGlazingSystem', 'WindowMaterial:Glazing',
+            'WindowMaterial:Gas', 'WindowMaterial:GasMixture', 'WindowMaterial:Shade',
+            'WindowMaterial:Blind')
         materials_dict = WindowConstruction._idf_materials_dictionary(material_str)
         materials = list(materials_dict.values())
         # extract all of the construction objects
-        constr_pattern = re.compile(r"(?i)(Construction,[\s\S]*?;)")
-        constr_props = tuple(parse_idf_string(idf_string) for
-                             idf_string in constr_pattern.findall(file_contents))
+        constr_props = tuple(parse_idf_string(idf_string) for idf_string in
+                             idf_objects_by_type(idf_objects, 'Construction'))
         constructions = []
         for constr in constr_props:
             try:
@@ -542,6 +594,76 @@ class WindowConstruction(_ConstructionBase):
                 materials_dict[mat_obj.name] = mat_obj
         return materials_dict
 
+    def unlock(self):
+        """The unlock() method will also unlock the materials and clear solutions."""
+        _ConstructionBase.unlock(self)
+        self._solutions = {}
+
+    @cached_property
+    def _standard_r_values(self):
+        """A tuple of the R-values of each layer at the standard conditions of r_factor.
+
+        This is cached on locked constructions so that r_factor, r_value and
+        u_factor all share a single iterative solve.
+        """
+        r_vals, emissivities = self._layered_r_value_initial(self.gap_count)
+        return tuple(self._solve_r_values(r_vals, emissivities))
+
+    def _stored_solution(self, conditions):
+        """Get a stored solution for a set of conditions or None if it is not stored.
+
+        Solutions are stored with the hashes of the materials so that a solution
+        is not used after any of the materials have been edited.
+        """
+        if self._locked and self._solutions:
+            return self._solutions.get((self._materials_key(), conditions))
+        return None
+
+    def _store_solution(self, conditions, solution):
+        """Store the solution for a set of conditions if the construction is locked."""
+        if self._locked:
+            if len(self._solutions) >= self._max_solutions:
+                self._solutions.clear()
+            self._solutions[(self._materials_key(), conditions)] = solution
+
+    def _materials_key(self):
+        """A tuple of the hashes of the materials, which changes if any are edited."""
+        return tuple(hash(mat) for mat in self._materials)
+
+    def _solve_temperature_profile(
+            self, r_values, emissivities, outside_temperature, inside_temperature,
+            height, angle, pressure):
+        """Iteratively solve for the temperatures and R-values of a profile."""
+        r_last = 0
+        r_next = sum(r_values)
+        while abs(r_next - r_last) > 0.001:  # 0.001 is the r-value tolerance
+            r_last = sum(r_values)
+            temperatures = self._temperature_profile_from_r_values(
+                r_values, outside_temperature, inside_temperature)
+            r_values = self._layered_r_value(
+                temperatures, r_values, emissivities, height, angle, pressure)
+            r_next = sum(r_values)
+        temperatures = self._temperature_profile_from_r_values(
+            r_values, outside_temperature, inside_temperature)
+        return temperatures, r_values
+
+    @staticmethod
+    def _condition_series(*values):
+        """Get a list of tuples of conditions from lists and single values."""
+        series = []
+        for val in values:
+            try:
+                series.append(tuple(val))
+            except TypeError:  # a single value for all conditions
+                series.append(None)
+        counts = set(len(vals) for vals in series if vals is not None)
+        assert len(counts) <= 1, 'All lists of conditions must have the same ' \
+            'length. Got lists with lengths {}.'.format(sorted(counts))
+        count = counts.pop() if counts else 1
+        series = [vals if vals is not None else (val,) * count
+                  for vals, val in zip(series, values)]
+        return list(zip(*series))
+
     def _solve_r_values(self, r_vals, emissivities):
         """Iteratively solve for R-values."""
         r_last = 0
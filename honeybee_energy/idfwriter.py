@@ -0,0 +1,237 @@
+# coding=utf-8
+"""Writer of honeybee Models and energy objects to an IDF text stream."""
+from .writer import face_to_idf, room_to_idf, aperture_to_idf, door_to_idf, \
+    shade_to_idf
+from .schedule.ruleset import ScheduleRuleset
+from .properties._identityset import IdentitySet
+
+
+class IDFWriter(object):
+    """Writer of EnergyPlus objects to an open text stream in buffered chunks.
+
+    Each object is written to the stream as soon as the buffer is full instead of
+    assembling the whole IDF as one string in memory. Shared resources (materials,
+    constructions, schedules, type limits, setpoints, etc.) are written only once
+    no matter how many objects reference them. ScheduleDays and week schedules with
+    equivalent values are also shared between ScheduleRulesets in the same way as
+    ScheduleRuleset.to_idf_collective.
+
+    Args:
+        file_object: A text stream open for writing (eg. a file opened with 'w').
+        schedule_directory: An optional path to a folder into which the CSV files
+            of any ScheduleFixedIntervals will be written. If None, the
+            ScheduleFixedIntervals will be written as Schedule:Compact objects
+            within the IDF. Default: None.
+        buffer_size: An integer for the number of IDF objects that are held in
+            memory before they are written to the stream. Default: 1000.
+
+    Properties:
+        * file_object
+        * schedule_directory
+        * buffer_size
+        * object_count
+
+    Usage:
+
+    .. code-block:: python
+
+        with open('in.idf', 'w') as idf_file:
+            writer = IDFWriter(idf_file)
+            writer.write_model(model)
+            writer.flush()
+    """
+    __slots__ = ('_file_object', '_schedule_directory', '_buffer_size', '_buffer',
+                 '_object_count', '_written', '_day_idf_names', '_used_day_names',
+                 '_week_idf_names', '_rule_indices')
+
+    def __init__(self, file_object, schedule_directory=None, buffer_size=1000):
+        self._file_object = file_object
+        self._schedule_directory = schedule_directory
+        self._buffer_size = int(buffer_size)
+        assert self._buffer_size > 0, 'IDFWriter buffer_size must be greater ' \
+            'than 0. Got {}.'.format(self._buffer_size)
+        self._buffer = []
+        self._object_count = 0
+        self._written = IdentitySet()  # resources that have already been written
+        self._day_idf_names = {}
+        self._used_day_names = set()
+        self._week_idf_names = {}
+        self._rule_indices = {}
+
+    @property
+    def file_object(self):
+        """Get the text stream to which the IDF objects are written."""
+        return self._file_object
+
+    @property
+    def schedule_directory(self):
+        """Get the folder to which ScheduleFixedInterval CSVs are written (or None)."""
+        return self._schedule_directory
+
+    @property
+    def buffer_size(self):
+        """Get the number of IDF objects held in memory before they are written."""
+        return self._buffer_size
+
+    @property
+    def object_count(self):
+        """Get the number of IDF objects written so far (including the buffer)."""
+        return self._object_count
+
+    def write(self, idf_string):
+        """Write the IDF string of a single object to the stream.
+
+        Args:
+            idf_string: Text for a complete EnergyPlus object.
+        """
+        self._buffer.append(idf_string)
+        self._object_count += 1
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered IDF objects to the stream."""
+        if self._buffer:
+            self._file_object.write('\n\n'.join(self._buffer) + '\n\n')
+            self._buffer = []
+
+    def write_material(self, material):
+        """Write a material to the stream if it has not already been written."""
+        if self._written.add(material):
+            self.write(material.to_idf())
+
+    def write_construction(self, construction):
+        """Write an Opaque or WindowConstruction and its materials if not yet written.
+        """
+        if self._written.add(construction):
+            for mat in construction.unique_materials:
+                self.write_material(mat)
+            self.write(construction.to_idf())
+
+    def write_schedule_type_limit(self, type_limit):
+        """Write a ScheduleTypeLimit to the stream if it has not already been written.
+        """
+        if type_limit is not None and self._written.add(type_limit):
+            self.write(type_limit.to_idf())
+
+    def write_schedule(self, schedule):
+        """Write a schedule and its type limit to the stream if not already written.
+
+        Args:
+            schedule: A ScheduleRuleset or ScheduleFixedInterval.
+        """
+        if schedule is None or not self._written.add(schedule):
+            return
+        self.write_schedule_type_limit(schedule.schedule_type_limit)
+        if isinstance(schedule, ScheduleRuleset):
+            self._write_schedule_ruleset(schedule)
+        elif self._schedule_directory is not None:
+            self.write(schedule.to_idf(self._schedule_directory))
+        else:
+            self.write(schedule.to_idf_compact())
+
+    def write_room(self, room):
+        """Write a Room with its loads, HVAC and all of its geometry to the stream.
+
+        All of the schedules, constructions and materials referenced by the Room
+        are also written if they have not already been written.
+        """
+        self.write(room_to_idf(room))
+        energy = room.properties.energy
+        zone_name = room.name
+
+        # write the loads of the room
+        for load in (energy.people, energy.lighting, energy.electric_equipment,
+                     energy.gas_equipment, energy.infiltration):
+            if load is not None:
+                for sched in self._load_schedules(load):
+                    self.write_schedule(sched)
+                self.write(load.to_idf(zone_name))
+        ventilation = energy.ventilation
+        if ventilation is not None and self._written.add(ventilation):
+            self.write_schedule(ventilation.schedule)
+            self.write(ventilation.to_idf())
+        setpoint = energy.setpoint
+        if setpoint is not None:
+            for sched in (setpoint.heating_schedule, setpoint.cooling_schedule,
+                          setpoint.humidifying_schedule,
+                          setpoint.dehumidifying_schedule):
+                self.write_schedule(sched)
+            if self._written.add(setpoint):
+                self.write(setpoint.to_idf())
+            humidistat = setpoint.to_idf_humidistat(zone_name)
+            if humidistat is not None:
+                self.write(humidistat)
+            if energy.hvac is not None:
+                self.write(energy.hvac.to_idf())
+
+        # write the geometry of the room
+        for shade in room.shades:
+            self.write_shade(shade)
+        for face in room.faces:
+            self.write_face(face)
+
+    def write_face(self, face):
+        """Write a Face with its Apertures, Doors, Shades and constructions."""
+        self.write_construction(face.properties.energy.construction)
+        self.write(face_to_idf(face))
+        for shade in face.shades:
+            self.write_shade(shade)
+        for aperture in face.apertures:
+            self.write_construction(aperture.properties.energy.construction)
+            self.write(aperture_to_idf(aperture))
+            for shade in aperture.shades:
+                self.write_shade(shade)
+        for door in face.doors:
+            self.write_construction(door.properties.energy.construction)
+            self.write(door_to_idf(door))
+
+    def write_shade(self, shade):
+        """Write a Shade with its transmittance schedule and ShadeConstruction."""
+        energy = shade.properties.energy
+        self.write_schedule(energy.transmittance_schedule)
+        self.write(shade_to_idf(shade))
+        constr = energy.construction
+        if not constr.is_default:
+            if constr.is_specular and self._written.add(constr):
+                self.write_construction(constr.glazing_construction())
+            self.write(constr.to_idf(shade.name))
+
+    def write_model(self, model):
+        """Write all Rooms and orphaned Shades of a Model to the stream.
+
+        Note that orphaned Faces, Apertures and Doors are not written since they
+        do not belong to any EnergyPlus zone.
+        """
+        for room in model.rooms:
+            self.write_room(room)
+        for shade in model.orphaned_shades:
+            self.write_shade(shade)
+
+    def _write_schedule_ruleset(self, schedule):
+        """Write a ScheduleRuleset, sharing equivalent days and weeks."""
+        if not schedule.is_constant:
+            for day_idf in ScheduleRuleset._idf_shared_day_schedules(
+                    schedule.day_schedules, self._day_idf_names, self._used_day_names):
+                self.write(day_idf)
+        year_schedule, week_schedules = schedule._to_idf(
+            self._day_idf_names, self._week_idf_names, self._rule_indices)
+        if week_schedules is not None:
+            for week_schedule in week_schedules:
+                self.write(week_schedule)
+        self.write(year_schedule)
+
+    @staticmethod
+    def _load_schedules(load):
+        """Get a tuple of the schedules referenced by a load object."""
+        try:
+            return (load.occupancy_schedule, load.activity_schedule)
+        except AttributeError:  # not a People object
+            return (load.schedule,)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'IDFWriter: [objects: {}]'.format(self._object_count)
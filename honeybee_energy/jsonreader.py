@@ -0,0 +1,141 @@
+# coding=utf-8
+"""Methods to read Models with energy properties from JSON files as a stream."""
+from honeybee.model import Model
+from honeybee.room import Room
+from honeybee.face import Face
+from honeybee.shade import Shade
+from honeybee.aperture import Aperture
+from honeybee.door import Door
+
+from ._jsonstream import JSONStream
+from .properties.model import _ModelResourceLoader
+
+import io
+
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass   # python 3
+
+
+def model_from_json(file_path, chunk_size=65536):
+    """Create a Model with energy properties from a JSON file without loading it all.
+
+    The file is read as a stream and the energy resources (materials, constructions,
+    schedules, etc.) are created as soon as the resources they depend on exist.
+    Each Room and orphaned object is created and given its energy properties as
+    soon as it is read, after which its dictionary is discarded. So only the
+    dictionary of one Room is held in memory at a time, which allows Models
+    that are much larger than the available memory as a dictionary to be loaded.
+
+    Note that only the energy properties of the Model are loaded. The properties
+    of any other honeybee extensions in the file are ignored.
+
+    Args:
+        file_path: Path to a JSON file of a honeybee Model dictionary.
+        chunk_size: An integer for the minimum number of characters read from
+            the file at once. Default: 65536.
+
+    Returns:
+        A honeybee Model object.
+    """
+    name = display_name = None
+    north_angle = 0
+    geometry = {'rooms': [], 'orphaned_faces': [], 'orphaned_shades': [],
+                'orphaned_apertures': [], 'orphaned_doors': []}
+    geometry_classes = {'rooms': Room, 'orphaned_faces': Face,
+                        'orphaned_shades': Shade, 'orphaned_apertures': Aperture,
+                        'orphaned_doors': Door}
+    resources = None
+    pending = []  # objects with energy properties read before the resources
+
+    with io.open(file_path, 'r', encoding='utf-8') as inf:
+        stream = JSONStream(inf, chunk_size)
+        for key in stream.iter_object():
+            if key == 'type':
+                model_type = stream.read_value()
+                assert model_type == 'Model', \
+                    'Expected Model dictionary. Got {}.'.format(model_type)
+            elif key == 'name':
+                name = stream.read_value()
+            elif key == 'display_name':
+                display_name = stream.read_value()
+            elif key == 'north_angle':
+                north_angle = stream.read_value()
+            elif key == 'properties':
+                for prop_key in stream.iter_object():
+                    if prop_key == 'energy':
+                        resources = _load_resources(stream)
+                if resources is not None:
+                    for obj, e_dict in pending:
+                        _apply_energy_properties(obj, e_dict, resources)
+                pending = None
+            elif key in geometry:
+                geo_class = geometry_classes[key]
+                for obj_dict in stream.iter_array():
+                    obj = geo_class.from_dict(obj_dict)
+                    for sub_obj, e_dict in _energy_dicts(obj, obj_dict):
+                        if resources is not None:
+                            _apply_energy_properties(sub_obj, e_dict, resources)
+                        elif pending is not None:
+                            pending.append((sub_obj, e_dict))
+                    geometry[key].append(obj)
+
+    model = Model(name, geometry['rooms'], geometry['orphaned_faces'],
+                  geometry['orphaned_shades'], geometry['orphaned_apertures'],
+                  geometry['orphaned_doors'], north_angle)
+    assert model.display_name == model.name, \
+        'Model name "{}" has invalid characters."'.format(name)
+    if display_name is not None:
+        model._display_name = display_name
+    return model
+
+
+def _load_resources(stream):
+    """Load all resources from the ModelEnergyProperties object next in a JSONStream.
+    """
+    resources = _ModelResourceLoader()
+    for key in stream.iter_object():
+        if key in resources.RESOURCE_TYPES:
+            for res_dict in stream.iter_array():
+                resources.add(key, res_dict)
+            resources.finish(key)
+    resources.finish_all()
+    return resources
+
+
+def _energy_dicts(obj, obj_dict):
+    """Yield each geometry object within a honeybee object with its energy dictionary.
+
+    Args:
+        obj: A honeybee Room, Face, Shade, Aperture or Door.
+        obj_dict: The dictionary from which the object was created.
+    """
+    e_dict = obj_dict['properties'].get('energy')
+    if e_dict is not None:
+        yield obj, e_dict
+    for key in ('faces', 'apertures', 'doors', 'outdoor_shades', 'indoor_shades'):
+        if key in obj_dict and obj_dict[key] is not None:
+            for sub_obj, sub_dict in zip(getattr(obj, key), obj_dict[key]):
+                for pair in _energy_dicts(sub_obj, sub_dict):
+                    yield pair
+
+
+def _apply_energy_properties(obj, e_dict, resources):
+    """Apply an abridged energy property dictionary to a honeybee geometry object.
+
+    Args:
+        obj: A honeybee Room, Face, Shade, Aperture or Door.
+        e_dict: The abridged energy property dictionary of the object.
+        resources: A _ModelResourceLoader with all of the resources of the Model.
+    """
+    if isinstance(obj, Room):
+        obj.properties.energy.apply_properties_from_dict(
+            e_dict, resources.construction_sets, resources.program_types,
+            resources.schedules)
+    elif isinstance(obj, Shade):
+        obj.properties.energy.apply_properties_from_dict(
+            e_dict, resources.constructions, resources.schedules)
+    else:
+        obj.properties.energy.apply_properties_from_dict(
+            e_dict, resources.constructions)
@@ -0,0 +1,126 @@
+"""Dictionary-like registry that builds library objects only when they are requested."""
+
+
+class LazyLibrary(object):
+    """Registry of library objects that are built on demand and then memoized.
+
+    The registry only stores a cheap index of object names to the source data
+    (eg. IDF strings or abridged dictionaries) that describe each object. An object
+    is only built (and locked) the first time that it is requested by name, at which
+    point any of its dependencies are requested from other registries.
+
+    Args:
+        builder: A function that accepts the source data of a single object and
+            returns the built honeybee object. The function should raise a
+            KeyError or ValueError if one of the object's dependencies cannot
+            be found.
+        lock: Boolean to note whether objects should be locked after they are
+            built. Default: True.
+
+    Properties:
+        * names
+    """
+    __slots__ = ('_builder', '_lock', '_names', '_sources', '_objects')
+
+    def __init__(self, builder, lock=True):
+        self._builder = builder
+        self._lock = lock
+        self._names = []  # list of names to preserve the order of the library files
+        self._sources = {}  # dictionary of names and data to build each object
+        self._objects = {}  # dictionary of objects that have already been built
+
+    @property
+    def names(self):
+        """Get a tuple of the names of all objects in the library."""
+        return tuple(self._names)
+
+    def add_source(self, name, source):
+        """Add the source data of an object to the library without building it.
+
+        If an object with the same name already exists in the library, it will
+        be overwritten.
+
+        Args:
+            name: Text for the name of the object.
+            source: The data to be passed to the builder function in order to
+                build the object.
+        """
+        if name not in self._sources and name not in self._objects:
+            self._names.append(name)
+        self._objects.pop(name, None)
+        self._sources[name] = source
+
+    def keys(self):
+        """Get a tuple of the names of all objects in the library."""
+        return self.names
+
+    def values(self):
+        """Get a list of all objects in the library, building any unbuilt ones."""
+        return [obj for name, obj in self.items()]
+
+    def items(self):
+        """Get a list of (name, object) tuples, building any unbuilt objects."""
+        all_items = []
+        for name in self.names:
+            try:
+                all_items.append((name, self[name]))
+            except KeyError:
+                pass  # failed to find a dependency of the object
+        return all_items
+
+    def get(self, name, default=None):
+        """Get an object by name or the default if it is not found in the library."""
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def _build(self, name):
+        """Build an object from its source data and memoize it."""
+        if name not in self._sources:
+            raise KeyError(name)
+        try:
+            obj = self._builder(self._sources[name])
+        except (KeyError, ValueError):  # failed to find a dependency of the object
+            self._remove(name)
+            raise KeyError(name)
+        if self._lock:
+            obj.lock()
+        self._objects[name] = obj
+        del self._sources[name]
+        return obj
+
+    def _remove(self, name):
+        """Remove an object from the library."""
+        self._sources.pop(name, None)
+        self._objects.pop(name, None)
+        self._names.remove(name)
+
+    def __getitem__(self, name):
+        try:
+            return self._objects[name]
+        except KeyError:
+            return self._build(name)
+
+    def __setitem__(self, name, obj):
+        if name not in self._sources and name not in self._objects:
+            self._names.append(name)
+        self._sources.pop(name, None)
+        self._objects[name] = obj
+
+    def __contains__(self, name):
+        return name in self._objects or name in self._sources
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'LazyLibrary: [{} objects, {} built]'.format(
+            len(self._names), len(self._objects))
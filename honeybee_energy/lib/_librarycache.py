@@ -0,0 +1,150 @@
+"""Versioned on-disk cache of the indexed standards library files."""
+import os
+import sys
+import stat
+import json
+import hashlib
+try:
+    import cPickle as pickle  # python 2
+except ImportError:
+    import pickle  # python 3
+
+
+# increment this whenever the structure of any of the cached library indices changes
+CACHE_VERSION = 1
+
+
+def user_cache_folder():
+    """Get the path to the per-user folder in which library caches are written.
+
+    Caches are not written into the installed package since it is often in a
+    shared or read-only location. Each installation of the package gets its own
+    sub-folder so that different environments do not overwrite each other's caches.
+    """
+    if os.name == 'nt':
+        base_folder = os.environ.get('LOCALAPPDATA') or \
+            os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+    else:
+        base_folder = os.environ.get('XDG_CACHE_HOME') or \
+            os.path.join(os.path.expanduser('~'), '.cache')
+    install_id = hashlib.md5(
+        os.path.abspath(os.path.dirname(__file__)).encode('utf-8')).hexdigest()
+    return os.path.join(base_folder, 'honeybee_energy', 'library', install_id[:12])
+
+
+# folder in which all of the library caches are written
+CACHE_FOLDER = user_cache_folder()
+
+
+def _is_private(path):
+    """Check that a cache file or folder can only be written by the current user.
+
+    Cache files are unpickled and so they must not be loaded from a location where
+    other users could have replaced them. This check is skipped on platforms that
+    do not have POSIX file ownership (eg. Windows), where the per-user cache folder
+    is already private to the user.
+    """
+    try:
+        uid = os.getuid()
+    except AttributeError:  # not a POSIX platform
+        return True
+    path_stat = os.stat(path)
+    return path_stat.st_uid == uid and \
+        not path_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def library_files(library_folder, extension):
+    """Get a sorted list of paths to all of the library files in a folder.
+
+    Files are sorted by name such that objects in user_library files overwrite
+    any objects with the same name in the default files.
+
+    Args:
+        library_folder: Path to a folder within the library.
+        extension: Text for the file extension of the library files (eg. '.idf').
+    """
+    file_paths = []
+    for f in sorted(os.listdir(library_folder)):
+        f_path = os.path.join(library_folder, f)
+        if os.path.isfile(f_path) and f_path.endswith(extension):
+            file_paths.append(f_path)
+    return file_paths
+
+
+def library_digest(file_paths):
+    """Get a hash of the names and contents of a list of library files."""
+    md5 = hashlib.md5()
+    for f_path in file_paths:
+        md5.update(os.path.basename(f_path).encode('utf-8'))
+        with open(f_path, 'rb') as lib_file:
+            md5.update(lib_file.read())
+    return md5.hexdigest()
+
+
+def index_json_files(file_paths):
+    """Get a list of (name, dictionary) tuples for all objects in JSON library files.
+
+    Args:
+        file_paths: A list of paths to JSON files, each of which contains a
+            dictionary of abridged object dictionaries.
+    """
+    json_index = []
+    for f_path in file_paths:
+        with open(f_path, 'r') as json_file:
+            file_contents = json_file.read()
+        obj_dict = json.loads(file_contents)
+        for obj_name in obj_dict:
+            json_index.append((obj_dict[obj_name]['name'], obj_dict[obj_name]))
+    return json_index
+
+
+def load_cached_index(cache_name, file_paths, index_function):
+    """Get the index of a set of library files, using the on-disk cache when it's fresh.
+
+    The cache is keyed by the CACHE_VERSION, the Python major version and a hash
+    of the library files. So it is automatically rebuilt whenever any of the files
+    change (eg. when objects are pasted into a user_library file). The cache is
+    only loaded if its file and folder can only be written by the current user.
+    If the cache folder is not writable, the index is simply rebuilt on each import.
+
+    Args:
+        cache_name: Text for the name of the cache file (eg. 'constructions').
+        file_paths: A list of paths to the library files to be indexed.
+        index_function: A function that accepts the list of file_paths and returns
+            the index as a picklable object.
+
+    Returns:
+        The index returned by index_function (either loaded from the cache or
+        freshly computed).
+    """
+    cache_key = (CACHE_VERSION, sys.version_info[0], library_digest(file_paths))
+    cache_file = os.path.join(CACHE_FOLDER, '{}.pickle'.format(cache_name))
+
+    # try to load the index from the cache
+    try:
+        if _is_private(CACHE_FOLDER) and _is_private(cache_file):
+            with open(cache_file, 'rb') as pkl_file:
+                cached_key, index = pickle.load(pkl_file)
+            if cached_key == cache_key:
+                return index
+    except Exception:  # cache is missing, corrupt or from an incompatible version
+        pass
+
+    # rebuild the index and try to write it to the cache
+    index = index_function(file_paths)
+    temp_file = '{}.{}.tmp'.format(cache_file, os.getpid())
+    try:
+        if not os.path.isdir(CACHE_FOLDER):
+            os.makedirs(CACHE_FOLDER, 0o700)
+        with open(temp_file, 'wb') as pkl_file:
+            pickle.dump((cache_key, index), pkl_file, 2)
+        os.chmod(temp_file, 0o600)
+        try:
+            os.replace(temp_file, cache_file)
+        except AttributeError:  # python 2
+            if os.path.isfile(cache_file):
+                os.remove(cache_file)
+            os.rename(temp_file, cache_file)
+    except (IOError, OSError):
+        pass  # the library folder is not writable
+    return index
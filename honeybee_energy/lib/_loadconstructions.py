@@ -1,34 +1,77 @@
 """Load all materials and constructions from the IDF libraries."""
 from honeybee_energy.construction.opaque import OpaqueConstruction
 from honeybee_energy.construction.window import WindowConstruction
+from honeybee_energy.reader import parse_idf_file, parse_idf_string, \
+    idf_objects_by_type
+
+from ._lazylibrary import LazyLibrary
+from ._librarycache import library_files, load_cached_index
 
 import os
 
 
-# empty dictionaries to hold idf-loaded materials and constructions
-_idf_opaque_materials = {}
-_idf_window_materials = {}
-_idf_opaque_constructions = {}
-_idf_window_constructions = {}
+def _build_opaque_material(idf_string):
+    """Build an opaque material from its IDF string."""
+    return list(OpaqueConstruction._idf_materials_dictionary([idf_string]).values())[0]
+
+
+def _build_window_material(idf_string):
+    """Build a window material from its IDF string."""
+    return list(WindowConstruction._idf_materials_dictionary([idf_string]).values())[0]
+
+
+def _build_opaque_construction(ep_fields):
+    """Build an opaque construction from its parsed IDF fields."""
+    return OpaqueConstruction(
+        ep_fields[0], [_idf_opaque_materials[mat] for mat in ep_fields[1:]])
+
+
+def _build_window_construction(ep_fields):
+    """Build a window construction from its parsed IDF fields."""
+    return WindowConstruction(
+        ep_fields[0], [_idf_window_materials[mat] for mat in ep_fields[1:]])
+
+
+def _index_construction_files(file_paths):
+    """Get lists of (name, source) tuples for all materials and constructions."""
+    opaque_mats, window_mats, opaque_constrs, window_constrs = [], [], [], []
+    opaque_names, window_names = set(), set()
+    for f_path in file_paths:
+        idf_objects = parse_idf_file(f_path)  # read the file only once
+        for mat_str in idf_objects_by_type(idf_objects, 'Material', 'Material:NoMass'):
+            opaque_mats.append((parse_idf_string(mat_str)[0], mat_str))
+            opaque_names.add(opaque_mats[-1][0])
+        for mat_str in idf_objects_by_type(
+                idf_objects, 'WindowMaterial:SimpleGlazingSystem',
+                'WindowMaterial:Glazing', 'WindowMaterial:Gas',
+                'WindowMaterial:GasMixture', 'WindowMaterial:Shade',
+                'WindowMaterial:Blind'):
+            window_mats.append((parse_idf_string(mat_str)[0], mat_str))
+            window_names.add(window_mats[-1][0])
+        for constr_str in idf_objects_by_type(idf_objects, 'Construction'):
+            constr = parse_idf_string(constr_str)
+            if all(mat in opaque_names for mat in constr[1:]):
+                opaque_constrs.append((constr[0], constr))
+            elif all(mat in window_names for mat in constr[1:]):
+                window_constrs.append((constr[0], constr))
+    return opaque_mats, window_mats, opaque_constrs, window_constrs
+
+
+# empty libraries to hold idf-loaded materials and constructions
+# objects are only built and locked when they are first requested by name
+_idf_opaque_materials = LazyLibrary(_build_opaque_material)
+_idf_window_materials = LazyLibrary(_build_window_material)
+_idf_opaque_constructions = LazyLibrary(_build_opaque_construction)
+_idf_window_constructions = LazyLibrary(_build_window_construction)
 
 
-# load materials and constructions from the default and user-supplied files
+# index materials and constructions from the default and user-supplied files
 cur_dir = os.path.dirname(__file__)
 construction_lib = os.path.join(cur_dir, 'library', 'constructions')
-for f in os.listdir(construction_lib):
-    f_path = os.path.join(construction_lib, f)
-    if os.path.isfile(f_path) and f_path.endswith('.idf'):
-        constructions, materials = OpaqueConstruction.extract_all_from_idf_file(f_path)
-        for mat in materials:
-            mat.lock()
-            _idf_opaque_materials[mat.name] = mat
-        for cnstr in constructions:
-            cnstr.lock()
-            _idf_opaque_constructions[cnstr.name] = cnstr
-        constructions, materials = WindowConstruction.extract_all_from_idf_file(f_path)
-        for mat in materials:
-            mat.lock()
-            _idf_window_materials[mat.name] = mat
-        for cnstr in constructions:
-            cnstr.lock()
-            _idf_window_constructions[cnstr.name] = cnstr
+_construction_index = load_cached_index(
+    'constructions', library_files(construction_lib, '.idf'), _index_construction_files)
+for library, lib_index in zip(
+        (_idf_opaque_materials, _idf_window_materials,
+         _idf_opaque_constructions, _idf_window_constructions), _construction_index):
+    for obj_name, obj_source in lib_index:
+        library.add_source(obj_name, obj_source)
@@ -1,33 +1,40 @@
 """Load all construction sets from the JSON libraries."""
 from honeybee_energy.constructionset import ConstructionSet
 
+from ._lazylibrary import LazyLibrary
+from ._librarycache import library_files, index_json_files, load_cached_index
 from ._loadconstructions import _idf_opaque_constructions, _idf_window_constructions
 
 import os
-import json
 
 
-# empty dictionaries to hold json-loaded construction sets
-_idf_constructions = _idf_opaque_constructions.copy()  # start with opaque constructions
-_idf_constructions.update(_idf_window_constructions)  # add window constructions
+class _ConstructionLibrary(object):
+    """Look up opaque and window constructions by name without building all of them."""
+    __slots__ = ()
 
-_json_construction_sets = {}
+    def __getitem__(self, construction_name):
+        try:
+            return _idf_opaque_constructions[construction_name]
+        except KeyError:
+            return _idf_window_constructions[construction_name]
 
 
-# load construction sets from the default and user-supplied files
+_idf_constructions = _ConstructionLibrary()
+
+
+def _build_construction_set(data):
+    """Build a construction set from its abridged dictionary."""
+    return ConstructionSet.from_dict_abridged(data, _idf_constructions)
+
+
+# empty library to hold json-loaded construction sets
+# construction sets are only built and locked when they are first requested by name
+_json_construction_sets = LazyLibrary(_build_construction_set)
+
+
+# index construction sets from the default and user-supplied files
 cur_dir = os.path.dirname(__file__)
 constr_lib = os.path.join(cur_dir, 'library', 'constructionsets')
-for f in os.listdir(constr_lib):
-    f_path = os.path.join(constr_lib, f)
-    if os.path.isfile(f_path) and f_path.endswith('.json'):
-        with open(f_path, 'r') as json_file:
-            file_contents = json_file.read()
-        c_dict = json.loads(file_contents)
-        for c_name in c_dict:
-            try:
-                constructionset = ConstructionSet.from_dict_abridged(
-                    c_dict[c_name], _idf_constructions)
-                constructionset.lock()
-                _json_construction_sets[constructionset.name] = constructionset
-            except ValueError:
-                pass  # failed to find the construction in the construction library
+for obj_name, obj_dict in load_cached_index(
+        'constructionsets', library_files(constr_lib, '.json'), index_json_files):
+    _json_construction_sets.add_source(obj_name, obj_dict)
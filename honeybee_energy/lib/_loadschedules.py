@@ -1,20 +1,66 @@
 """Load all schedules from the IDF libraries."""
 from honeybee_energy.schedule.ruleset import ScheduleRuleset
+from honeybee_energy.reader import parse_idf_file, parse_idf_string, \
+    idf_objects_by_type
+
+from ._lazylibrary import LazyLibrary
+from ._loadtypelimits import _idf_schedule_type_limits
+from ._librarycache import library_files, load_cached_index
 
 import os
 
 
-# empty dictionaries to hold idf-loaded schedules
-_idf_schedules = {}
+# dictionaries of the IDF strings of the schedule components
+_idf_week_strings = {}
+_idf_day_strings = {}
+
+
+def _build_schedule(idf_string):
+    """Build a ScheduleRuleset from the IDF string of a Schedule:Year or Constant."""
+    ep_fields = parse_idf_string(idf_string)
+    schedule_type = _idf_schedule_type_limits[ep_fields[1]] \
+        if ep_fields[1] != '' else None
+    if idf_string.startswith('Schedule:Constant,'):
+        sched_val = float(ep_fields[2]) if ep_fields[2] != '' else 0
+        return ScheduleRuleset.from_constant_value(ep_fields[0], sched_val, schedule_type)
+    # gather the week and day schedules that are referenced by the year schedule
+    week_strs = [_idf_week_strings[ep_fields[i]] for i in range(2, len(ep_fields), 5)]
+    day_names = set(fld for wk_str in week_strs for fld in parse_idf_string(wk_str))
+    day_strs = [_idf_day_strings[name] for name in day_names if name in _idf_day_strings]
+    schedule = ScheduleRuleset.from_idf(idf_string, week_strs, day_strs)
+    schedule.schedule_type_limit = schedule_type
+    return schedule
+
+
+def _index_schedule_files(file_paths):
+    """Get lists of (name, IDF string) tuples for all days, weeks and schedules."""
+    day_strs, week_strs, sch_strs = [], [], []
+    for f_path in file_paths:
+        idf_objects = parse_idf_file(f_path)
+        for day_str in idf_objects_by_type(
+                idf_objects, 'Schedule:Day:Interval', 'Schedule:Day:Hourly',
+                'Schedule:Day:List'):
+            day_strs.append((parse_idf_string(day_str)[0], day_str))
+        for week_str in idf_objects_by_type(
+                idf_objects, 'Schedule:Week:Daily', 'Schedule:Week:Compact'):
+            week_strs.append((parse_idf_string(week_str)[0], week_str))
+        for sch_str in idf_objects_by_type(
+                idf_objects, 'Schedule:Year', 'Schedule:Constant'):
+            sch_strs.append((parse_idf_string(sch_str)[0], sch_str))
+    return day_strs, week_strs, sch_strs
+
+
+# empty library to hold idf-loaded schedules
+# schedules are only built and locked when they are first requested by name
+_idf_schedules = LazyLibrary(_build_schedule)
 
 
-# load schedules from the default and user-supplied files
+# index schedules from the default and user-supplied files
 cur_dir = os.path.dirname(__file__)
 schedule_lib = os.path.join(cur_dir, 'library', 'schedules')
-for f in os.listdir(schedule_lib):
-    f_path = os.path.join(schedule_lib, f)
-    if os.path.isfile(f_path) and f_path.endswith('.idf'):
-        schedule_rulesets = ScheduleRuleset.extract_all_from_idf_file(f_path)
-        for sch in schedule_rulesets:
-            sch.lock()
-            _idf_schedules[sch.name] = sch
+_day_index, _week_index, _schedule_index = load_cached_index(
+    'schedules', library_files(schedule_lib, '.idf'), _index_schedule_files)
+_idf_day_strings.update(_day_index)
+_idf_week_strings.update(_week_index)
+for sch_name, sch_str in _schedule_index:
+    _idf_schedules.add_source(sch_name, sch_str)
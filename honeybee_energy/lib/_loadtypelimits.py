@@ -1,19 +1,33 @@
 """Load all schedule type limits from the IDF libraries."""
 from honeybee_energy.schedule.typelimit import ScheduleTypeLimit
+from honeybee_energy.reader import parse_idf_file, parse_idf_string, \
+    idf_objects_by_type
+
+from ._lazylibrary import LazyLibrary
+from ._librarycache import library_files, load_cached_index
 
 import os
 
 
-# empty dictionaries to hold idf-loaded schedules and schedule types
-_idf_schedule_type_limits = {}
+def _index_type_limit_files(file_paths):
+    """Get a list of (name, IDF string) tuples for all schedule type limits."""
+    type_limits = []
+    for f_path in file_paths:
+        idf_objects = parse_idf_file(f_path)
+        for type_str in idf_objects_by_type(idf_objects, 'ScheduleTypeLimits'):
+            type_limits.append((parse_idf_string(type_str)[0], type_str))
+    return type_limits
+
+
+# empty library to hold idf-loaded schedule types
+# schedule types are only built when they are first requested by name
+_idf_schedule_type_limits = LazyLibrary(ScheduleTypeLimit.from_idf, lock=False)
 
 
-# load schedule types from the default and user-supplied files
+# index schedule types from the default and user-supplied files
 cur_dir = os.path.dirname(__file__)
 schedule_lib = os.path.join(cur_dir, 'library', 'schedules')
-for f in os.listdir(schedule_lib):
-    f_path = os.path.join(schedule_lib, f)
-    if os.path.isfile(f_path) and f_path.endswith('.idf'):
-        schedule_type_limits = ScheduleTypeLimit.extract_all_from_idf_file(f_path)
-        for typ in schedule_type_limits:
-            _idf_schedule_type_limits[typ.name] = typ
+for type_name, type_str in load_cached_index(
+        'scheduletypelimits', library_files(schedule_lib, '.idf'),
+        _index_type_limit_files):
+    _idf_schedule_type_limits.add_source(type_name, type_str)
@@ -402,13 +402,15 @@ class Setpoint(_LoadBase):
         object's schedules must also be written.
 
         Also note that this method will return None if no humidity setpoint schedules
-        have been assigned.
+        have been assigned. The name of the humidistat includes the zone name such
+        that one Setpoint can be assigned to several zones.
 
         Args:
             zone_name: Text for the zone name that the Setpoint object is assigned to.
         """
         if self.humidifying_schedule is not None:
-            values = (self.name, zone_name, self.humidifying_schedule.name,
+            values = ('{}..{}'.format(self.name, zone_name), zone_name,
+                      self.humidifying_schedule.name,
                       self.dehumidifying_schedule.name)
             comments = ('name', 'zone name', 'humidifying setpoint schedule',
                         'dehumidifying setpoint schedule')
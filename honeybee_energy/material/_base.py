@@ -2,10 +2,13 @@
 """Base energy material."""
 from __future__ import division
 
+from ..cache import lockable_cache
+
 from honeybee._lockable import lockable
 from honeybee.typing import valid_ep_string
 
 
+@lockable_cache
 @lockable
 class _EnergyMaterialBase(object):
     """Base energy material.
@@ -149,15 +149,7 @@ class _EnergyWindowMaterialGasBase(_EnergyMaterialWindowBase):
             pressure: The average pressure of the gas cavity in Pa.
                 Default is 101325 Pa for standard pressure at sea level.
         """
-        rayleigh = self.rayleigh(delta_t, t_kelvin, pressure)
-        if rayleigh > 50000:
-            n_u1 = 0.0673838 * (rayleigh ** (1 / 3))
-        elif rayleigh > 10000:
-            n_u1 = 0.028154 * (rayleigh ** 0.4134)
-        else:
-            n_u1 = 1 + 1.7596678e-10 * (rayleigh ** 2.2984755)
-        n_u2 = 0.242 * ((rayleigh * (self.thickness / height)) ** 0.272)
-        return max(n_u1, n_u2)
+        return self._nusselt_vertical(self.rayleigh(delta_t, t_kelvin, pressure), height)
 
     def nusselt_at_angle(self, delta_t=15, height=1.0, angle=90,
                          t_kelvin=273.15, pressure=101325):
@@ -193,12 +185,12 @@ class _EnergyWindowMaterialGasBase(_EnergyMaterialWindowBase):
             n_u1 = (1 + (((0.0936 * (rayleigh ** 0.314)) / (1 + g)) ** 7)) ** (1 / 7)
             n_u2 = (0.104 + (0.175 / (self.thickness / height))) * (rayleigh ** 0.283)
             n_u_60 = max(n_u1, n_u2)
-            n_u_90 = self.nusselt(delta_t, height, t_kelvin, pressure)
+            n_u_90 = self._nusselt_vertical(rayleigh, height)
             return (n_u_60 + n_u_90) / 2
         elif angle == 90:
-            return self.nusselt(delta_t, height, t_kelvin, pressure)
+            return self._nusselt_vertical(rayleigh, height)
         else:
-            n_u_90 = self.nusselt(delta_t, height, t_kelvin, pressure)
+            n_u_90 = self._nusselt_vertical(rayleigh, height)
             return 1 + ((n_u_90 - 1) * math.sin(math.radians(angle)))
 
     def convective_conductance(self, delta_t=15, height=1.0,
@@ -303,6 +295,17 @@ class _EnergyWindowMaterialGasBase(_EnergyMaterialWindowBase):
             delta_t, height, angle, t_kelvin, pressure) + \
             self.radiative_conductance(emissivity_1, emissivity_2, t_kelvin)
 
+    def _nusselt_vertical(self, rayleigh, height):
+        """Get the Nusselt number for a vertical cavity from its Rayleigh number."""
+        if rayleigh > 50000:
+            n_u1 = 0.0673838 * (rayleigh ** (1 / 3))
+        elif rayleigh > 10000:
+            n_u1 = 0.028154 * (rayleigh ** 0.4134)
+        else:
+            n_u1 = 1 + 1.7596678e-10 * (rayleigh ** 2.2984755)
+        n_u2 = 0.242 * ((rayleigh * (self.thickness / height)) ** 0.272)
+        return max(n_u1, n_u2)
+
 
 @lockable
 class EnergyWindowMaterialGas(_EnergyWindowMaterialGasBase):
@@ -425,9 +428,8 @@ class EnergyWindowMaterialGas(_EnergyWindowMaterialGasBase):
 
     def _coeff_property(self, dictionary, t_kelvin):
         """Get a property given a dictionary of coefficients and kelvin temperature."""
-        return dictionary[self._gas_type][0] + \
-            dictionary[self._gas_type][1] * t_kelvin + \
-            dictionary[self._gas_type][2] * t_kelvin ** 2
+        coeff_a, coeff_b, coeff_c = dictionary[self._gas_type]
+        return coeff_a + coeff_b * t_kelvin + coeff_c * t_kelvin ** 2
 
     def __key(self):
         """A tuple based on the object properties, useful for hashing."""
@@ -466,7 +468,7 @@ class EnergyWindowMaterialGasMixture(_EnergyWindowMaterialGasBase):
         density
         prandtl
     """
-    __slots__ = ('_gas_count', '_gas_types', '_gas_fractions')
+    __slots__ = ('_gas_count', '_gas_types', '_gas_fractions', '_mixture_coeffs')
 
     def __init__(self, name, thickness=0.0125,
                  gas_types=('Argon', 'Air'), gas_fractions=(0.9, 0.1)):
@@ -508,6 +510,8 @@ class EnergyWindowMaterialGasMixture(_EnergyWindowMaterialGasBase):
         for gas in self._gas_types:
             assert gas in self.GASES, 'Invalid input "{}" for gas type.' \
                 '\nGas type must be one of the following:{}'.format(gas, self.GASES)
+        if getattr(self, '_gas_fractions', None) is not None:
+            self._mixture_coeffs = self._mixture_coefficients()
 
     @property
     def gas_fractions(self):
@@ -520,6 +524,7 @@ class EnergyWindowMaterialGasMixture(_EnergyWindowMaterialGasBase):
             g_fracs, self._gas_count, float, 'gas mixture gas_fractions')
         assert sum(self._gas_fractions) == 1, 'Gas fractions must sum to 1. ' \
             'Got {}.'.format(sum(self._gas_fractions))
+        self._mixture_coeffs = self._mixture_coefficients()
 
     @property
     def molecular_weight(self):
@@ -534,15 +539,18 @@ class EnergyWindowMaterialGasMixture(_EnergyWindowMaterialGasBase):
 
     def conductivity_at_temperature(self, t_kelvin):
         """Get the conductivity of the gas [W/m-K] at a given Kelvin temperature."""
-        return self._weighted_avg_coeff_property(self.CONDUCTIVITYCURVES, t_kelvin)
+        coeff_a, coeff_b, coeff_c = self._mixture_coeffs[0]
+        return coeff_a + coeff_b * t_kelvin + coeff_c * t_kelvin ** 2
 
     def viscosity_at_temperature(self, t_kelvin):
         """Get the viscosity of the gas [kg/m-s] at a given Kelvin temperature."""
-        return self._weighted_avg_coeff_property(self.VISCOSITYCURVES, t_kelvin)
+        coeff_a, coeff_b, coeff_c = self._mixture_coeffs[1]
+        return coeff_a + coeff_b * t_kelvin + coeff_c * t_kelvin ** 2
 
     def specific_heat_at_temperature(self, t_kelvin):
         """Get the specific heat of the gas [J/kg-K] at a given Kelvin temperature."""
-        return self._weighted_avg_coeff_property(self.SPECIFICHEATCURVES, t_kelvin)
+        coeff_a, coeff_b, coeff_c = self._mixture_coeffs[2]
+        return coeff_a + coeff_b * t_kelvin + coeff_c * t_kelvin ** 2
 
     @classmethod
     def from_idf(cls, idf_string):
@@ -604,13 +612,23 @@ class EnergyWindowMaterialGasMixture(_EnergyWindowMaterialGasBase):
             'gas_type_fraction': gas_array
         }
 
-    def _weighted_avg_coeff_property(self, dictionary, t_kelvin):
-        """Get a weighted average property given a dictionary of coefficients."""
-        property = []
-        for gas in self._gas_types:
-            property.append(dictionary[gas][0] + dictionary[gas][1] * t_kelvin +
-                            dictionary[gas][2] * t_kelvin ** 2)
-        return sum(tuple(pr * frac for pr, frac in zip(property, self._gas_fractions)))
+    def _mixture_coefficients(self):
+        """Get the coefficients of the conductivity, viscosity and specific heat.
+
+        The weighted average of the property curves of the gases is itself a curve
+        with the weighted average of their coefficients. So the coefficients are
+        computed once when the gases change rather than each time a property is
+        evaluated at a temperature.
+        """
+        return tuple(self._weighted_avg_coeffs(curves) for curves in
+                     (self.CONDUCTIVITYCURVES, self.VISCOSITYCURVES,
+                      self.SPECIFICHEATCURVES))
+
+    def _weighted_avg_coeffs(self, dictionary):
+        """Get weighted average coefficients given a dictionary of coefficients."""
+        return tuple(sum(dictionary[gas][i] * frac for gas, frac
+                         in zip(self._gas_types, self._gas_fractions))
+                     for i in range(3))
 
     def __key(self):
         """A tuple based on the object properties, useful for hashing."""
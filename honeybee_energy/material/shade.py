@@ -26,7 +26,8 @@ class _EnergyWindowMaterialShadeBase(_EnergyMaterialWindowBase):
     """Base for all shade material layers."""
     __slots__ = ('_infrared_transmittance', '_emissivity', '_distance_to_glass',
                  '_top_opening_multiplier', '_bottom_opening_multiplier',
-                 '_left_opening_multiplier', '_right_opening_multiplier')
+                 '_left_opening_multiplier', '_right_opening_multiplier', '_gap')
+    LOCATIONS = ('Exterior', 'Interior', 'Between')
 
     def __init__(self, name, infrared_transmittance=0, emissivity=0.9,
                  distance_to_glass=0.05, opening_multiplier=0.5):
@@ -71,6 +72,10 @@ class _EnergyWindowMaterialShadeBase(_EnergyMaterialWindowBase):
     def distance_to_glass(self, dist):
         self._distance_to_glass = float_in_range(
             dist, 0.001, 1.0, 'shade material distance to glass')
+        # air gap between the shade and the glass used to estimate R-values
+        self._gap = EnergyWindowMaterialGas(
+            'Generic Shade Gap', self._distance_to_glass, 'Air')
+        self._gap.lock()
 
     @property
     def top_opening_multiplier(self):
@@ -142,14 +147,12 @@ class _EnergyWindowMaterialShadeBase(_EnergyMaterialWindowBase):
         # TODO: Account for air permeability and side openings in gap u-value.
         # https://bigladdersoftware.com/epx/docs/9-0/engineering-reference/
         # window-heat-balance-calculation.html#solving-for-gap-airflow-and-temperature
-        _gap = EnergyWindowMaterialGas(
-            name='Generic Shade Gap', thickness=self.distance_to_glass, gas_type='Air')
         try:
             _shade_e = self.emissivity_back
         except AttributeError:
             _shade_e = self.emissivity
-        _r_gap = 1 / _gap.u_value_at_angle(delta_t, _shade_e, emissivity,
-                                           height, angle, t_kelvin, pressure)
+        _r_gap = 1 / self._gap.u_value_at_angle(delta_t, _shade_e, emissivity,
+                                                height, angle, t_kelvin, pressure)
         return self.r_value + _r_gap
 
     def r_value_interior(self, delta_t=7.5, emissivity=0.84, height=1.0, angle=90,
@@ -175,11 +178,9 @@ class _EnergyWindowMaterialShadeBase(_EnergyMaterialWindowBase):
         # TODO: Account for air permeability and side openings in gap u-value.
         # https://bigladdersoftware.com/epx/docs/9-0/engineering-reference/
         # window-heat-balance-calculation.html#solving-for-gap-airflow-and-temperature
-        _gap = EnergyWindowMaterialGas(
-            name='Generic Shade Gap', thickness=self.distance_to_glass, gas_type='Air')
         _shade_e = self.emissivity
-        _r_gap = 1 / _gap.u_value_at_angle(delta_t, _shade_e, emissivity,
-                                           height, angle, t_kelvin, pressure)
+        _r_gap = 1 / self._gap.u_value_at_angle(delta_t, _shade_e, emissivity,
+                                                height, angle, t_kelvin, pressure)
         return self.r_value + _r_gap
 
     def r_value_between(self, delta_t=7.5, emissivity_1=0.84, emissivity_2=0.84,
@@ -204,15 +205,74 @@ class _EnergyWindowMaterialShadeBase(_EnergyMaterialWindowBase):
                 Default: 273.15 K (0C).
             pressure: The average air pressure in Pa. Default is 101325 Pa for sea level.
         """
-        _gap = EnergyWindowMaterialGas(
-            name='Generic Shade Gap', thickness=self.distance_to_glass, gas_type='Air')
         _shade_e = self.emissivity
-        _r_gap_1 = 1 / _gap.u_value_at_angle(delta_t, _shade_e, emissivity_1,
-                                             height, angle, t_kelvin, pressure)
-        _r_gap_2 = 1 / _gap.u_value_at_angle(delta_t, _shade_e, emissivity_2,
-                                             height, angle, t_kelvin, pressure)
+        _r_gap_1 = 1 / self._gap.u_value_at_angle(delta_t, _shade_e, emissivity_1,
+                                                  height, angle, t_kelvin, pressure)
+        _r_gap_2 = 1 / self._gap.u_value_at_angle(delta_t, _shade_e, emissivity_2,
+                                                  height, angle, t_kelvin, pressure)
         return self.r_value + _r_gap_1 + _r_gap_2
 
+    def r_values(self, delta_ts, t_kelvins, location='Interior', emissivity_1=0.84,
+                 emissivity_2=0.84, height=1.0, angle=90, pressure=101325):
+        """Get a list of R-values of the shade + air gap for many sets of conditions.
+
+        This gives the same results as calling r_value_exterior, r_value_interior
+        or r_value_between for each set of conditions but the properties of the
+        shade are only looked up once.
+
+        Args:
+            delta_ts: A list of temperature diferences across the air gap [C].
+                This can also be a single value to be used for all t_kelvins.
+            t_kelvins: A list of average temperatures of the gas cavity in Kelvin.
+                This can also be a single value to be used for all delta_ts.
+            location: Text for the location of the shade in the window construction.
+                Must be one of the following: 'Exterior', 'Interior', 'Between'.
+                Default: 'Interior'.
+            emissivity_1: The emissivity of the glazing surface adjacent to the
+                shade. Default is 0.84, which is tyical of clear, uncoated glass.
+            emissivity_2: The emissivity of the glazing surface on the other side
+                of the shade, which is only used when the location is 'Between'.
+                Default is 0.84.
+            height: An optional height for the cavity between the shade and the
+                glass in meters. Default is 1.0.
+            angle: An angle in degrees between 0 and 180. (See r_value_exterior).
+            pressure: The average air pressure in Pa. Default is 101325 Pa for sea level.
+        """
+        assert location in self.LOCATIONS, 'Invalid shade location "{}". Must be ' \
+            'one of the following: {}'.format(location, self.LOCATIONS)
+        delta_ts, t_kelvins = self._value_series(delta_ts), self._value_series(t_kelvins)
+        if len(delta_ts) == 1:
+            delta_ts = delta_ts * len(t_kelvins)
+        elif len(t_kelvins) == 1:
+            t_kelvins = t_kelvins * len(delta_ts)
+        assert len(delta_ts) == len(t_kelvins), 'Length of delta_ts ({}) does not ' \
+            'match that of t_kelvins ({}).'.format(len(delta_ts), len(t_kelvins))
+
+        shade_r, gap_u = self.r_value, self._gap.u_value_at_angle
+        if location == 'Exterior':
+            try:
+                shade_e = self.emissivity_back
+            except AttributeError:
+                shade_e = self.emissivity
+        else:
+            shade_e = self.emissivity
+        if location != 'Between':
+            return [shade_r + 1 / gap_u(d_t, shade_e, emissivity_1, height, angle,
+                                        t_k, pressure)
+                    for d_t, t_k in zip(delta_ts, t_kelvins)]
+        return [shade_r +
+                1 / gap_u(d_t, shade_e, emissivity_1, height, angle, t_k, pressure) +
+                1 / gap_u(d_t, shade_e, emissivity_2, height, angle, t_k, pressure)
+                for d_t, t_k in zip(delta_ts, t_kelvins)]
+
+    @staticmethod
+    def _value_series(values):
+        """Get a tuple from a list of values or a single value."""
+        try:
+            return tuple(values)
+        except TypeError:  # a single value
+            return (values,)
+
 
 @lockable
 class EnergyWindowMaterialShade(_EnergyWindowMaterialShadeBase):
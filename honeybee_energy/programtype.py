@@ -11,6 +11,7 @@ from .load.setpoint import Setpoint
 from .schedule.typelimit import ScheduleTypeLimit
 from .schedule.ruleset import ScheduleRuleset
 from .schedule.fixedinterval import ScheduleFixedInterval
+from .properties._identityset import IdentitySet
 
 from honeybee._lockable import lockable
 from honeybee.typing import valid_ep_string, tuple_with_length
@@ -426,12 +427,10 @@ class ProgramType(object):
         if not abridged:
             schedules = self.schedules_unique
             base['schedules'] = []
-            type_limits = []
+            type_limits = IdentitySet()
             for sched in schedules:
                 base['schedules'].append(sched.to_dict(True))
-                t_lim = sched.schedule_type_limit
-                if t_lim is not None and not self._instance_in_array(t_lim, type_limits):
-                    type_limits.append(t_lim)
+                type_limits.add(sched.schedule_type_limit)
             base['schedule_type_limits'] = \
                 [t_lim.to_dict() for t_lim in list(set(type_limits))]
 
@@ -600,20 +599,6 @@ class ProgramType(object):
         return people, lighting, electric_equipment, gas_equipment, infiltration, \
             ventilation, setpoint
 
-    @staticmethod
-    def _instance_in_array(object_instance, object_array):
-        """Check if a specific object instance is already in an array.
-
-        This can be much faster than  `if object_instance in object_arrary`
-        when you expect to be testing a lot of the same instance of an object for
-        inclusion in an array since the builtin method uses an == operator to
-        test inclusion.
-        """
-        for val in object_array:
-            if val is object_instance:
-                return True
-        return False
-
     def __copy__(self):
         people = self.people.duplicate() if self.people is not None else None
         lighting = self.lighting.duplicate() if self.lighting is not None else None
@@ -0,0 +1,93 @@
+# coding=utf-8
+"""Ordered set of object instances that tests membership by identity."""
+from collections import OrderedDict
+
+
+class IdentitySet(object):
+    """Ordered set of object instances that tests membership with `is` instead of ==.
+
+    Objects are stored under their id() so that adding an object and checking
+    whether it is in the set both take constant time, no matter how expensive the
+    __eq__ and __hash__ methods of the objects are. The set keeps a reference to
+    each object so that the id() of the object cannot be re-used while it is
+    in the set. Objects are iterated in the order that they were first added
+    and the set counts how many times each object has been added.
+
+    Args:
+        objects: An optional iterable of objects to be added to the set.
+            None values will be ignored. Default: None.
+
+    Properties:
+        * objects
+    """
+    __slots__ = ('_objects',)
+
+    def __init__(self, objects=None):
+        self._objects = OrderedDict()
+        if objects is not None:
+            self.update(objects)
+
+    @property
+    def objects(self):
+        """Get a list of the unique objects in the order they were first added."""
+        return [ref[0] for ref in self._objects.values()]
+
+    def add(self, obj):
+        """Add an object to the set or increment its count if it is already in the set.
+
+        Args:
+            obj: The object to be added. None values will be ignored.
+
+        Returns:
+            True if the object was not in the set before. False if it was already
+            in the set or it is None.
+        """
+        if obj is None:
+            return False
+        key = id(obj)
+        try:
+            self._objects[key][1] += 1
+            return False
+        except KeyError:
+            self._objects[key] = [obj, 1]
+            return True
+
+    def update(self, objects):
+        """Add each object of an iterable to the set.
+
+        Args:
+            objects: An iterable of objects to be added. None values will be ignored.
+        """
+        for obj in objects:
+            self.add(obj)
+
+    def count(self, obj):
+        """Get the number of times an object has been added to the set.
+
+        Args:
+            obj: The object to be counted.
+        """
+        try:
+            return self._objects[id(obj)][1]
+        except KeyError:
+            return 0
+
+    def discard(self, obj):
+        """Remove an object from the set if it is present."""
+        self._objects.pop(id(obj), None)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __contains__(self, obj):
+        return id(obj) in self._objects
+
+    def __iter__(self):
+        return (ref[0] for ref in self._objects.values())
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __repr__(self):
+        return 'IdentitySet: [{} objects]'.format(len(self._objects))
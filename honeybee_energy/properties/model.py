@@ -18,12 +18,39 @@ from ..programtype import ProgramType
 from ..schedule.typelimit import ScheduleTypeLimit
 from ..schedule.ruleset import ScheduleRuleset
 from ..schedule.fixedinterval import ScheduleFixedInterval
+from ._identityset import IdentitySet
 
 try:
     from itertools import izip as zip  # python 2
 except ImportError:
     pass   # python 3
 
+# number of processes used to create the resources of Models loaded from dictionaries
+_loader_processes = 1
+
+
+def set_loader_processes(processes=1):
+    """Set the number of processes used to create energy resources from Model dicts.
+
+    When this is greater than 1, apply_properties_from_dict (and therefore
+    Model.from_dict) creates the materials and schedules of a Model in chunks
+    within a pool of worker processes. This can speed up the loading of Models
+    with many schedules on machines with several CPUs but starting the pool and
+    sending the resources between processes also takes time. So it is only
+    useful for very large Models. Note that process pools are not available in
+    IronPython and, on Windows, scripts that use them must guard their main code
+    with if __name__ == '__main__'.
+
+    Args:
+        processes: An integer for the number of worker processes. Use 1 to
+            create all resources in the current process. Default: 1.
+    """
+    global _loader_processes
+    processes = int(processes)
+    assert processes >= 1, 'Loader processes must be at least 1. ' \
+        'Got {}.'.format(processes)
+    _loader_processes = processes
+
 
 class ModelEnergyProperties(object):
     """Energy Properties for Honeybee Model.
@@ -62,13 +89,7 @@ class ModelEnergyProperties(object):
         This includes materials across all Faces, Apertures, Doors, Room
         ConstructionSets, and the global_construction_set.
         """
-        materials = []
-        for constr in self.constructions:
-            try:
-                materials.extend(constr.materials)
-            except AttributeError:
-                pass  # ShadeConstruction
-        return list(set(materials))
+        return self._resources().materials()
 
     @property
     def constructions(self):
@@ -77,53 +98,23 @@ class ModelEnergyProperties(object):
         This includes constructions across all Faces, Apertures, Doors, Shades,
         Room ConstructionSets, and the global_construction_set.
         """
-        room_constrs = []
-        for cnstr_set in self.construction_sets:
-            room_constrs.extend(cnstr_set.modified_constructions_unique)
-        all_constrs = self.global_construction_set.constructions_unique + \
-            room_constrs + self.face_constructions + self.shade_constructions
-        return list(set(all_constrs))
+        return self._resources().constructions()
 
     @property
     def face_constructions(self):
         """A list of all unique constructions assigned to Faces, Apertures and Doors."""
-        constructions = []
-        for room in self.host.rooms:
-            for face in room.faces:  # check all Face constructions
-                self._check_and_add_obj_construction(face, constructions)
-                for ap in face.apertures:  # check all Aperture constructions
-                    self._check_and_add_obj_construction(ap, constructions)
-                for dr in face.doors:  # check all Door constructions
-                    self._check_and_add_obj_construction(dr, constructions)
-        return list(set(constructions))
+        return list(set(self._resources().face_constructions))
 
     @property
     def shade_constructions(self):
         """A list of all unique constructions assigned to Shades in the model."""
-        constructions = []
-        for shade in self.host.orphaned_shades:
-            self._check_and_add_obj_construction(shade, constructions)
-        for room in self.host.rooms:
-            for shade in room.shades:
-                self._check_and_add_obj_construction(shade, constructions)
-            for face in room.faces:  # check all Face constructions
-                for shade in face.shades:
-                    self._check_and_add_obj_construction(shade, constructions)
-                for ap in face.apertures:  # check all Aperture constructions
-                    for shade in ap.shades:
-                        self._check_and_add_obj_construction(shade, constructions)
-        return list(set(constructions))
+        return list(set(self._resources().shade_constructions))
 
     @property
     def construction_sets(self):
         """A list of all unique Room-Assigned ConstructionSets in the Model."""
-        construction_sets = []
-        for room in self.host.rooms:
-            if room.properties.energy._construction_set is not None:
-                if not self._instance_in_array(room.properties.energy._construction_set,
-                                               construction_sets):
-                    construction_sets.append(room.properties.energy._construction_set)
-        return list(set(construction_sets))  # catch equivalent construction sets
+        # catch equivalent construction sets
+        return list(set(self._resources().construction_sets))
 
     @property
     def global_construction_set(self):
@@ -142,12 +133,7 @@ class ModelEnergyProperties(object):
 
         This includes schedules across all Shades and Rooms.
         """
-        type_limits = []
-        for sched in self.schedules:
-            t_lim = sched.schedule_type_limit
-            if t_lim is not None and not self._instance_in_array(t_lim, type_limits):
-                type_limits.append(t_lim)
-        return list(set(type_limits))
+        return self._resources().schedule_type_limits()
 
     @property
     def schedules(self):
@@ -155,30 +141,13 @@ class ModelEnergyProperties(object):
 
         This includes schedules across all ProgramTypes, Rooms, and Shades.
         """
-        p_type_scheds = []
-        for p_type in self.program_types:
-            for sched in p_type.schedules:
-                self._check_and_add_schedule(sched, p_type_scheds)
-        all_scheds = p_type_scheds + self.room_schedules + self.shade_schedules
-        return list(set(all_scheds))
+        return self._resources().schedules()
 
     @property
     def shade_schedules(self):
         """A list of all unique transmittance schedules assigned to Shades in the model.
         """
-        schedules = []
-        for shade in self.host.orphaned_shades:
-            self._check_and_add_shade_schedule(shade, schedules)
-        for room in self.host.rooms:
-            for shade in room.shades:
-                self._check_and_add_shade_schedule(shade, schedules)
-            for face in room.faces:  # check all Face schedules
-                for shade in face.shades:
-                    self._check_and_add_shade_schedule(shade, schedules)
-                for ap in face.apertures:  # check all Aperture schedules
-                    for shade in ap.shades:
-                        self._check_and_add_shade_schedule(shade, schedules)
-        return list(set(schedules))
+        return list(set(self._resources().shade_schedules))
 
     @property
     def room_schedules(self):
@@ -187,48 +156,13 @@ class ModelEnergyProperties(object):
         Note that this does not include schedules from ProgramTypes assigned to the
         rooms.
         """
-        scheds = []
-        for room in self.host.rooms:
-            people = room.properties.energy._people
-            lighting = room.properties.energy._lighting
-            electric_equipment = room.properties.energy._electric_equipment
-            gas_equipment = room.properties.energy._gas_equipment
-            infiltration = room.properties.energy._infiltration
-            ventilation = room.properties.energy._ventilation
-            setpoint = room.properties.energy._setpoint
-            if people is not None:
-                self._check_and_add_schedule(people.occupancy_schedule, scheds)
-                self._check_and_add_schedule(people.activity_schedule, scheds)
-            if lighting is not None:
-                self._check_and_add_schedule(lighting.schedule, scheds)
-            if electric_equipment is not None:
-                self._check_and_add_schedule(electric_equipment.schedule, scheds)
-            if gas_equipment is not None:
-                self._check_and_add_schedule(gas_equipment.schedule, scheds)
-            if infiltration is not None:
-                self._check_and_add_schedule(infiltration.schedule, scheds)
-            if ventilation is not None and ventilation.schedule is not None:
-                self._check_and_add_schedule(ventilation.schedule, scheds)
-            if setpoint is not None:
-                self._check_and_add_schedule(setpoint.heating_schedule, scheds)
-                self._check_and_add_schedule(setpoint.cooling_schedule, scheds)
-                if setpoint.humidifying_schedule is not None:
-                    self._check_and_add_schedule(
-                        setpoint.humidifying_schedule, scheds)
-                    self._check_and_add_schedule(
-                        setpoint.dehumidifying_schedule, scheds)
-        return list(set(scheds))
+        return list(set(self._resources().room_schedules))
 
     @property
     def program_types(self):
         """A list of all unique ProgramTypes in the Model."""
-        program_types = []
-        for room in self.host.rooms:
-            if room.properties.energy._program_type is not None:
-                if not self._instance_in_array(room.properties.energy._program_type,
-                                               program_types):
-                    program_types.append(room.properties.energy._program_type)
-        return list(set(program_types))  # catch equivalent program types
+        # catch equivalent program types
+        return list(set(self._resources().program_types))
 
     def check_duplicate_material_names(self, raise_exception=True):
         """Check that there are no duplicate Material names in the model."""
@@ -332,103 +266,37 @@ class ModelEnergyProperties(object):
             return False
         return True
 
-    def apply_properties_from_dict(self, data):
+    def apply_properties_from_dict(self, data, processes=None):
         """Apply the energy properties of a dictionary to the host Model of this object.
 
         Args:
             data: A dictionary representation of an entire honeybee-core Model.
                 Note that this dictionary must have ModelEnergyProperties in order
                 for this method to successfully apply the energy properties.
+            processes: An optional integer for the number of worker processes used
+                to create the materials and schedules of the Model. If None, the
+                number set with set_loader_processes will be used (1 unless it
+                has been changed), in which case no worker processes are used.
         """
         assert 'energy' in data['properties'], \
             'Dictionary possesses no ModelEnergyProperties.'
 
-        # process all materials in the ModelEnergyProperties dictionary
-        materials = {}
-        for mat in data['properties']['energy']['materials']:
-            if mat['type'] == 'EnergyMaterial':
-                materials[mat['name']] = EnergyMaterial.from_dict(mat)
-            elif mat['type'] == 'EnergyMaterialNoMass':
-                materials[mat['name']] = EnergyMaterialNoMass.from_dict(mat)
-            elif mat['type'] == 'EnergyWindowMaterialSimpleGlazSys':
-                materials[mat['name']] = EnergyWindowMaterialSimpleGlazSys.from_dict(mat)
-            elif mat['type'] == 'EnergyWindowMaterialGlazing':
-                materials[mat['name']] = EnergyWindowMaterialGlazing.from_dict(mat)
-            elif mat['type'] == 'EnergyWindowMaterialGas':
-                materials[mat['name']] = EnergyWindowMaterialGas.from_dict(mat)
-            elif mat['type'] == 'EnergyWindowMaterialGasMixture':
-                materials[mat['name']] = EnergyWindowMaterialGasMixture.from_dict(mat)
-            elif mat['type'] == 'EnergyWindowMaterialGasCustom':
-                materials[mat['name']] = EnergyWindowMaterialGasCustom.from_dict(mat)
-            elif mat['type'] == 'EnergyWindowMaterialShade':
-                materials[mat['name']] = EnergyWindowMaterialShade.from_dict(mat)
-            elif mat['type'] == 'EnergyWindowMaterialBlind':
-                materials[mat['name']] = EnergyWindowMaterialBlind.from_dict(mat)
-            else:
-                raise NotImplementedError(
-                    'Material {} is not supported.'.format(mat['type']))
-
-        # process all constructions in the ModelEnergyProperties dictionary
-        constructions = {}
-        for cnstr in data['properties']['energy']['constructions']:
-            if cnstr['type'] == 'OpaqueConstructionAbridged':
-                mat_layers = [materials[mat_name] for mat_name in cnstr['layers']]
-                constructions[cnstr['name']] = \
-                    OpaqueConstruction(cnstr['name'], mat_layers)
-            elif cnstr['type'] == 'WindowConstructionAbridged':
-                mat_layers = [materials[mat_name] for mat_name in cnstr['layers']]
-                constructions[cnstr['name']] = \
-                    WindowConstruction(cnstr['name'], mat_layers)
-            elif cnstr['type'] == 'ShadeConstruction':
-                constructions[cnstr['name']] = ShadeConstruction.from_dict(cnstr)
-            else:
-                raise NotImplementedError(
-                    'Construction {} is not supported.'.format(cnstr['type']))
-
-        # process all construction sets in the ModelEnergyProperties dictionary
-        construction_sets = {}
-        for c_set in data['properties']['energy']['construction_sets']:
-            construction_sets[c_set['name']] = \
-                ConstructionSet.from_dict_abridged(c_set, constructions)
-
-        # process all schedule type limits in the ModelEnergyProperties dictionary
-        schedule_type_limits = {}
-        for t_lim in data['properties']['energy']['schedule_type_limits']:
-            schedule_type_limits[t_lim['name']] = ScheduleTypeLimit.from_dict(t_lim)
-
-        # process all schedules in the ModelEnergyProperties dictionary
-        schedules = {}
-        for sched in data['properties']['energy']['schedules']:
-            sched = sched.copy()  # copy the original dictionary so that we don't edit it
-            # process the schedule type limits
-            typ_lim = None
-            if 'schedule_type_limit' in sched:
-                typ_lim = sched['schedule_type_limit']
-                sched['schedule_type_limit'] = None
-            # create the schedule objects
-            if sched['type'] == 'ScheduleRulesetAbridged':
-                sched['type'] = 'ScheduleRuleset'
-                schedules[sched['name']] = ScheduleRuleset.from_dict(sched)
-            elif sched['type'] == 'ScheduleFixedIntervalAbridged':
-                sched['type'] = 'ScheduleFixedInterval'
-                schedules[sched['name']] = ScheduleFixedInterval.from_dict(sched)
-            else:
-                raise NotImplementedError(
-                    'Schedule {} is not supported.'.format(sched['type']))
-            # asign the schedule type limits
-            schedules[sched['name']].schedule_type_limit = \
-                schedule_type_limits[typ_lim] if typ_lim is not None else None
-
-        # process all ProgramType in the ModelEnergyProperties dictionary
-        program_types = {}
-        if 'program_types' in data['properties']['energy']:
-            for p_typ in data['properties']['energy']['program_types']:
-                program_types[p_typ['name']] = \
-                    ProgramType.from_dict_abridged(p_typ, schedules)
+        # process all resources in the ModelEnergyProperties dictionary
+        processes = _loader_processes if processes is None else processes
+        resources = _ModelResourceLoader()
+        if processes > 1:
+            resources.load_from_dict_in_pool(data['properties']['energy'], processes)
+        else:
+            resources.load_from_dict(data['properties']['energy'])
+        constructions = resources.constructions
+        construction_sets = resources.construction_sets
+        schedules = resources.schedules
+        program_types = resources.program_types
 
         # collect lists of energy property dictionaries
+        # new lists are passed since the default lists are shared between calls
         room_e_dicts, face_e_dicts, shd_e_dicts, ap_e_dicts, dr_e_dicts = \
-            model_extension_dicts(data, 'energy')
+            model_extension_dicts(data, 'energy', [], [], [], [], [])
 
         # apply energy properties to objects uwing the energy property dictionaries
         for room, r_dict in zip(self.host.rooms, room_e_dicts):
@@ -441,8 +309,8 @@ class ModelEnergyProperties(object):
                 s_dict, constructions, schedules)
         for aperture, a_dict in zip(self.host.apertures, ap_e_dicts):
             aperture.properties.energy.apply_properties_from_dict(a_dict, constructions)
-        for aperture, a_dict in zip(self.host.apertures, ap_e_dicts):
-            aperture.properties.energy.apply_properties_from_dict(a_dict, constructions)
+        for door, d_dict in zip(self.host.doors, dr_e_dicts):
+            door.properties.energy.apply_properties_from_dict(d_dict, constructions)
 
     def to_dict(self, include_global_construction_set=True):
         """Return Model energy properties as a dictionary.
@@ -461,18 +329,13 @@ class ModelEnergyProperties(object):
             base['energy']['construction_sets'].append(
                 self.global_construction_set.to_dict(abridged=True,
                                                      none_for_defaults=False))
-        construction_sets = self.construction_sets
+        resources = self._resources()
+        construction_sets = list(set(resources.construction_sets))
         for cnstr_set in construction_sets:
             base['energy']['construction_sets'].append(cnstr_set.to_dict(abridged=True))
 
         # add all unique Constructions to the dictionary
-        room_constrs = []
-        for cnstr_set in construction_sets:
-            room_constrs.extend(cnstr_set.modified_constructions_unique)
-        all_constrs = room_constrs + self.face_constructions + self.shade_constructions
-        if include_global_construction_set:
-            all_constrs.extend(self.global_construction_set.constructions_unique)
-        constructions = list(set(all_constrs))
+        constructions = resources.constructions(include_global_construction_set)
         base['energy']['constructions'] = []
         for cnst in constructions:
             try:
@@ -481,39 +344,24 @@ class ModelEnergyProperties(object):
                 base['energy']['constructions'].append(cnst.to_dict())
 
         # add all unique Materials to the dictionary
-        materials = []
-        for cnstr in constructions:
-            try:
-                materials.extend(cnstr.materials)
-            except AttributeError:
-                pass  # ShadeConstruction
-        base['energy']['materials'] = [mat.to_dict() for mat in set(materials)]
+        base['energy']['materials'] = \
+            [mat.to_dict() for mat in resources.materials(constructions)]
 
         # add all unique program types to the dictionary
-        program_types = self.program_types
+        program_types = list(set(resources.program_types))
         base['energy']['program_types'] = []
         for p_type in program_types:
             base['energy']['program_types'].append(p_type.to_dict(abridged=True))
 
         # add all unique Schedules to the dictionary
-        p_type_scheds = []
-        for p_type in program_types:
-            for sched in p_type.schedules:
-                self._check_and_add_schedule(sched, p_type_scheds)
-        all_scheds = p_type_scheds + self.room_schedules + self.shade_schedules
-        schedules = list(set(all_scheds))
+        schedules = resources.schedules()
         base['energy']['schedules'] = []
         for sched in schedules:
             base['energy']['schedules'].append(sched.to_dict(abridged=True))
 
         # add all unique ScheduleTypeLimits to the dictionary
-        type_limits = []
-        for sched in schedules:
-            t_lim = sched.schedule_type_limit
-            if t_lim is not None and not self._instance_in_array(t_lim, type_limits):
-                type_limits.append(t_lim)
         base['energy']['schedule_type_limits'] = \
-            [s_typ.to_dict() for s_typ in set(type_limits)]
+            [s_typ.to_dict() for s_typ in resources.schedule_type_limits(schedules)]
 
         return base
 
@@ -526,41 +374,486 @@ class ModelEnergyProperties(object):
         _host = new_host or self._host
         return ModelEnergyProperties(_host)
 
-    def _check_and_add_obj_construction(self, obj, constructions):
-        """Check if a construction is assigned to an object and add it to a list."""
-        constr = obj.properties.energy._construction
-        if constr is not None:
-            if not self._instance_in_array(constr, constructions):
-                constructions.append(constr)
-
-    def _check_and_add_shade_schedule(self, obj, schedules):
-        """Check if a schedule is assigned to a shade and add it to a list."""
-        sched = obj.properties.energy._transmittance_schedule
-        if sched is not None:
-            if not self._instance_in_array(sched, schedules):
-                schedules.append(sched)
-
-    def _check_and_add_schedule(self, load_sched, schedules):
-        """Check if a schedule is in a list and add it if not."""
-        if not self._instance_in_array(load_sched, schedules):
-            schedules.append(load_sched)
+    def _resources(self):
+        """Get a _ModelResources registry of all energy resources in the host Model.
 
-    @staticmethod
-    def _instance_in_array(object_instance, object_array):
-        """Check if a specific object instance is already in an array.
-
-        This can be much faster than  `if object_instance in object_arrary`
-        when you expect to be testing a lot of the same instance of an object for
-        inclusion in an array since the builtin method uses an == operator to
-        test inclusion.
+        The registry is built with a single walk over all of the Rooms, Faces,
+        Apertures, Doors and Shades of the Model.
         """
-        for val in object_array:
-            if val is object_instance:
-                return True
-        return False
+        resources = _ModelResources(self.global_construction_set)
+        host = self.host
+        for shade in host.orphaned_shades:
+            resources.add_shade(shade)
+        for room in host.rooms:
+            resources.add_room(room)
+            for shade in room.shades:
+                resources.add_shade(shade)
+            for face in room.faces:
+                resources.add_face(face)
+                for shade in face.shades:
+                    resources.add_shade(shade)
+                for ap in face.apertures:
+                    resources.add_face(ap)
+                    for shade in ap.shades:
+                        resources.add_shade(shade)
+                for dr in face.doors:
+                    resources.add_face(dr)
+        return resources
 
     def ToString(self):
         return self.__repr__()
 
     def __repr__(self):
         return 'Model Energy Properties:\n host: {}'.format(self.host.name)
+
+
+class _ModelResources(object):
+    """Registry of the energy resources assigned to the objects of a Model.
+
+    Each group of resources is an IdentitySet, which counts the number of objects
+    referencing each resource and only ever stores a given resource once.
+
+    Args:
+        global_construction_set: The ConstructionSet used for all objects in the
+            Model that lack a construction specification.
+
+    Properties:
+        * face_constructions
+        * shade_constructions
+        * construction_sets
+        * program_types
+        * room_schedules
+        * shade_schedules
+    """
+    __slots__ = ('_global_construction_set', '_face_constructions',
+                 '_shade_constructions', '_construction_sets', '_program_types',
+                 '_room_schedules', '_shade_schedules')
+
+    def __init__(self, global_construction_set):
+        self._global_construction_set = global_construction_set
+        self._face_constructions = IdentitySet()
+        self._shade_constructions = IdentitySet()
+        self._construction_sets = IdentitySet()
+        self._program_types = IdentitySet()
+        self._room_schedules = IdentitySet()
+        self._shade_schedules = IdentitySet()
+
+    @property
+    def face_constructions(self):
+        """List of unique constructions assigned to Faces, Apertures and Doors."""
+        return self._face_constructions.objects
+
+    @property
+    def shade_constructions(self):
+        """List of unique constructions assigned to Shades."""
+        return self._shade_constructions.objects
+
+    @property
+    def construction_sets(self):
+        """List of unique ConstructionSets assigned to Rooms."""
+        return self._construction_sets.objects
+
+    @property
+    def program_types(self):
+        """List of unique ProgramTypes assigned to Rooms."""
+        return self._program_types.objects
+
+    @property
+    def room_schedules(self):
+        """List of unique schedules assigned directly to the loads of Rooms."""
+        return self._room_schedules.objects
+
+    @property
+    def shade_schedules(self):
+        """List of unique transmittance schedules assigned to Shades."""
+        return self._shade_schedules.objects
+
+    def add_room(self, room):
+        """Add the ConstructionSet, ProgramType and load schedules of a Room."""
+        energy = room.properties.energy
+        self._construction_sets.add(energy._construction_set)
+        self._program_types.add(energy._program_type)
+        scheds = self._room_schedules
+        people = energy._people
+        if people is not None:
+            scheds.add(people.occupancy_schedule)
+            scheds.add(people.activity_schedule)
+        for load in (energy._lighting, energy._electric_equipment,
+                     energy._gas_equipment, energy._infiltration, energy._ventilation):
+            if load is not None:
+                scheds.add(load.schedule)
+        setpoint = energy._setpoint
+        if setpoint is not None:
+            scheds.add(setpoint.heating_schedule)
+            scheds.add(setpoint.cooling_schedule)
+            if setpoint.humidifying_schedule is not None:
+                scheds.add(setpoint.humidifying_schedule)
+                scheds.add(setpoint.dehumidifying_schedule)
+
+    def add_face(self, face):
+        """Add the construction of a Face, Aperture or Door."""
+        self._face_constructions.add(face.properties.energy._construction)
+
+    def add_shade(self, shade):
+        """Add the construction and transmittance schedule of a Shade."""
+        energy = shade.properties.energy
+        self._shade_constructions.add(energy._construction)
+        self._shade_schedules.add(energy._transmittance_schedule)
+
+    def reference_count(self, resource):
+        """Get the number of objects in the Model that directly reference a resource.
+
+        Args:
+            resource: A construction, ConstructionSet, ProgramType or schedule.
+        """
+        return sum(registry.count(resource) for registry in (
+            self._face_constructions, self._shade_constructions,
+            self._construction_sets, self._program_types,
+            self._room_schedules, self._shade_schedules))
+
+    def constructions(self, include_global_construction_set=True):
+        """Get a list of all unique constructions across the registry.
+
+        Args:
+            include_global_construction_set: Boolean to note whether the
+                constructions of the global ConstructionSet should be included.
+        """
+        constrs = IdentitySet()
+        if include_global_construction_set:
+            constrs.update(self._global_construction_set.constructions_unique)
+        for cnstr_set in self._construction_sets:
+            constrs.update(cnstr_set.modified_constructions_unique)
+        constrs.update(self._face_constructions)
+        constrs.update(self._shade_constructions)
+        return list(set(constrs))
+
+    def materials(self, constructions=None):
+        """Get a list of all unique materials across the registry.
+
+        Args:
+            constructions: An optional list of constructions from which the
+                materials will be extracted. If None, all constructions of the
+                registry will be used.
+        """
+        if constructions is None:
+            constructions = self.constructions()
+        materials = IdentitySet()
+        for constr in constructions:
+            try:
+                materials.update(constr.materials)
+            except AttributeError:
+                pass  # ShadeConstruction
+        return list(set(materials))
+
+    def schedules(self):
+        """Get a list of all unique schedules across ProgramTypes, Rooms and Shades."""
+        scheds = IdentitySet()
+        for p_type in self._program_types:
+            scheds.update(p_type.schedules)
+        scheds.update(self._room_schedules)
+        scheds.update(self._shade_schedules)
+        return list(set(scheds))
+
+    def schedule_type_limits(self, schedules=None):
+        """Get a list of all unique schedule type limits across the registry.
+
+        Args:
+            schedules: An optional list of schedules from which the type limits
+                will be extracted. If None, all schedules of the registry will be used.
+        """
+        if schedules is None:
+            schedules = self.schedules()
+        type_limits = IdentitySet(sched.schedule_type_limit for sched in schedules)
+        return list(set(type_limits))
+
+
+class _ModelResourceLoader(object):
+    """Loader of the energy resources of a Model from their dictionaries.
+
+    Resource dictionaries can be added in any order. Each resource is created as
+    soon as all of the resources that it depends on have been created and the
+    dictionaries that are still waiting on other resources are held until then.
+    This way, resources can be created while a Model file is being read and most
+    of the resource dictionaries can be discarded right after they are read.
+
+    Properties:
+        * materials
+        * constructions
+        * construction_sets
+        * schedule_type_limits
+        * schedules
+        * program_types
+        * is_complete
+    """
+    __slots__ = ('_resources', '_pending', '_added', '_created', '_untyped_schedules')
+    RESOURCE_TYPES = ('materials', 'constructions', 'construction_sets',
+                      'schedule_type_limits', 'schedules', 'program_types')
+    # ProgramTypes lock their schedules, which must have their type limits first
+    _dependencies = {
+        'materials': (),
+        'constructions': ('materials',),
+        'construction_sets': ('constructions',),
+        'schedule_type_limits': (),
+        'schedules': (),
+        'program_types': ('schedules', 'schedule_type_limits')
+    }
+    # resources without dependencies that can be created in worker processes
+    _pool_types = ('materials', 'schedules')
+
+    def __init__(self):
+        self._resources = {res_type: {} for res_type in self.RESOURCE_TYPES}
+        self._pending = {res_type: [] for res_type in self.RESOURCE_TYPES}
+        self._added = set()  # resource types with all of their dictionaries added
+        self._created = set()  # resource types with all of their objects created
+        self._untyped_schedules = []  # schedules waiting on their type limits
+
+    @property
+    def materials(self):
+        """Get a dictionary of the materials with their names as keys."""
+        return self._resources['materials']
+
+    @property
+    def constructions(self):
+        """Get a dictionary of the constructions with their names as keys."""
+        return self._resources['constructions']
+
+    @property
+    def construction_sets(self):
+        """Get a dictionary of the ConstructionSets with their names as keys."""
+        return self._resources['construction_sets']
+
+    @property
+    def schedule_type_limits(self):
+        """Get a dictionary of the ScheduleTypeLimits with their names as keys."""
+        return self._resources['schedule_type_limits']
+
+    @property
+    def schedules(self):
+        """Get a dictionary of the schedules with their names as keys."""
+        return self._resources['schedules']
+
+    @property
+    def program_types(self):
+        """Get a dictionary of the ProgramTypes with their names as keys."""
+        return self._resources['program_types']
+
+    @property
+    def is_complete(self):
+        """Get a boolean for whether all resources have been created."""
+        return len(self._created) == len(self.RESOURCE_TYPES)
+
+    def load_from_dict(self, data):
+        """Load all resources from a ModelEnergyProperties dictionary.
+
+        Args:
+            data: A ModelEnergyProperties dictionary. Any resource types missing
+                from the dictionary are assumed to have no resources.
+        """
+        for res_type in self.RESOURCE_TYPES:
+            for res_dict in data.get(res_type, ()):
+                self.add(res_type, res_dict)
+            self.finish(res_type)
+
+    def load_from_dict_in_pool(self, data, processes):
+        """Load all resources from a ModelEnergyProperties dictionary with a process pool.
+
+        Materials and schedules do not depend on any other resources. So they are
+        created in chunks by a pool of worker processes while the other resources
+        are created in this process from the results.
+
+        Args:
+            data: A ModelEnergyProperties dictionary. Any resource types missing
+                from the dictionary are assumed to have no resources.
+            processes: An integer for the number of worker processes.
+        """
+        from multiprocessing import Pool  # not available in IronPython
+        pool = Pool(processes)
+        try:
+            # send the materials and schedules to the workers in chunks
+            chunks = {}
+            for res_type in self._pool_types:
+                res_dicts = data.get(res_type, ())
+                size = max(1, (len(res_dicts) - 1) // (processes * 4) + 1)
+                chunks[res_type] = [
+                    pool.apply_async(_resources_from_dicts,
+                                     (res_type, res_dicts[i:i + size]))
+                    for i in range(0, len(res_dicts), size)]
+            # create the other resources while the workers build their chunks
+            for res_type in self.RESOURCE_TYPES:
+                if res_type in chunks:
+                    for chunk in chunks[res_type]:
+                        for resource in chunk.get():
+                            self._add_resource(res_type, resource)
+                else:
+                    for res_dict in data.get(res_type, ()):
+                        self.add(res_type, res_dict)
+                self.finish(res_type)
+        finally:
+            pool.terminate()
+
+    def add(self, resource_type, data):
+        """Add the dictionary of a resource, creating the resource if possible.
+
+        Args:
+            resource_type: Text for the type of resource, which must be one of
+                the RESOURCE_TYPES. This is the same as the key of the resource
+                list in ModelEnergyProperties dictionaries.
+            data: The dictionary of the resource.
+        """
+        if self._dependencies_created(resource_type):
+            self._create(resource_type, data)
+        else:
+            self._pending[resource_type].append(data)
+
+    def finish(self, resource_type):
+        """Note that all dictionaries of a resource type have been added.
+
+        Args:
+            resource_type: Text for the type of resource, which must be one of
+                the RESOURCE_TYPES.
+        """
+        self._added.add(resource_type)
+        created_new = True
+        while created_new:
+            created_new = False
+            for res_type in self.RESOURCE_TYPES:
+                if res_type in self._added and res_type not in self._created \
+                        and self._dependencies_created(res_type):
+                    for res_dict in self._pending[res_type]:
+                        self._create(res_type, res_dict)
+                    self._pending[res_type] = []
+                    self._created.add(res_type)
+                    created_new = True
+                    if res_type == 'schedule_type_limits':
+                        self._assign_type_limits()
+
+    def finish_all(self):
+        """Note that all resource dictionaries have been added."""
+        for res_type in self.RESOURCE_TYPES:
+            self.finish(res_type)
+
+    def _dependencies_created(self, resource_type):
+        """Check whether all resources that a resource type depends on exist."""
+        return all(dep in self._created for dep in self._dependencies[resource_type])
+
+    def _assign_type_limits(self):
+        """Assign ScheduleTypeLimits to the schedules that were waiting on them."""
+        type_limits = self._resources['schedule_type_limits']
+        for sched, typ_lim in self._untyped_schedules:
+            sched.schedule_type_limit = type_limits[typ_lim]
+        self._untyped_schedules = []
+
+    def _create(self, resource_type, data):
+        """Create a resource from its dictionary and add it to the resources."""
+        resources = self._resources[resource_type]
+        if resource_type == 'materials':
+            resources[data['name']] = self._material_from_dict(data)
+        elif resource_type == 'constructions':
+            resources[data['name']] = \
+                self._construction_from_dict(data, self._resources['materials'])
+        elif resource_type == 'construction_sets':
+            resources[data['name']] = ConstructionSet.from_dict_abridged(
+                data, self._resources['constructions'])
+        elif resource_type == 'schedule_type_limits':
+            resources[data['name']] = ScheduleTypeLimit.from_dict(data)
+        elif resource_type == 'schedules':
+            self._add_resource(resource_type, self._schedule_from_dict(data))
+        else:
+            resources[data['name']] = ProgramType.from_dict_abridged(
+                data, self._resources['schedules'])
+
+    def _add_resource(self, resource_type, resource):
+        """Add a material or schedule that has already been created to the resources.
+
+        Args:
+            resource_type: Text for either 'materials' or 'schedules'.
+            resource: A material object or a tuple with a schedule object and the
+                name of its schedule type limit (see _schedule_from_dict).
+        """
+        if resource_type == 'materials':
+            self._resources['materials'][resource.name] = resource
+            return
+        sched, typ_lim = resource
+        self._resources['schedules'][sched.name] = sched
+        if typ_lim is not None:
+            if 'schedule_type_limits' in self._created:
+                sched.schedule_type_limit = \
+                    self._resources['schedule_type_limits'][typ_lim]
+            else:
+                self._untyped_schedules.append((sched, typ_lim))
+
+    @staticmethod
+    def _material_from_dict(mat):
+        """Create a material object from its dictionary."""
+        if mat['type'] == 'EnergyMaterial':
+            return EnergyMaterial.from_dict(mat)
+        elif mat['type'] == 'EnergyMaterialNoMass':
+            return EnergyMaterialNoMass.from_dict(mat)
+        elif mat['type'] == 'EnergyWindowMaterialSimpleGlazSys':
+            return EnergyWindowMaterialSimpleGlazSys.from_dict(mat)
+        elif mat['type'] == 'EnergyWindowMaterialGlazing':
+            return EnergyWindowMaterialGlazing.from_dict(mat)
+        elif mat['type'] == 'EnergyWindowMaterialGas':
+            return EnergyWindowMaterialGas.from_dict(mat)
+        elif mat['type'] == 'EnergyWindowMaterialGasMixture':
+            return EnergyWindowMaterialGasMixture.from_dict(mat)
+        elif mat['type'] == 'EnergyWindowMaterialGasCustom':
+            return EnergyWindowMaterialGasCustom.from_dict(mat)
+        elif mat['type'] == 'EnergyWindowMaterialShade':
+            return EnergyWindowMaterialShade.from_dict(mat)
+        elif mat['type'] == 'EnergyWindowMaterialBlind':
+            return EnergyWindowMaterialBlind.from_dict(mat)
+        raise NotImplementedError(
+            'Material {} is not supported.'.format(mat['type']))
+
+    @staticmethod
+    def _construction_from_dict(cnstr, materials):
+        """Create a construction object from its abridged dictionary."""
+        if cnstr['type'] == 'OpaqueConstructionAbridged':
+            mat_layers = [materials[mat_name] for mat_name in cnstr['layers']]
+            return OpaqueConstruction(cnstr['name'], mat_layers)
+        elif cnstr['type'] == 'WindowConstructionAbridged':
+            mat_layers = [materials[mat_name] for mat_name in cnstr['layers']]
+            return WindowConstruction(cnstr['name'], mat_layers)
+        elif cnstr['type'] == 'ShadeConstruction':
+            return ShadeConstruction.from_dict(cnstr)
+        raise NotImplementedError(
+            'Construction {} is not supported.'.format(cnstr['type']))
+
+    @staticmethod
+    def _schedule_from_dict(sched):
+        """Create a schedule from its abridged dictionary without its type limit.
+
+        Returns:
+            A tuple with the schedule object and the name of its schedule type limit.
+        """
+        sched = sched.copy()  # copy the original dictionary so that we don't edit it
+        # process the schedule type limits
+        typ_lim = None
+        if 'schedule_type_limit' in sched:
+            typ_lim = sched['schedule_type_limit']
+            sched['schedule_type_limit'] = None
+        # create the schedule objects
+        if sched['type'] == 'ScheduleRulesetAbridged':
+            sched['type'] = 'ScheduleRuleset'
+            return ScheduleRuleset.from_dict(sched), typ_lim
+        elif sched['type'] == 'ScheduleFixedIntervalAbridged':
+            sched['type'] = 'ScheduleFixedInterval'
+            return ScheduleFixedInterval.from_dict(sched), typ_lim
+        raise NotImplementedError(
+            'Schedule {} is not supported.'.format(sched['type']))
+
+
+def _resources_from_dicts(resource_type, data):
+    """Create a chunk of materials or schedules in a worker process.
+
+    Args:
+        resource_type: Text for either 'materials' or 'schedules'.
+        data: A list of material or abridged schedule dictionaries.
+
+    Returns:
+        A list of material objects or (schedule, type limit name) tuples.
+    """
+    if resource_type == 'materials':
+        return [_ModelResourceLoader._material_from_dict(mat) for mat in data]
+    return [_ModelResourceLoader._schedule_from_dict(sched) for sched in data]
@@ -1,5 +1,6 @@
 """Methods to read from idf."""
 import re
+import os
 
 
 def parse_idf_string(idf_string, expected_type=None):
@@ -25,3 +26,79 @@ def parse_idf_string(idf_string, expected_type=None):
     ep_fields = [e_str.strip() for e_str in idf_string.split(',')]
     ep_fields.pop(0)  # remove the EnergyPlus object name
     return ep_fields
+
+
+def parse_idf_file(idf_file):
+    """Parse all objects of an EnergyPlus IDF file in a single pass over the file.
+
+    The file is streamed line by line, comments are stripped, and each object is
+    normalized to a compact IDF string (ie. 'Material,Brick,Rough,0.1,...;').
+    The resulting dictionary can be passed to any of the extract_all_from_idf_file
+    methods in place of the file path such that importing several object types
+    from the same file only reads the file once.
+
+    Args:
+        idf_file: A path to an IDF file.
+
+    Returns:
+        idf_objects: A dictionary with lowercase EnergyPlus object types as keys
+            (ie. 'schedule:day:interval') and lists of the IDF strings for each
+            object of that type as values. The lists follow the order in which
+            the objects appear in the file.
+    """
+    assert os.path.isfile(idf_file), 'Cannot find an idf file at {}'.format(idf_file)
+    idf_objects = {}
+    with open(idf_file, 'r') as ep_file:
+        for ep_fields in _tokenize_idf_lines(ep_file):
+            obj_type = ep_fields[0].lower()
+            obj_str = '{};'.format(','.join(ep_fields))
+            try:
+                idf_objects[obj_type].append(obj_str)
+            except KeyError:
+                idf_objects[obj_type] = [obj_str]
+    return idf_objects
+
+
+def idf_objects_by_type(idf_objects, *object_types):
+    """Get the IDF strings of all objects of certain types from a parsed IDF file.
+
+    Args:
+        idf_objects: A dictionary of IDF objects returned from the
+            parse_idf_file method.
+        *object_types: Text for the EnergyPlus object types to be returned
+            (ie. 'Material', 'Material:NoMass'). Matching is case-insensitive.
+
+    Returns:
+        A list of IDF strings for all of the objects of the input types. Objects
+        are grouped by the order of the input object_types.
+    """
+    idf_strings = []
+    for obj_type in object_types:
+        try:
+            idf_strings.extend(idf_objects[obj_type.lower()])
+        except KeyError:
+            pass  # no objects of this type in the file
+    return idf_strings
+
+
+def _tokenize_idf_lines(idf_lines):
+    """Yield a list of stripped fields for each object in an iterable of IDF lines."""
+    obj_fields = []
+    partial_field = ''
+    for line in idf_lines:
+        line = line.split('!', 1)[0]  # remove any comments
+        while True:
+            end_i = line.find(';')
+            segment = line if end_i == -1 else line[:end_i]
+            fields = segment.split(',')
+            fields[0] = partial_field + fields[0]
+            obj_fields.extend(f.strip() for f in fields[:-1])
+            partial_field = fields[-1]
+            if end_i == -1:
+                break
+            obj_fields.append(partial_field.strip())
+            partial_field = ''
+            if obj_fields[0] != '':
+                yield obj_fields
+            obj_fields = []
+            line = line[end_i + 1:]
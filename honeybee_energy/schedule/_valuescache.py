@@ -0,0 +1,91 @@
+# coding=utf-8
+"""Bounded cache of the values that are computed from locked schedules."""
+from collections import OrderedDict
+
+
+class ValuesCache(object):
+    """Least-recently-used cache of lists of schedule values with hit/miss counters.
+
+    Schedules only use this cache while they are locked since their values cannot
+    change at that time. The cache should be cleared whenever the schedule is
+    unlocked or edited.
+
+    Args:
+        maxsize: An integer for the maximum number of value lists to be stored in
+            the cache. When the cache is full, the least recently used value list
+            is discarded. Default: 8.
+
+    Properties:
+        * maxsize
+        * currsize
+        * hits
+        * misses
+    """
+    __slots__ = ('_maxsize', '_values', '_hits', '_misses')
+
+    def __init__(self, maxsize=8):
+        self._maxsize = int(maxsize)
+        self._values = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self):
+        """Get an integer for the maximum number of value lists stored in the cache."""
+        return self._maxsize
+
+    @property
+    def currsize(self):
+        """Get an integer for the number of value lists currently in the cache."""
+        return len(self._values)
+
+    @property
+    def hits(self):
+        """Get an integer for the number of times values were found in the cache."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """Get an integer for the number of times values were not in the cache."""
+        return self._misses
+
+    def get(self, key):
+        """Get a new list of the cached values for a key or None if they are not cached.
+
+        Args:
+            key: A hashable object describing the inputs used to compute the values.
+        """
+        try:
+            values = self._values.pop(key)
+        except KeyError:
+            self._misses += 1
+            return None
+        self._values[key] = values  # move the values to the most recent position
+        self._hits += 1
+        return list(values)
+
+    def set(self, key, values):
+        """Add a list of values to the cache, discarding the oldest values if full.
+
+        Args:
+            key: A hashable object describing the inputs used to compute the values.
+            values: A list of numbers to be stored in the cache.
+        """
+        if self._maxsize <= 0:
+            return
+        self._values.pop(key, None)
+        self._values[key] = tuple(values)
+        while len(self._values) > self._maxsize:
+            self._values.popitem(last=False)
+
+    def clear(self):
+        """Remove all values from the cache without resetting the hit/miss counters."""
+        self._values.clear()
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'ValuesCache: [hits: {}, misses: {}, size: {}/{}]'.format(
+            self._hits, self._misses, len(self._values), self._maxsize)
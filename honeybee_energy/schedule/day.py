@@ -35,7 +35,8 @@ class ScheduleDay(object):
         interpolate
         is_constant
     """
-    __slots__ = ('_name', '_values', '_times', '_interpolate', '_parent', '_locked')
+    __slots__ = ('_name', '_values', '_times', '_interpolate', '_parent',
+                 '_timestep_values', '_locked')
 
     _start_of_day = Time(0, 0)
     VALIDTIMESTEPS = (1, 2, 3, 4, 5, 6, 10, 12, 15, 20, 30, 60)
@@ -65,6 +66,7 @@ class ScheduleDay(object):
         """
         self._locked = False  # unlocked by default
         self._parent = None  # no parent ScheduleRuleset by default
+        self._timestep_values = {}  # values_at_timestep results keyed by timestep
         self.name = name
 
         # assign the times and values
@@ -108,6 +110,7 @@ class ScheduleDay(object):
     @values.setter
     def values(self, values):
         self._values = self._check_values(values)
+        self._timestep_values.clear()
 
     @property
     def times(self):
@@ -117,6 +120,7 @@ class ScheduleDay(object):
     @times.setter
     def times(self, times):
         self._times = self._check_times(times)
+        self._timestep_values.clear()
 
     @property
     def interpolate(self):
@@ -126,6 +130,7 @@ class ScheduleDay(object):
     @interpolate.setter
     def interpolate(self, interpolate):
         self._interpolate = bool(interpolate)
+        self._timestep_values.clear()
 
     @property
     def is_constant(self):
@@ -146,6 +151,7 @@ class ScheduleDay(object):
         self._values = self._values + (value,)
         if self._times[-1] < self._times[-2]:  # ensure times are chronological
             self._times, self._values = zip(*sorted(zip(self._times, self._values)))
+        self._timestep_values.clear()
 
     def remove_value(self, value_index):
         """Remove a value from the schedule by its index.
@@ -159,6 +165,7 @@ class ScheduleDay(object):
             value_index = len(self._values) + value_index
         self._values = tuple(x for i, x in enumerate(self._values) if i != value_index)
         self._times = tuple(x for i, x in enumerate(self._times) if i != value_index)
+        self._timestep_values.clear()
 
     def remove_value_by_time(self, time):
         """Remove a value from the schedule by its time in the times property.
@@ -178,6 +185,7 @@ class ScheduleDay(object):
         val_list = list(self._values)
         val_list[value_index] = self._check_value(new_value)
         self._values = tuple(val_list)
+        self._timestep_values.clear()
 
     def replace_value_by_time(self, time, new_value):
         """Replace an existing value in the schedule using its time.
@@ -211,42 +219,21 @@ class ScheduleDay(object):
         is set to be occupied from 9:00 until 17:00 will show 9:00 as unoccupied but
         17:00 as occupied.
 
+        The values are computed once per timestep and are then reused until the
+        times, values or interpolate properties of the schedule are changed.
+
         Args:
             timestep: An integer for the number of steps per hour at which to return
                 the resulting values.
         """
         assert timestep in self.VALIDTIMESTEPS, 'ScheduleDay timestep "{}" is invalid.' \
             ' Must be one of the following:\n{}'.format(timestep, self.VALIDTIMESTEPS)
-        values = []
-        minute_delta = 60 / timestep
-        mod = 0  # track the minute of day through iteration
-        time_index = 1  # track the index of the next time of change
-        until_mod = self._get_until_mod(time_index)  # get the mod of the next change
-        if not self.interpolate:
-            for step in range(24 * timestep):
-                if mod >= until_mod:
-                    time_index += 1
-                    until_mod = self._get_until_mod(time_index)
-                values.append(self._values[time_index - 1])
-                mod += minute_delta
-        else:
-            for step in range(24 * timestep):
-                if mod >= until_mod:
-                    i = 0
-                    delta = self._values[time_index] - self._values[time_index - 1]
-                    until_mod = self._get_until_mod(time_index + 1)
-                    n_steps = (until_mod - self._times[time_index].mod) / minute_delta
-                    values.append(self._values[time_index - 1])
-                    time_index += 1
-                elif time_index == 1:
-                    values.append(self._values[time_index - 1])
-                else:
-                    i += 1
-                    values.append(self._values[time_index - 2] + ((i / n_steps) * delta))
-                mod += minute_delta
-            del values[0]  # delete first value, which is makes interpolation off by one
-            values.append(self._values[-1])  # add the final value that is reached
-        return values
+        try:
+            return list(self._timestep_values[timestep])
+        except KeyError:  # values have not yet been computed at this timestep
+            values = self._compute_values_at_timestep(timestep)
+            self._timestep_values[timestep] = tuple(values)
+            return values
 
     def data_collection(self, date, schedule_type_limit, timestep=1):
         """Get a ladybug DataCollection representing this schedule at a given timestep.
@@ -491,6 +478,52 @@ class ScheduleDay(object):
         # return the final list
         return ScheduleDay.from_values_at_timestep(name, sch_vals, timestep_resolution)
 
+    def _compute_values_at_timestep(self, timestep):
+        """Compute a list of values over the day by filling the steps between times."""
+        n_steps = 24 * timestep
+        change_steps = self._get_change_steps(timestep)
+        values = []
+        if not self.interpolate:
+            prev_step = 0
+            for time_index, step in enumerate(change_steps):
+                values.extend([self._values[time_index]] * (step - prev_step))
+                prev_step = step
+            values.extend([self._values[len(change_steps)]] * (n_steps - prev_step))
+        else:
+            minute_delta = 60 / timestep
+            change_steps.append(n_steps)
+            values.extend([self._values[0]] * change_steps[0])
+            for time_index in range(1, len(change_steps)):
+                # ramp from the previous value towards the value of this time
+                st_val = self._values[time_index - 1]
+                delta = self._values[time_index] - st_val
+                seg_steps = (self._get_until_mod(time_index + 1) -
+                             self._times[time_index].mod) / minute_delta
+                values.append(st_val)
+                values.extend([st_val + ((i / seg_steps) * delta) for i in
+                               range(1, change_steps[time_index] -
+                                     change_steps[time_index - 1])])
+            del values[0]  # delete first value, which is makes interpolation off by one
+            values.append(self._values[-1])  # add the final value that is reached
+        return values
+
+    def _get_change_steps(self, timestep):
+        """Get a list with the index of the step at which each time takes effect.
+
+        Times that fall within the same step take effect on successive steps and
+        times that never take effect before the end of the day are excluded.
+        """
+        step_minutes = 60 // timestep
+        n_steps = 24 * timestep
+        change_steps, prev_step = [], 0
+        for time in self._times[1:]:
+            step = max(-(-time.mod // step_minutes), prev_step + 1)
+            if step >= n_steps:
+                break
+            change_steps.append(step)
+            prev_step = step
+        return change_steps
+
     def _get_until_mod(self, time_index):
         """Get the minute of the day until a value is applied given a time_index."""
         try:
@@ -559,6 +592,14 @@ class ScheduleDay(object):
     def __iter__(self):
         return iter(self.values)
 
+    def _content_key(self):
+        """A tuple of the values, times and interpolation without the name.
+
+        ScheduleDays with the same content key write identical IDF Schedule:Day
+        objects aside from their names.
+        """
+        return (self._values, tuple(t.mod for t in self._times), self._interpolate)
+
     def __key(self):
         """A tuple based on the object properties, useful for hashing."""
         return (self.name,) + self.values + tuple(hash(t) for t in self.times) + \
@@ -3,7 +3,8 @@
 from __future__ import division
 
 from .typelimit import ScheduleTypeLimit
-from ..reader import parse_idf_string
+from ._valuescache import ValuesCache
+from ..reader import parse_idf_string, parse_idf_file, idf_objects_by_type
 from ..writer import generate_idf_string
 
 from honeybee._lockable import lockable
@@ -15,10 +16,13 @@ from ladybug.header import Header
 from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.dt import Date, DateTime
 from ladybug.datatype.generic import GenericType
-from ladybug.futil import write_to_file, csv_to_matrix
+from ladybug.futil import preparedir, writemode
 
 import os
-import re
+import mmap
+from array import array
+from operator import mul, itemgetter
+from itertools import islice, chain, repeat
 try:
     from collections.abc import Iterable  # python < 3.7
 except ImportError:
@@ -44,13 +48,17 @@ class ScheduleFixedInterval(object):
         end_date_time
         is_leap_year
         data_collection
+        values_cache
     """
     __slots__ = ('_name', '_values', '_schedule_type_limit', '_start_date',
-                 '_placeholder_value', '_timestep', '_interpolate', '_locked')
+                 '_placeholder_value', '_timestep', '_interpolate', '_values_cache',
+                 '_locked')
     _schedule_file_comments = \
         ('schedule name', 'schedule type limits', 'file name', 'column number',
          'rows to skip', 'number of hours of data', 'column separator',
          'interpolate to timestep', 'minutes per item')
+    _schedule_file_separators = \
+        {'comma': b',', 'tab': b'\t', 'space': b' ', 'semicolon': b';', '': b','}
     VALIDTIMESTEPS = (1, 2, 3, 4, 5, 6, 10, 12, 15, 20, 30, 60)
 
     def __init__(self, name, values, schedule_type_limit=None, timestep=1,
@@ -67,6 +75,9 @@ class ScheduleFixedInterval(object):
                 different than the default 1 Jan (it should instead be the start date
                 of your simulation). This list can also have a length much greater
                 than 8760 if a timestep greater than 1 is used.
+                If an array is input here (eg. array('d', values)), the values will
+                be stored as a compact array of doubles instead of a tuple of floats,
+                which uses about a quarter of the memory for long lists of values.
             schedule_type_limit: A ScheduleTypeLimit object that will be used to
                 validate schedule values against upper/lower limits and assign units
                 to the schedule values. If None, no validation will occur.
@@ -90,6 +101,7 @@ class ScheduleFixedInterval(object):
                 immediately upon the beginning time corrsponding to them. Default: False
         """
         self._locked = False  # unlocked by default
+        self._values_cache = ValuesCache()  # cache of values used while locked
 
         # set all of the properties that impact how many values can be assigned
         self._timestep = int_in_range(timestep, 1, 60, 'schedule timestep')
@@ -119,8 +131,14 @@ class ScheduleFixedInterval(object):
     @property
     def values(self):
         """Get or set the schedule's numerical values, which occur at a fixed interval.
+
+        This is a tuple unless the values were set with an array, in which case
+        it is a copy of the array of doubles such that editing it does not change
+        the schedule.
         """
-        return self._values
+        if isinstance(self._values, tuple):
+            return self._values
+        return array('d', self._values)  # copy such that the schedule is not edited
 
     @values.setter
     def values(self, values):
@@ -204,6 +222,15 @@ class ScheduleFixedInterval(object):
         header = Header(data_type, unit, a_period, metadata={'schedule': self.name})
         return HourlyContinuousCollection(header, self._values)
 
+    @property
+    def values_cache(self):
+        """Get the ValuesCache with the values_at_timestep computed while locked.
+
+        The cache has hits and misses properties that can be used to evaluate
+        how often the values of the locked schedule are re-used.
+        """
+        return self._values_cache
+
     def values_at_timestep(
             self, timestep=1, start_date=None, end_date=None):
         """Get a list of sequential schedule values over the year at a given timestep.
@@ -218,6 +245,9 @@ class ScheduleFixedInterval(object):
         ladybug objects. See the ScheduleDay.values_at_timestep method
         documentation for a complete description of these two interpretations.
 
+        While the schedule is locked, the values are stored in the values_cache
+        such that requesting the same values again does not recompute them.
+
         Args:
             timestep: An integer for the number of steps per hour at which to return
                 the resulting values.
@@ -226,85 +256,14 @@ class ScheduleFixedInterval(object):
             end_date: An optional ladybug Date object for when to end the list
                 of values. Default: 31 Dec with a leap year equal to self.start_date.
         """
-        # ensure that the input start_date and end_date are valid
-        if start_date is None:
-            start_date = Date(1, 1, self.is_leap_year)
-        else:
-            if start_date.leap_year is not self.is_leap_year:
-                start_date = Date(start_date.month, start_date.day, self.is_leap_year)
-        if end_date is None:
-            end_date = Date(12, 31, self.is_leap_year)
-        else:
-            if end_date.leap_year is not self.is_leap_year:
-                end_date = Date(end_date.month, end_date.day, self.is_leap_year)
-        assert start_date <= end_date, 'ScheduleFixedInterval values_at_timestep()' \
-            'start_date must come before end_date. {} comes after {}.'.format(
-                start_date, end_date)
-
-        # convert the schedule's values to the desired timestep
-        timestep = int_in_range(timestep, 1, 60, 'schedule timestep')
-        assert timestep in self.VALIDTIMESTEPS, 'ScheduleFixedInterval timestep ' \
-            '"{}" is invalid. Must be one of the following:\n{}'.format(
-                timestep, self.VALIDTIMESTEPS)
-        if timestep == self.timestep:
-            vals_at_step = list(self._values)
-        elif timestep < self.timestep:
-            assert self.timestep % timestep == 0, \
-                'Schedule timestep({}) must be enenly divisable by target timestep({})' \
-                .format(self.timestep, timestep)
-            vals_at_step = []
-            ind = 0
-            step_ratio = self.timestep / timestep
-            for i in xrange(int(len(self._values) / step_ratio)):
-                vals_at_step.append(self._values[int(ind)])
-                ind += step_ratio
-        else:
-            assert timestep % self.timestep == 0, \
-                'Target timestep({}) must be evenly divisable by schedule timestep({})' \
-                .format(timestep, self.timestep)
-            vals_at_step = []
-            if self.interpolate:
-                data_len = len(self._values)
-                for d in xrange(data_len):
-                    for _v in self._xxrange(self[d], self[(d + 1) % data_len], timestep):
-                        vals_at_step.append(_v)
-            else:
-                n_step = int(timestep / self.timestep)
-                for val in self._values:
-                    for stp in xrange(n_step):
-                        vals_at_step.append(val)
-
-        # build up the full list of values accounting for start and end dates
-        end_dt = self.end_date_time
-        if self.start_date.doy <= end_dt.doy:
-            start_filler = []
-            end_filler = []
-            if start_date < self.start_date:
-                num_vals = int((self.start_date.doy - start_date.doy) * 24 * timestep)
-                start_filler = [self.placeholder_value for i in xrange(num_vals)]
-            elif start_date > self.start_date:
-                start_i = int((start_date.doy - self.start_date.doy) * 24 * timestep)
-                vals_at_step = vals_at_step[start_i:]
-            if ((end_dt.int_hoy + 1) / 24) < end_date.doy:
-                num_vals = int((end_date.doy * 24 * timestep) - 1
-                               - (end_dt.hoy * timestep))
-                end_filler = [self.placeholder_value for i in xrange(num_vals)]
-            elif ((end_dt.int_hoy + 1) / 24) > end_date.doy:
-                end_diff = int((end_dt.hoy * timestep) - (end_date.doy * 24 * timestep))
-                end_i = len(vals_at_step) - end_diff - 1
-                vals_at_step = vals_at_step[:end_i]
-            return start_filler + vals_at_step + end_filler
-        else:
-            n_dpy = 365 if not self.is_leap_year else 366
-            start_yr_i = int((n_dpy - self.start_date.doy + 1) * 24 * timestep)
-            n_mid = (8760 * timestep) - len(vals_at_step)
-            end_vals = vals_at_step[:start_yr_i]
-            start_vals = vals_at_step[start_yr_i:]
-            mid_vals = [self.placeholder_value for i in xrange(n_mid)]
-            all_vals = start_vals + mid_vals + end_vals
-            start_i = (start_date.doy - 1) * 24 * timestep
-            end_i = end_date.doy * 24 * timestep
-            return all_vals[start_i:end_i]
+        if not self._locked:
+            return self._values_at_timestep(timestep, start_date, end_date)
+        cache_key = (timestep, start_date, end_date)
+        values = self._values_cache.get(cache_key)
+        if values is None:
+            values = self._values_at_timestep(timestep, start_date, end_date)
+            self._values_cache.set(cache_key, values)
+        return values
 
     def data_collection_at_timestep(
             self, timestep=1, start_date=Date(1, 1), end_date=Date(12, 31)):
@@ -340,6 +299,21 @@ class ScheduleFixedInterval(object):
             type_idf_string: An optional text string for the ScheduleTypeLimits.
                 If None, the resulting schedule will have no ScheduleTypeLimit.
         """
+        return cls._from_idf(idf_string, type_idf_string)
+
+    @classmethod
+    def _from_idf(cls, idf_string, type_idf_string=None, csv_data=None):
+        """Create a ScheduleFixedInterval from IDF text, sharing parsed CSV files.
+
+        Args:
+            idf_string: A text string fully describing an EnergyPlus Schedule:File.
+            type_idf_string: An optional text string for the ScheduleTypeLimits.
+            csv_data: An optional dictionary that is shared between several calls
+                to this method in order to parse each CSV column only once. The
+                dictionary has the absolute path of each file as keys and
+                dictionaries of parsed columns as values. It can be pre-filled with
+                the _csv_data method in order to read each file only once.
+        """
         # process the schedule inputs
         sch_fields = parse_idf_string(idf_string, 'Schedule:File')
         schedule_type = ScheduleTypeLimit.from_idf(type_idf_string) if type_idf_string \
@@ -351,12 +325,16 @@ class ScheduleFixedInterval(object):
         # load the data from the CSV file referenced in the string
         assert os.path.isfile(sch_fields[2]), \
             'CSV Schedule:File "{}" was not found on this system.'.format(sch_fields[2])
-        all_data = csv_to_matrix(sch_fields[2])
-        transposed_data = tuple(zip(*all_data))
-        csv_data = (float(x) for x in
-                    transposed_data[int(sch_fields[3]) - 1][int(sch_fields[4]):])
-
-        return cls(sch_fields[0], csv_data, schedule_type, timestep, start_date,
+        csv_data = {} if csv_data is None else csv_data
+        file_key, col_key = cls._csv_column_key(sch_fields)
+        columns = csv_data.setdefault(file_key, {})
+        try:
+            values = columns[col_key]
+        except KeyError:  # the column has not yet been parsed
+            columns.update(cls._csv_column_values(sch_fields[2], (col_key,)))
+            values = columns[col_key]
+
+        return cls(sch_fields[0], values, schedule_type, timestep, start_date,
                    0, interpolate)
 
     @classmethod
@@ -428,17 +406,15 @@ class ScheduleFixedInterval(object):
                 describing this schedule.
         """
         # gather all of the data to be written into the CSV
-        sched_data = [str(val) for val in self.values_at_timestep(self.timestep)]
+        sched_data = (str(val) for val in self._iter_values_at_timestep(self.timestep))
         if include_datetimes:
-            sched_a_per = AnalysisPeriod(timestep=self.timestep,
-                                         is_leap_year=self.is_leap_year)
-            sched_data = ('{},{}'.format(dt, val) for dt, val in
-                          zip(sched_a_per.datetimes, sched_data))
+            sched_data = ('{},{}'.format(dt, val) for dt, val in zip(
+                self._iter_datetimes(self.timestep, self.is_leap_year), sched_data))
         file_path = os.path.join(schedule_directory,
                                  '{}.csv'.format(self.name.replace(' ', '_')))
 
         # write the data into the file
-        write_to_file(file_path, ',\n'.join(sched_data), True)
+        self._write_csv_rows(file_path, sched_data)
 
         # generate the IDF strings
         shc_typ = self._schedule_type_limit.name if \
@@ -498,7 +474,8 @@ class ScheduleFixedInterval(object):
         base = {'type': 'ScheduleFixedInterval'} if not \
             abridged else {'type': 'ScheduleFixedIntervalAbridged'}
         base['name'] = self.name
-        base['values'] = self.values
+        base['values'] = self._values if isinstance(self._values, tuple) \
+            else self._values.tolist()
 
         # optional properties
         base['timestep'] = self.timestep
@@ -518,6 +495,11 @@ class ScheduleFixedInterval(object):
         """Get a copy of this object."""
         return self.__copy__()
 
+    def unlock(self):
+        """Unlock the schedule and discard any values in the values_cache."""
+        self._locked = False
+        self._values_cache.clear()
+
     @staticmethod
     def to_idf_collective_csv(schedules, schedule_directory, file_name,
                               include_datetimes=False):
@@ -553,19 +535,19 @@ class ScheduleFixedInterval(object):
         max_timestep = max([sched.timestep for sched in schedules])
         # gather all of the data to be written into the CSV
         sch_names = [sched.name for sched in schedules]
-        sched_vals = [sched.values_at_timestep(max_timestep) for sched in schedules]
-        sched_data = [','.join([str(x) for x in row]) for row in zip(*sched_vals)]
+        sched_vals = [sched._iter_values_at_timestep(max_timestep) for sched in schedules]
+        sched_data = (','.join(map(str, row)) for row in zip(*sched_vals))
         if include_datetimes:
-            sched_a_per = AnalysisPeriod(timestep=max_timestep, is_leap_year=init_lp_yr)
-            sched_data = ('{},{}'.format(dt, val) for dt, val in
-                          zip(sched_a_per.datetimes, sched_data))
+            sched_data = ('{},{}'.format(dt, val) for dt, val in zip(
+                ScheduleFixedInterval._iter_datetimes(max_timestep, init_lp_yr),
+                sched_data))
             sch_names = [''] + sch_names
-        sched_data = [','.join(sch_names)] + sched_data
+        sched_data = chain((','.join(sch_names),), sched_data)
         file_path = os.path.join(schedule_directory,
                                  '{}.csv'.format(file_name.replace(' ', '_')))
 
         # write the data into the file
-        write_to_file(file_path, ',\n'.join(sched_data), True)
+        ScheduleFixedInterval._write_csv_rows(file_path, sched_data)
 
         # generate the IDF strings
         schedule_files = []
@@ -590,25 +572,25 @@ class ScheduleFixedInterval(object):
             idf_file: A path to an IDF file containing objects for Schedule:File
                 which should have correct file paths to CSVs storing the schedule
                 values.
+                This can also be a dictionary of IDF objects from the
+                reader.parse_idf_file method.
 
         Returns:
             schedules: A list of all Schedule:File objects in the IDF file as
                 honeybee_energy ScheduleFixedInterval objects.
         """
-        # check the file
-        assert os.path.isfile(idf_file), 'Cannot find an idf file at {}'.format(idf_file)
-        with open(idf_file, 'r') as ep_file:
-            file_contents = ep_file.read()
-
+        # parse the file into a dictionary of objects
+        idf_objects = idf_file if isinstance(idf_file, dict) else \
+            parse_idf_file(idf_file)
         # extract all of the ScheduleTypeLimit objects
-        type_pattern = re.compile(r"(?i)(ScheduleTypeLimits,[\s\S]*?;)")
-        sch_type_str = type_pattern.findall(file_contents)
+        sch_type_str = idf_objects_by_type(idf_objects, 'ScheduleTypeLimits')
         sch_type_dict = ScheduleFixedInterval._idf_schedule_type_dictionary(sch_type_str)
         # extract all of the Schedule:File objects and convert to Schedule
         schedules = []
-        sch_pattern = re.compile(r"(?i)(Schedule:File,[\s\S]*?;)")
-        for sch_string in sch_pattern.findall(file_contents):
-            schedule = ScheduleFixedInterval.from_idf(sch_string)
+        sch_strings = idf_objects_by_type(idf_objects, 'Schedule:File')
+        csv_data = ScheduleFixedInterval._csv_data(sch_strings)  # read each CSV once
+        for sch_string in sch_strings:
+            schedule = ScheduleFixedInterval._from_idf(sch_string, csv_data=csv_data)
             sch_props = parse_idf_string(sch_string)
             if sch_props[1] != '':
                 schedule.schedule_type_limit = sch_type_dict[sch_props[1]]
@@ -671,19 +653,118 @@ class ScheduleFixedInterval(object):
                                     'ScheduleFixedInterval.average_schedules.'.format(
                                         type(sched)))
 
-        sch_vals = [sum([val * weights[i] for i, val in enumerate(values)])
-                    for values in zip(*all_values)]
+        # compute the weighted sum of each timestep across all of the schedules
+        sch_vals = tuple([sum(map(mul, values, weights))
+                          for values in zip(*all_values)])
 
         # return the final schedule
         return ScheduleFixedInterval(name, sch_vals, schedules[0].schedule_type_limit,
                                      timestep, start_date=Date(1, 1, lp_yr))
 
+    def _values_at_timestep(self, timestep=1, start_date=None, end_date=None):
+        """Compute a list of sequential schedule values at a given timestep."""
+        return list(self._iter_values_at_timestep(timestep, start_date, end_date))
+
+    def _iter_values_at_timestep(self, timestep=1, start_date=None, end_date=None):
+        """Get an iterator over sequential schedule values at a given timestep.
+
+        No list of the values is built in the process such that several schedules
+        can be streamed into a file alongside one another.
+        """
+        # ensure that the input start_date and end_date are valid
+        if start_date is None:
+            start_date = Date(1, 1, self.is_leap_year)
+        else:
+            if start_date.leap_year is not self.is_leap_year:
+                start_date = Date(start_date.month, start_date.day, self.is_leap_year)
+        if end_date is None:
+            end_date = Date(12, 31, self.is_leap_year)
+        else:
+            if end_date.leap_year is not self.is_leap_year:
+                end_date = Date(end_date.month, end_date.day, self.is_leap_year)
+        assert start_date <= end_date, 'ScheduleFixedInterval values_at_timestep()' \
+            'start_date must come before end_date. {} comes after {}.'.format(
+                start_date, end_date)
+
+        # convert the schedule's values to the desired timestep
+        timestep = int_in_range(timestep, 1, 60, 'schedule timestep')
+        assert timestep in self.VALIDTIMESTEPS, 'ScheduleFixedInterval timestep ' \
+            '"{}" is invalid. Must be one of the following:\n{}'.format(
+                timestep, self.VALIDTIMESTEPS)
+        vals_at_step, num_vals_at_step = self._resample_values(timestep)
+
+        # build up the full sequence of values accounting for start and end dates
+        end_dt = self.end_date_time
+        if self.start_date.doy <= end_dt.doy:
+            num_start_vals, start_i, end_i = 0, 0, num_vals_at_step
+            if start_date < self.start_date:
+                num_start_vals = int((self.start_date.doy - start_date.doy) *
+                                     24 * timestep)
+            elif start_date > self.start_date:
+                start_i = min(int((start_date.doy - self.start_date.doy) *
+                                  24 * timestep), end_i)
+            num_end_vals = 0
+            if ((end_dt.int_hoy + 1) / 24) < end_date.doy:
+                num_end_vals = int((end_date.doy * 24 * timestep) - 1
+                                   - (end_dt.hoy * timestep))
+            elif ((end_dt.int_hoy + 1) / 24) > end_date.doy:
+                end_diff = int((end_dt.hoy * timestep) - (end_date.doy * 24 * timestep))
+                num_vals = end_i - start_i - end_diff - 1
+                if num_vals < 0:  # count back from the end like a slice
+                    num_vals = max(end_i - start_i + num_vals, 0)
+                end_i = min(start_i + num_vals, end_i)
+            return chain(repeat(self.placeholder_value, num_start_vals),
+                         islice(vals_at_step, start_i, end_i),
+                         repeat(self.placeholder_value, num_end_vals))
+        else:
+            n_dpy = 365 if not self.is_leap_year else 366
+            start_yr_i = int((n_dpy - self.start_date.doy + 1) * 24 * timestep)
+            n_mid = (8760 * timestep) - num_vals_at_step
+            all_vals = chain(islice(vals_at_step, start_yr_i, None),
+                             repeat(self.placeholder_value, max(n_mid, 0)),
+                             islice(self._resample_values(timestep)[0], start_yr_i))
+            start_i = (start_date.doy - 1) * 24 * timestep
+            end_i = end_date.doy * 24 * timestep
+            return islice(all_vals, start_i, end_i)
+
+    def _resample_values(self, timestep):
+        """Get an iterable of the schedule's values at a given timestep and its length.
+
+        The schedule's own values are returned without copying them when the
+        timestep matches that of the schedule. Otherwise, the values are resampled
+        lazily as the returned iterator is consumed.
+        """
+        if timestep == self.timestep:
+            return self._values, len(self._values)
+        elif timestep < self.timestep:
+            assert self.timestep % timestep == 0, \
+                'Schedule timestep({}) must be enenly divisable by target timestep({})' \
+                .format(self.timestep, timestep)
+            step_ratio = self.timestep // timestep
+            num_vals = len(self._values) // step_ratio
+            return islice(self._values, 0, num_vals * step_ratio, step_ratio), num_vals
+        else:
+            assert timestep % self.timestep == 0, \
+                'Target timestep({}) must be evenly divisable by schedule timestep({})' \
+                .format(timestep, self.timestep)
+            data_len = len(self._values)
+            if self.interpolate:
+                return (_v for d in xrange(data_len) for _v in self._xxrange(
+                    self._values[d], self._values[(d + 1) % data_len], timestep)), \
+                    data_len * timestep
+            else:
+                n_step = timestep // self.timestep
+                return chain.from_iterable(repeat(val, n_step) for val in self._values), \
+                    data_len * n_step
+
     def _check_values(self, values):
         """Check values whenever they come through the values setter."""
         assert isinstance(values, Iterable) and not \
             isinstance(values, (str, dict, bytes, bytearray)), \
             'values should be a list or tuple. Got {}'.format(type(values))
-        if not isinstance(values, tuple):
+        if isinstance(values, array):
+            values = array('d', values)  # copy such that the input can be edited
+        elif not isinstance(values, tuple):
             try:
                 values = tuple(float(val) for val in values)
             except (ValueError, TypeError):
@@ -711,6 +792,146 @@ class ScheduleFixedInterval(object):
         _step = (end - start) / float(step_count)
         return (start + (i * _step) for i in xrange(int(step_count)))
 
+    @staticmethod
+    def _write_csv_rows(file_path, rows, chunk_size=1000):
+        """Write rows of text into a CSV file with a limited number of rows in memory.
+
+        Args:
+            file_path: Path to the CSV file, which will be overwritten if it exists.
+                The folder of the file will be created if it does not exist.
+            rows: An iterable of text strings for each row of the file. Rows are
+                separated with ',\\n' in the resulting file.
+            chunk_size: An integer for the number of rows to be joined together
+                and written to the file at once. Default: 1000.
+        """
+        folder = os.path.dirname(file_path)
+        if folder != '' and not os.path.isdir(folder):
+            preparedir(folder)
+        rows = iter(rows)
+        with open(file_path, writemode) as csv_file:
+            chunk = list(islice(rows, chunk_size))
+            csv_file.write(',\n'.join(chunk))
+            while len(chunk) == chunk_size:
+                chunk = list(islice(rows, chunk_size))
+                if len(chunk) != 0:
+                    csv_file.write(',\n')
+                    csv_file.write(',\n'.join(chunk))
+        return file_path
+
+    @staticmethod
+    def _iter_datetimes(timestep, leap_year=False):
+        """Get an iterator over the DateTimes of a year at a given timestep.
+
+        The DateTimes match those of an annual AnalysisPeriod without building
+        the AnalysisPeriod's full list of DateTimes.
+        """
+        minute_delta = 60 // timestep
+        n_steps = 8760 * timestep if not leap_year else 8784 * timestep
+        return (DateTime.from_moy(moy, leap_year)
+                for moy in xrange(0, n_steps * minute_delta, minute_delta))
+
+    @classmethod
+    def _csv_column_key(cls, sch_fields):
+        """Get the file key and column key of the CSV column used by a Schedule:File.
+
+        Args:
+            sch_fields: A list of the parsed fields of a Schedule:File.
+
+        Returns:
+            A tuple with the absolute path to the CSV file and a tuple of the
+            (column, skip_rows, separator) of the schedule values within the file.
+        """
+        try:
+            separator = cls._schedule_file_separators[sch_fields[6].lower()]
+        except KeyError:
+            raise ValueError(
+                'Schedule:File column separator "{}" is not valid. Choose from: '
+                'Comma, Tab, Space, Semicolon.'.format(sch_fields[6]))
+        col_key = (int(sch_fields[3]), int(sch_fields[4]), separator)
+        return os.path.abspath(sch_fields[2]), col_key
+
+    @classmethod
+    def _csv_data(cls, sch_strings):
+        """Parse all CSV columns referenced by Schedule:File strings.
+
+        Each CSV file is read once no matter how many of its columns are used.
+
+        Args:
+            sch_strings: A list of text strings for EnergyPlus Schedule:File objects.
+
+        Returns:
+            A dictionary with the absolute path of each CSV file as keys and
+            dictionaries of parsed column values as values, which can be used as
+            the csv_data input of the _from_idf method.
+        """
+        col_keys = {}
+        for sch_string in sch_strings:
+            sch_fields = parse_idf_string(sch_string, 'Schedule:File')
+            file_key, col_key = cls._csv_column_key(sch_fields)
+            col_keys.setdefault(file_key, set()).add(col_key)
+        return {file_key: cls._csv_column_values(file_key, keys)
+                for file_key, keys in col_keys.items() if os.path.isfile(file_key)}
+
+    @staticmethod
+    def _csv_column_values(file_path, col_keys):
+        """Get arrays of float values from several columns of a CSV file.
+
+        The file is memory-mapped and read one line at a time. Each line is only
+        split as far as the requested columns such that the whole file is never
+        held in memory.
+
+        Args:
+            file_path: Path to the CSV file.
+            col_keys: A list of (column, skip_rows, separator) tuples for the columns
+                to be parsed. The column is an integer starting from 1, skip_rows
+                is an integer for the number of rows to skip at the top and the
+                separator is bytes for the column separator (eg. b',').
+
+        Returns:
+            A dictionary with the col_keys as keys and arrays of doubles as values.
+        """
+        # group the columns that share the same skipped rows and separator
+        col_groups = {}
+        for column, skip_rows, separator in col_keys:
+            col_groups.setdefault((skip_rows, separator), set()).add(column)
+        col_groups = [(skip, sep, sorted(cols), itemgetter(*[c - 1 for c in cols]))
+                      for (skip, sep), cols in col_groups.items()]
+        group_rows = [[] for _ in col_groups]
+
+        # parse the values of each line from the memory-mapped file
+        with open(file_path, 'rb') as csv_file:
+            try:
+                csv_map = mmap.mmap(csv_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file that cannot be mapped
+                csv_map = None
+            if csv_map is not None:
+                try:
+                    for i, line in enumerate(iter(csv_map.readline, b'')):
+                        for (skip_rows, separator, columns, getter), rows in \
+                                zip(col_groups, group_rows):
+                            if i < skip_rows:
+                                continue
+                            vals = getter(line.split(separator, columns[-1]))
+                            rows.append(float(vals) if len(columns) == 1
+                                        else tuple(map(float, vals)))
+                except IndexError:
+                    raise ValueError('CSV Schedule:File "{}" does not have all of the '
+                                     'columns {} in all rows.'.format(
+                                         file_path, [key[0] for key in col_keys]))
+                finally:
+                    csv_map.close()
+
+        # transpose the parsed rows into the values of each column
+        col_values = {}
+        for (skip_rows, separator, columns, _), rows in zip(col_groups, group_rows):
+            if len(columns) == 1:
+                columns_vals = (rows,)
+            else:
+                columns_vals = zip(*rows) if rows else [()] * len(columns)
+            for column, values in zip(columns, columns_vals):
+                col_values[(column, skip_rows, separator)] = array('d', values)
+        return col_values
+
     @staticmethod
     def _idf_schedule_type_dictionary(type_idf_strings):
         """Get a dictionary of ScheduleTypeLimit objects from ScheduleTypeLimits strings.
@@ -735,7 +956,7 @@ class ScheduleFixedInterval(object):
         """A tuple based on the object properties, useful for hashing."""
         return (self.name, self._placeholder_value, self._interpolate,
                 self._timestep, hash(self._start_date),
-                hash(self.schedule_type_limit)) + self._values
+                hash(self.schedule_type_limit)) + tuple(self._values)
 
     def __hash__(self):
         return hash(self.__key())
@@ -5,7 +5,8 @@ from __future__ import division
 from .day import ScheduleDay
 from .rule import ScheduleRule
 from .typelimit import ScheduleTypeLimit
-from ..reader import parse_idf_string
+from ._valuescache import ValuesCache
+from ..reader import parse_idf_string, parse_idf_file, idf_objects_by_type
 from ..writer import generate_idf_string
 
 import honeybee_energy.lib.scheduletypelimits as _type_lib
@@ -19,8 +20,8 @@ from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.dt import Date
 from ladybug.datatype.generic import GenericType
 
-import re
-import os
+from calendar import isleap
+from datetime import date
 
 
 @lockable
@@ -37,10 +38,11 @@ class ScheduleRuleset(object):
         day_schedules
         is_constant
         is_single_week
+        values_cache
     """
     __slots__ = ('_name', '_default_day_schedule', '_summer_designday_schedule',
                  '_winter_designday_schedule', '_schedule_rules',
-                 '_schedule_type_limit', '_locked')
+                 '_schedule_type_limit', '_rule_index', '_values_cache', '_locked')
     _dow_text_to_int = {'sunday': 1, 'monday': 2, 'tuesday': 3, 'wednesday': 4,
                         'thursday': 2, 'friday': 3, 'saturday': 7}
     _standards_gem_day_types = {
@@ -73,6 +75,8 @@ class ScheduleRuleset(object):
                 the winter design day (used to size the heating system).
         """
         self._locked = False  # unlocked by default
+        self._rule_index = {}  # index of the rules applied on each day of the year
+        self._values_cache = ValuesCache()  # cache of values used while locked
         self.name = name
         self.default_day_schedule = default_day_schedule
         self.schedule_rules = schedule_rules
@@ -117,6 +121,7 @@ class ScheduleRuleset(object):
     @schedule_rules.setter
     def schedule_rules(self, rules):
         self._schedule_rules = self._check_schedule_rules(rules)
+        self._rule_index.clear()
 
     @property
     def schedule_type_limit(self):
@@ -198,6 +203,15 @@ class ScheduleRuleset(object):
             return True
         return False
 
+    @property
+    def values_cache(self):
+        """Get the ValuesCache with the annual values computed while this is locked.
+
+        The cache has hits and misses properties that can be used to evaluate
+        how often the values of the locked schedule are re-used.
+        """
+        return self._values_cache
+
     def add_rule(self, rule):
         """Add a ScheduleRule to this ScheduleRuleset.
 
@@ -211,6 +225,8 @@ class ScheduleRuleset(object):
         self._check_rule(rule)
         self._check_schedule_parent(rule.schedule_day, 'schedule_rule')
         self._schedule_rules.insert(0, rule)
+        self._rule_index.clear()
+        self._values_cache.clear()
 
     def remove_rule(self, rule_index):
         """Remove a ScheduleRule from the schedule by its index in schedule_rules.
@@ -220,6 +236,8 @@ class ScheduleRuleset(object):
         """
         self._schedule_rules[rule_index].schedule_day._parent = None
         del self._schedule_rules[rule_index]
+        self._rule_index.clear()
+        self._values_cache.clear()
 
     def reorder_rule(self, rule_index, new_index=0):
         """Change the priority of a ScheduleRule in the full schedule_rules list.
@@ -234,15 +252,20 @@ class ScheduleRuleset(object):
                 priority list.
         """
         self._schedule_rules.insert(new_index, self._schedule_rules.pop(rule_index))
+        self._rule_index.clear()
+        self._values_cache.clear()
 
     def values(self, timestep=1, start_date=Date(1, 1), end_date=Date(12, 31),
-               start_dow='Sunday', holidays=None, leap_year=False):
+               start_dow='Sunday', holidays=None, leap_year=False, years=None):
         """Get a list of sequential schedule values over the year at a given timestep.
 
         Note that there are two possible ways that these values can be mapped to
         corresponding times. See the ScheduleDay.values_at_timestep method
         documentation for a complete description of these two interpretations.
 
+        While the schedule is locked, the values are stored in the values_cache
+        such that requesting the same values again does not recompute them.
+
         Args:
             timestep: An integer for the number of steps per hour at which to return
                 the resulting values.
@@ -254,43 +277,58 @@ class ScheduleRuleset(object):
                 Default: Sunday.
             holidays: An optional list of ladybug Date objects for the holidays. For
                 any holiday in this list, schedule rules set to apply_holiday will
-                take effect.
+                take effect. When years are specified, these holidays occur in every
+                year and this list can also include datetime.date objects for
+                holidays that only occur in a specific calendar year.
             leap_year: Boolean to note whether the generated values should be for a
                 leap year (True) or a non-leap year (False). Default: False.
+            years: An optional list of sorted, consecutive integers for calendar
+                years over which the values will be generated in one contiguous
+                list (eg. range(2020, 2051)).
+                In this case, the start_date is in the first year, the end_date is in
+                the last year and the start_dow and leap_year inputs are ignored in
+                favor of the real calendar of each year. If None, values are only
+                generated for a single year. Default: None.
         """
+        # check whether the values have already been computed for the locked schedule
+        if holidays is not None:
+            holidays = tuple(holidays)
+        if years is not None:
+            years = tuple(years)
+        if self._locked:
+            cache_key = (timestep, start_date, end_date, start_dow.lower(),
+                         holidays, leap_year, years, self._values_key())
+            values = self._values_cache.get(cache_key)
+            if values is not None:
+                return values
         # get the values over the day for each of the ScheduleDay objects
         sch_day_vals = [rule.schedule_day.values_at_timestep(timestep)
                         for rule in self._schedule_rules]
         sch_day_vals.append(self.default_day_schedule.values_at_timestep(timestep))
-        # ensure that everything is consistent across leap years
-        if start_date.leap_year is not leap_year:
-            start_date = Date(start_date.month, start_date.day, leap_year)
-        if end_date.leap_year is not leap_year:
-            end_date = Date(end_date.month, end_date.day, leap_year)
-        # ensure start date is before end date
-        assert start_date <= end_date, 'ScheduleRuleset values() start_date must come ' \
-            'before end_date. {} comes after {}.'.format(start_date, end_date)
-        # process the holidays if they are input
-        if holidays is not None:
-            hol_doy = []
-            for hol in holidays:
-                if hol.leap_year is not leap_year:
-                    hol = Date(hol.month, hol.day, leap_year)
-                hol_doy.append(hol.doy)
-        else:
-            hol_doy = []
-        # process the start_dow into an integer.
-        dow = self._dow_text_to_int[start_dow.lower()]
-        # generate the full list of annual values
-        if not leap_year:
-            return self._get_sch_values(
-                sch_day_vals, dow, start_date, end_date, hol_doy)
-        else:
-            return self._get_sch_values_leap_year(
-                sch_day_vals, dow, start_date, end_date, hol_doy)
+        if years is not None:  # generate the values over several calendar years
+            values = self._get_multi_year_values(
+                sch_day_vals, start_date, end_date, holidays, years)
+        else:  # generate the values over a single typical year
+            # ensure that everything is consistent across leap years
+            if start_date.leap_year is not leap_year:
+                start_date = Date(start_date.month, start_date.day, leap_year)
+            if end_date.leap_year is not leap_year:
+                end_date = Date(end_date.month, end_date.day, leap_year)
+            # ensure start date is before end date
+            assert start_date <= end_date, 'ScheduleRuleset values() start_date must ' \
+                'come before end_date. {} comes after {}.'.format(start_date, end_date)
+            # process the holidays and the start_dow into doy integers
+            hol_doy = self._holiday_doys(holidays, leap_year)
+            dow = self._dow_text_to_int[start_dow.lower()]
+            # generate the full list of annual values
+            values = self._get_sch_values(
+                sch_day_vals, dow, start_date, end_date, hol_doy, leap_year)
+        if self._locked:
+            self._values_cache.set(cache_key, values)
+        return values
 
     def data_collection(self, timestep=1, start_date=Date(1, 1), end_date=Date(12, 31),
-                        start_dow='Sunday', holidays=None, leap_year=False):
+                        start_dow='Sunday', holidays=None, leap_year=False, years=None):
         """Get a ladybug DataCollection representing this schedule at a given timestep.
 
         Note that ladybug DataCollections always follow the "Ladybug Tools
@@ -308,22 +346,45 @@ class ScheduleRuleset(object):
                 Default: Sunday.
             holidays: An optional list of ladybug Date objects for the holidays. For
                 any holiday in this list, schedule rules set to apply_holiday will
-                take effect.
+                take effect. When years are specified, this list can also include
+                datetime.date objects for holidays in a specific calendar year.
             leap_year: Boolean to note whether the generated values should be for a
                 leap year (True) or a non-leap year (False). Default: False.
+            years: An optional list of integers for calendar years over which the
+                schedule will be evaluated (eg. range(2020, 2051)). Since each
+                DataCollection can only cover a single year, a list of DataCollections
+                with one for each year is returned in this case. See the values
+                method for a full description. Default: None.
         """
-        a_period = AnalysisPeriod(start_date.month, start_date.day, 0,
-                                  end_date.month, end_date.day, 23, timestep, leap_year)
         if self.schedule_type_limit is not None:
             data_type = self.schedule_type_limit.data_type
             unit = self.schedule_type_limit.unit
         else:
             unit = 'unknown'
             data_type = GenericType('Unknown Data Type', unit)
-        header = Header(data_type, unit, a_period, metadata={'schedule': self.name})
         values = self.values(timestep, start_date, end_date, start_dow,
-                             holidays, leap_year)
-        return HourlyContinuousCollection(header, values)
+                             holidays, leap_year, years)
+        if years is None:
+            a_period = AnalysisPeriod(start_date.month, start_date.day, 0, end_date.month,
+                                      end_date.day, 23, timestep, leap_year)
+            header = Header(data_type, unit, a_period, metadata={'schedule': self.name})
+            return HourlyContinuousCollection(header, values)
+
+        # split the values of the multiple years into one DataCollection per year
+        years = tuple(years)
+        data_colls = []
+        st_i = 0
+        for i, year in enumerate(years):
+            st_date = start_date if i == 0 else Date(1, 1)
+            end_dt = end_date if i == len(years) - 1 else Date(12, 31)
+            a_period = AnalysisPeriod(st_date.month, st_date.day, 0, end_dt.month,
+                                      end_dt.day, 23, timestep, isleap(year))
+            end_i = st_i + len(a_period)
+            header = Header(data_type, unit, a_period,
+                            metadata={'schedule': self.name, 'year': str(year)})
+            data_colls.append(HourlyContinuousCollection(header, values[st_i:end_i]))
+            st_i = end_i
+        return data_colls
 
     @classmethod
     def from_constant_value(cls, name, value, schedule_type_limit=None):
@@ -701,6 +762,23 @@ class ScheduleRuleset(object):
                 referenced in the year_schedule. Will be None when year_schedule is
                 a Schedule:Constant.
         """
+        return self._to_idf()
+
+    def _to_idf(self, day_idf_names=None, week_idf_names=None, shared_indices=None):
+        """Get the IDF strings of the schedule, optionally sharing day and week schedules.
+
+        Args:
+            day_idf_names: An optional dictionary of ScheduleDay content keys and the
+                names of the Schedule:Day objects that are written to the IDF in their
+                place. (See _idf_shared_day_schedules).
+            week_idf_names: An optional dictionary of tuples of the day names in each
+                Schedule:Week:Daily and the name of the week schedule already written
+                to the IDF with those days. Week schedules found in the dictionary are
+                referenced instead of being written again and new week schedules are
+                added to the dictionary.
+            shared_indices: An optional dictionary of rule indices that is shared
+                between several schedules. (See _get_rule_index).
+        """
         # beginning fields used for all schedules
         year_fields = [self.name]
         shc_typ = self._schedule_type_limit.name if \
@@ -720,51 +798,33 @@ class ScheduleRuleset(object):
         date_comments = ['start month {}', 'start day {}', 'end month {}', 'end day {}']
         week_schedules = []
 
+        day_names = self._get_day_names(day_idf_names)
+        extra_fields = self._get_extra_week_fields(day_idf_names)
+        week_list_map = week_idf_names if week_idf_names is not None else {}
         if self.is_single_week:  # create the only one week schedule
-            wk_sch, wk_sch_name = \
-                self._idf_week_schedule_from_rule_indices(range(len(self)), 1)
-            week_schedules.append(wk_sch)
-            yr_wk_s_names = [wk_sch_name]
-            yr_wk_dt_range = [[Date(1, 1), Date(12, 31)]]
+            rule_periods = self._get_rule_index(False, shared_indices)[0][:1]
         else:  # create a set of week schedules throughout the year
-            # loop through 365 days of the year to find unique combinations of rules
-            rules_each_day = []
-            for doy in range(1, 366):
-                rules_on_doy = tuple(i for i, rule in enumerate(self._schedule_rules)
-                                     if rule._start_doy <= doy <= rule._end_doy)
-                rules_each_day.append(rules_on_doy)
-            unique_rule_sets = set(rules_each_day)
-            # check if any combination yield the same week schedule and remove duplicates
-            week_tuples = [tuple(self._get_week_list(rule_set))
-                           for rule_set in unique_rule_sets]
-            unique_week_tuples = list(set(week_tuples))
-            # create the unique week schedules from the combinations of rules
-            week_sched_names = []
-            for i, week_list in enumerate(unique_week_tuples):
-                wk_schedule, wk_sch_name = \
-                    self._idf_week_schedule_from_week_list(week_list, i + 1)
+            rule_periods = self._get_rule_index(False, shared_indices)[0]
+
+        # loop through the periods of the year in which different rules apply
+        yr_wk_s_names = []
+        yr_wk_dt_range = []
+        for st_doy, end_doy, week_rules in rule_periods:
+            week_list = tuple([day_names[i] for i in week_rules]) + extra_fields
+            try:  # check if the rules yield an existing week schedule
+                wk_sch_name = week_list_map[week_list]
+            except KeyError:  # create a new week schedule
+                wk_schedule, wk_sch_name = self._idf_week_schedule_from_week_list(
+                    week_list, len(week_schedules) + 1)
                 week_schedules.append(wk_schedule)
-                week_sched_names.append(wk_sch_name)
-            # create a disctionary mapping unique rule index lists to week schedule names
-            rule_set_map = {}
-            for rule_i, week_list in zip(unique_rule_sets, week_tuples):
-                unique_week_i = unique_week_tuples.index(week_list)
-                rule_set_map[rule_i] = week_sched_names[unique_week_i]
-            # loop through all 365 days of the year to find when rules change
-            yr_wk_s_names = []
-            yr_wk_dt_range = []
-            prev_week_sched = None
-            for doy in range(1, 366):
-                week_sched = rule_set_map[rules_each_day[doy - 1]]
-                if week_sched != prev_week_sched:  # change to a new rule set
-                    yr_wk_s_names.append(week_sched)
-                    if doy != 1:
-                        yr_wk_dt_range[-1].append(Date.from_doy(doy - 1))
-                        yr_wk_dt_range.append([Date.from_doy(doy)])
-                    else:
-                        yr_wk_dt_range.append([Date(1, 1)])
-                    prev_week_sched = week_sched
-            yr_wk_dt_range[-1].append(Date(12, 31))
+                week_list_map[week_list] = wk_sch_name
+            if len(yr_wk_s_names) != 0 and yr_wk_s_names[-1] == wk_sch_name:
+                yr_wk_dt_range[-1][1] = Date.from_doy(end_doy)
+            else:  # change to a new week schedule
+                yr_wk_s_names.append(wk_sch_name)
+                yr_wk_dt_range.append([Date.from_doy(st_doy), Date.from_doy(end_doy)])
+        if self.is_single_week:
+            yr_wk_dt_range = [[Date(1, 1), Date(12, 31)]]
 
         # create the year fields and comments
         for i, (wk_sch_name, dt_range) in enumerate(zip(yr_wk_s_names, yr_wk_dt_range)):
@@ -825,8 +885,12 @@ class ScheduleRuleset(object):
             rule.lock()
 
     def unlock(self):
-        """The unlock() method also unlocks the ScheduleDay and ScheduleRule objects."""
+        """The unlock() method also unlocks the ScheduleDay and ScheduleRule objects.
+
+        Any values in the values_cache are discarded since the schedule may be edited.
+        """
         self._locked = False
+        self._values_cache.clear()
         self._default_day_schedule.unlock()
         if self._summer_designday_schedule is not None:
             self._summer_designday_schedule.unlock()
@@ -835,6 +899,47 @@ class ScheduleRuleset(object):
         for rule in self._schedule_rules:
             rule.unlock()
 
+    @staticmethod
+    def to_idf_collective(schedules):
+        """Get IDF strings for several ScheduleRulesets with equivalent days written once.
+
+        ScheduleDays with the same values, times and interpolation are written into
+        a single Schedule:Day even if they have different names. ScheduleDays that
+        have the same name but different values are written as separate
+        Schedule:Days with a numbered suffix added to the name. Week schedules
+        with the same pattern of days are then also written only once and shared
+        between the Schedule:Year objects of the ScheduleRulesets. This is useful
+        for reducing the size of IDFs in which many schedules have identical
+        profiles (eg. the weekdays of several ProgramTypes).
+
+        Args:
+            schedules: A list of ScheduleRuleset objects to be written into the IDF.
+
+        Returns:
+            year_schedules: A list of text strings for the Schedule:Year (or
+                Schedule:Constant) of each of the input schedules.
+            week_schedules: A list of text strings for all of the unique
+                Schedule:Week:Daily objects referenced by the year_schedules.
+            day_schedules: A list of text strings for all of the unique
+                Schedule:Day:Interval objects referenced by the week_schedules.
+        """
+        # write each unique ScheduleDay and map all equivalent ScheduleDays to it
+        day_schedules, day_idf_names, used_day_names = [], {}, set()
+        for sched in schedules:
+            if not sched.is_constant:  # constant schedules are Schedule:Constant
+                day_schedules.extend(ScheduleRuleset._idf_shared_day_schedules(
+                    sched.day_schedules, day_idf_names, used_day_names))
+
+        # write the year and week schedules referencing the shared days and weeks
+        year_schedules, week_schedules, week_idf_names, rule_indices = [], [], {}, {}
+        for sched in schedules:
+            year_schedule, sch_weeks = \
+                sched._to_idf(day_idf_names, week_idf_names, rule_indices)
+            year_schedules.append(year_schedule)
+            if sch_weeks is not None:
+                week_schedules.extend(sch_weeks)
+        return year_schedules, week_schedules, day_schedules
+
     @staticmethod
     def extract_all_from_idf_file(idf_file):
         """Extract all ScheduleRuleset objects from an EnergyPlus IDF file.
@@ -843,40 +948,35 @@ class ScheduleRuleset(object):
             idf_file: A path to an IDF file containing objects for Schedule:Year and
                 corresponding Schedule:Week and Schedule:Day objects. The Schedule:Year
                 will be used to assemble all of these into a ScheduleRuleset.
+                This can also be a dictionary of IDF objects from the
+                reader.parse_idf_file method.
 
         Returns:
             schedules: A list of all Schedule:Year objects in the IDF file as
                 honeybee_energy ScheduleRuleset objects.
         """
-        # check the file
-        assert os.path.isfile(idf_file), 'Cannot find an idf file at {}'.format(idf_file)
-        with open(idf_file, 'r') as ep_file:
-            file_contents = ep_file.read()
+        # parse the file into a dictionary of objects
+        idf_objects = idf_file if isinstance(idf_file, dict) else \
+            parse_idf_file(idf_file)
         # extract all of the ScheduleDay objects
-        day_pattern1 = re.compile(r"(?i)(Schedule:Day:Interval,[\s\S]*?;)")
-        day_pattern2 = re.compile(r"(?i)(Schedule:Day:Hourly,[\s\S]*?;)")
-        day_pattern3 = re.compile(r"(?i)(Schedule:Day:List,[\s\S]*?;)")
-        day_sch_str = day_pattern1.findall(file_contents) + \
-            day_pattern2.findall(file_contents) + day_pattern3.findall(file_contents)
+        day_sch_str = idf_objects_by_type(
+            idf_objects, 'Schedule:Day:Interval', 'Schedule:Day:Hourly',
+            'Schedule:Day:List')
         day_schedule_dict = ScheduleRuleset._idf_day_schedule_dictionary(day_sch_str)
         # extract all of the Schedule:Week objects
-        week_pattern_1 = re.compile(r"(?i)(Schedule:Week:Daily,[\s\S]*?;)")
-        week_pattern_2 = re.compile(r"(?i)(Schedule:Week:Compact,[\s\S]*?;)")
-        week_sch_str = week_pattern_1.findall(file_contents) + week_pattern_2.findall(file_contents)
+        week_sch_str = idf_objects_by_type(
+            idf_objects, 'Schedule:Week:Daily', 'Schedule:Week:Compact')
         week_sch_dict, week_dd_dict = ScheduleRuleset._idf_week_schedule_dictionary(
             week_sch_str, day_schedule_dict)
         # extract all of the ScheduleTypeLimit objects
-        type_pattern = re.compile(r"(?i)(ScheduleTypeLimits,[\s\S]*?;)")
-        sch_type_str = type_pattern.findall(file_contents)
+        sch_type_str = idf_objects_by_type(idf_objects, 'ScheduleTypeLimits')
         sch_type_dict = ScheduleRuleset._idf_schedule_type_dictionary(sch_type_str)
         # extract all of the Schedule:Year objects and convert to ScheduleRuleset
-        year_pattern = re.compile(r"(?i)(Schedule:Year,[\s\S]*?;)")
-        year_props = tuple(parse_idf_string(idf_string) for
-                           idf_string in year_pattern.findall(file_contents))
+        year_props = tuple(parse_idf_string(idf_string) for idf_string in
+                           idf_objects_by_type(idf_objects, 'Schedule:Year'))
         # extract all of the Schedule:Constant objects and convert to ScheduleRuleset
-        constant_pattern = re.compile(r"(?i)(Schedule:Constant,[\s\S]*?;)")
-        constant_props = tuple(parse_idf_string(idf_string) for
-                               idf_string in constant_pattern.findall(file_contents))
+        constant_props = tuple(parse_idf_string(idf_string) for idf_string in
+                               idf_objects_by_type(idf_objects, 'Schedule:Constant'))
         # compile all of the ScheduleRuleset objects from extracted properties
         schedules = []
         for year_sch in year_props:
@@ -936,45 +1036,30 @@ class ScheduleRuleset(object):
 
         # if all input shcedules are single week, the averaging process is a lot simpler
         if all([sched.is_single_week for sched in schedules]):
-            rule_indices = [range(len(sched)) for sched in schedules]
+            week_rules = [sched._get_rule_index()[0][0][2] for sched in schedules]
             return ScheduleRuleset._get_avg_week(name, schedules, weights, timestep_resolution,
-                                                 rule_indices)
+                                                 week_rules)
         else:
-            # loop through 365 days of the year to find unique combinations of rules
-            rules_each_day = []
-            for doy in range(1, 366):
-                rules_on_doy = tuple(tuple(
-                    i for i, rule in enumerate(sched._schedule_rules)
-                    if rule._start_doy <= doy <= rule._end_doy)
-                    for sched in schedules)
-                rules_each_day.append(rules_on_doy)
-            unique_rule_sets = set(rules_each_day)
+            # find the days of the year when the rules of any schedule change
+            sched_weeks = [sched._get_rule_index()[1] for sched in schedules]
+            period_starts = sorted(set(period[0] for sched in schedules
+                                       for period in sched._get_rule_index()[0]))
             # create the average week schedules from the unique combinations of rules
-            week_schedules = []
-            for i, rule_indices in enumerate(unique_rule_sets):
-                week_name = '{}_{}'.format(name, i)
-                week_sched = ScheduleRuleset._get_avg_week(week_name, schedules, weights,
-                                                           timestep_resolution, rule_indices)
-                week_schedules.append(week_sched)
-            # create a disctionary mapping unique rule index lists to average week schedules
             rule_set_map = {}
-            for rule_i, week_sched in zip(unique_rule_sets, week_schedules):
-                rule_set_map[rule_i] = week_sched
-            # loop through all 365 days of the year to find when rules change
             yr_wk_scheds = []
             yr_wk_dt_range = []
-            prev_week_rules = None
-            for doy in range(1, 366):
-                week_rules = rules_each_day[doy - 1]
-                if week_rules != prev_week_rules:  # change to a new rule set
-                    yr_wk_scheds.append(rule_set_map[week_rules])
-                    if doy != 1:
-                        yr_wk_dt_range[-1].append(Date.from_doy(doy - 1))
-                        yr_wk_dt_range.append([Date.from_doy(doy)])
-                    else:
-                        yr_wk_dt_range.append([Date(1, 1)])
-                    prev_week_rules = week_rules
-            yr_wk_dt_range[-1].append(Date(12, 31))
+            for i, st_doy in enumerate(period_starts):
+                end_doy = period_starts[i + 1] - 1 if i + 1 < len(period_starts) else 365
+                week_rules = tuple(doy_weeks[st_doy - 1] for doy_weeks in sched_weeks)
+                try:  # check if the combination of rules has already been averaged
+                    week_sched = rule_set_map[week_rules]
+                except KeyError:  # create a new average week schedule
+                    week_name = '{}_{}'.format(name, len(rule_set_map))
+                    week_sched = ScheduleRuleset._get_avg_week(
+                        week_name, schedules, weights, timestep_resolution, week_rules)
+                    rule_set_map[week_rules] = week_sched
+                yr_wk_scheds.append(week_sched)
+                yr_wk_dt_range.append([Date.from_doy(st_doy), Date.from_doy(end_doy)])
 
             # convert week ScheduleRulesets to_rules and assign start + end dates
             final_rules = []
@@ -989,99 +1074,248 @@ class ScheduleRuleset(object):
             return ScheduleRuleset(name, default_day_schedule, final_rules[1:],
                                    schedule_type, summer_dd_sch, winter_dd_sch)
 
-    def _get_sch_values(self, sch_day_vals, dow, start_date, end_date, hol_doy):
-        """Get a list of values over a date range for a typical year."""
+    def _get_multi_year_values(self, sch_day_vals, start_date, end_date,
+                               holidays, years):
+        """Get a list of values over a date range that spans several calendar years.
+
+        Years that share the same calendar (leap year, start day of the week and
+        holidays) re-use the values that were computed for the first such year.
+        """
+        assert len(years) != 0, 'ScheduleRuleset values() years must not be empty.'
+        for prev_year, year in zip(years, years[1:]):
+            assert year == prev_year + 1, 'ScheduleRuleset values() years must be ' \
+                'sorted and consecutive. {} is followed by {}.'.format(prev_year, year)
+        year_values = {}  # dictionary of values for each unique calendar
         values = []
-        for doy in range(start_date.doy, end_date.doy + 1):
-            if dow > 7:  # reset the day of the week to sunday
-                dow = 1
-            if doy in hol_doy:
-                for i, rule in enumerate(self._schedule_rules):  # see if rules apply
-                    if rule.apply_holiday and rule.does_rule_apply_doy(doy):
-                        values.extend(sch_day_vals[i])
-                        break
-                else:  # no rule applies; use default_day_schedule.
-                    values.extend(sch_day_vals[-1])
-            else:
-                for i, rule in enumerate(self._schedule_rules):  # see if rules apply
-                    if rule.does_rule_apply(doy, dow):
-                        values.extend(sch_day_vals[i])
-                        break
-                else:  # no rule applies; use default_day_schedule.
-                    values.extend(sch_day_vals[-1])
-            dow += 1
+        for i, year in enumerate(years):
+            # get the dates and the calendar of the year
+            leap_year = isleap(year)
+            st_date = Date(start_date.month, start_date.day, leap_year) if i == 0 \
+                else Date(1, 1, leap_year)
+            end_dt = Date(end_date.month, end_date.day, leap_year) \
+                if i == len(years) - 1 else Date(12, 31, leap_year)
+            assert st_date <= end_dt, 'ScheduleRuleset values() start_date must ' \
+                'come before end_date. {} comes after {}.'.format(st_date, end_dt)
+            dow = date(year, st_date.month, st_date.day).isoweekday() % 7 + 1
+            hol_doy = frozenset(self._holiday_doys(holidays, leap_year, year))
+            # get the values of the year, re-using them for the same calendar
+            calendar = (leap_year, dow, st_date.doy, end_dt.doy, hol_doy)
+            try:
+                values.extend(year_values[calendar])
+            except KeyError:
+                yr_vals = self._get_sch_values(
+                    sch_day_vals, dow, st_date, end_dt, hol_doy, leap_year)
+                year_values[calendar] = yr_vals
+                values.extend(yr_vals)
         return values
 
-    def _get_sch_values_leap_year(self, sch_day_vals, dow,
-                                  start_date, end_date, hol_doy):
-        """Get a list of values over a date range for a leap year."""
+    def _get_sch_values(self, sch_day_vals, dow, start_date, end_date, hol_doy,
+                        leap_year=False):
+        """Get a list of values over a date range for a typical year or a leap year."""
+        day_rules = self._get_rule_indices(
+            dow, start_date.doy, end_date.doy, hol_doy, leap_year)
         values = []
-        for doy in range(start_date.doy, end_date.doy + 1):
-            if dow > 7:  # reset the day of the week to sunday
-                dow = 1
-            if doy in hol_doy:
-                for i, rule in enumerate(self._schedule_rules):  # see if rules apply
-                    if rule.apply_holiday and rule.does_rule_apply_doy_leap_year(doy):
-                        values.extend(sch_day_vals[i])
-                        break
-                else:  # no rule applies; use default_day_schedule.
-                    values.extend(sch_day_vals[-1])
-            else:
-                for i, rule in enumerate(self._schedule_rules):  # see if rules apply
-                    if rule.does_rule_apply_leap_year(doy, dow):
-                        values.extend(sch_day_vals[i])
-                        break
-                else:  # no rule applies; use default_day_schedule.
-                    values.extend(sch_day_vals[-1])
-            dow += 1
+        for i in day_rules:
+            values.extend(sch_day_vals[i])
         return values
 
-    def _get_week_list(self, rule_indices):
-        """Get a list of the ScheduleDay names applied on each day of the week."""
-        week_list = []
-        for dow in range(7):
-            for i in rule_indices:
-                if self._schedule_rules[i].week_apply_tuple[dow]:
-                    week_list.append(self._schedule_rules[i].schedule_day.name)
+    def _get_rule_indices(self, dow, start_doy, end_doy, hol_doy, leap_year=False):
+        """Get a list with the index of the rule applied on each day of a doy range.
+
+        Days on which no rule applies get an index of -1 for the default_day_schedule.
+        Rather than testing every rule on every day, the rules of each period in the
+        rule index are assigned to every 7th day of the period in slices.
+        """
+        periods, doy_weeks = self._get_rule_index(leap_year)
+        day_rules = [-1] * (end_doy - start_doy + 1)
+        for p_st_doy, p_end_doy, week_rules in periods:
+            st_i = max(p_st_doy, start_doy) - start_doy
+            end_i = min(p_end_doy, end_doy) - start_doy
+            for d_i in range(7):
+                if week_rules[d_i] != -1:  # assign the rule to every 7th day
+                    first_i = st_i + (d_i - dow + 1 - st_i) % 7
+                    if first_i <= end_i:
+                        day_rules[first_i:end_i + 1:7] = \
+                            [week_rules[d_i]] * ((end_i - first_i) // 7 + 1)
+        # on holidays, only the rules that apply to holidays are considered
+        for doy in hol_doy:
+            if start_doy <= doy <= end_doy:
+                day_rules[doy - start_doy] = doy_weeks[doy - 1][7]
+        return day_rules
+
+    def _values_key(self):
+        """Get a tuple for the state of the rules and ScheduleDays used by values.
+
+        The rules and ScheduleDays can be unlocked and edited while this schedule
+        stays locked. So this is included in the keys of the values_cache in order
+        to avoid returning values that were computed before such edits.
+        """
+        rules_key = tuple((rule._start_doy, rule._end_doy, rule.week_apply_tuple,
+                           rule._apply_holiday, rule._schedule_day._content_key())
+                          for rule in self._schedule_rules)
+        return rules_key + (self.default_day_schedule._content_key(),)
+
+    def _get_rule_index(self, leap_year=False, shared_indices=None):
+        """Get the index of the rules that are applied on each day of the year.
+
+        The index is only recomputed when the schedule_rules have changed since
+        the last time that it was requested.
+
+        Args:
+            leap_year: Boolean to note whether the index is for a leap year.
+            shared_indices: An optional dictionary that is shared between several
+                ScheduleRulesets in order to compute the index only once for all
+                schedules with rules that apply over the same dates and days.
+
+        Returns:
+            A tuple with two items.
+
+            -   periods: A list of the periods over the year in which the same rules
+                apply. Each period is a tuple with the start doy, the end doy and an
+                8-item tuple for the index of the rule that applies on each day of
+                the week (Sunday to Saturday) followed by holidays. An index of -1
+                means that the default_day_schedule applies.
+
+            -   doy_weeks: A list with the 8-item tuple of rule indices for each
+                day of the year.
+        """
+        rule_doys = [self._rule_doy_range(rule, leap_year)
+                     for rule in self._schedule_rules]
+        rules_key = tuple((doys, rule.week_apply_tuple, rule._apply_holiday)
+                          for doys, rule in zip(rule_doys, self._schedule_rules))
+        try:
+            index_key, periods, doy_weeks = self._rule_index[leap_year]
+            if index_key == rules_key:
+                return periods, doy_weeks
+        except KeyError:
+            pass  # the index has not yet been computed
+        if shared_indices is not None:
+            try:  # check if another schedule has the same rules
+                periods, doy_weeks = shared_indices[(leap_year, rules_key)]
+                self._rule_index[leap_year] = (rules_key, periods, doy_weeks)
+                return periods, doy_weeks
+            except KeyError:
+                pass  # the index has not yet been computed for these rules
+
+        # find the days of the year when the rules applied to the schedule change
+        n_days = 366 if leap_year else 365
+        period_starts = set([1])
+        for st_doy, end_doy in rule_doys:
+            period_starts.add(st_doy)
+            if end_doy < n_days:
+                period_starts.add(end_doy + 1)
+        period_starts = sorted(period_starts)
+
+        # find the rules applied on each day of the week in each period
+        periods = []
+        for p_i, st_doy in enumerate(period_starts):
+            end_doy = period_starts[p_i + 1] - 1 if p_i + 1 < len(period_starts) \
+                else n_days
+            rules_on_doy = [i for i, doys in enumerate(rule_doys)
+                            if doys[0] <= st_doy <= doys[1]]
+            week_rules = []
+            for dow in range(7):
+                for i in rules_on_doy:  # see if rules apply
+                    if rules_key[i][1][dow]:
+                        week_rules.append(i)
+                        break
+                else:  # no rule applies; use default_day_schedule.
+                    week_rules.append(-1)
+            for i in rules_on_doy:  # see if rules apply on holidays
+                if rules_key[i][2]:
+                    week_rules.append(i)
                     break
             else:  # no rule applies; use default_day_schedule.
-                week_list.append(self.default_day_schedule.name)
-        # check rules that apply on holidays
-        for i, rule in enumerate(self._schedule_rules):  # see if rules apply
-            if rule.apply_holiday:
-                week_list.append(self._schedule_rules[i].schedule_day.name)
-                break
-        else:  # no rule applies; use default_day_schedule.
-            week_list.append(self.default_day_schedule.name)
-        return week_list
+                week_rules.append(-1)
+            week_rules = tuple(week_rules)
+            if len(periods) != 0 and periods[-1][2] == week_rules:
+                periods[-1] = (periods[-1][0], end_doy, week_rules)
+            else:
+                periods.append((st_doy, end_doy, week_rules))
+        doy_weeks = []
+        for st_doy, end_doy, week_rules in periods:
+            doy_weeks.extend([week_rules] * (end_doy - st_doy + 1))
+
+        self._rule_index[leap_year] = (rules_key, periods, doy_weeks)
+        if shared_indices is not None:
+            shared_indices[(leap_year, rules_key)] = (periods, doy_weeks)
+        return periods, doy_weeks
+
+    def _get_day_names(self, day_idf_names=None):
+        """Get a list of the ScheduleDay name of each rule followed by the default day.
 
-    def _get_extra_week_fields(self):
-        """Get schedule names of extra days in Schedule:Week."""
+        The list can be indexed with the rule indices of the rule index since an
+        index of -1 yields the default_day_schedule name.
+
+        Args:
+            day_idf_names: An optional dictionary of ScheduleDay content keys and
+                the names to be used in their place.
+        """
+        if day_idf_names is None:
+            day_names = [rule._schedule_day.name for rule in self._schedule_rules]
+            day_names.append(self.default_day_schedule.name)
+            return day_names
+        day_names = [day_idf_names[rule._schedule_day._content_key()]
+                     for rule in self._schedule_rules]
+        day_names.append(day_idf_names[self.default_day_schedule._content_key()])
+        return day_names
+
+    def _get_extra_week_fields(self, day_idf_names=None):
+        """Get a tuple of schedule names of extra days in Schedule:Week."""
         # add summer and winter design days
-        week_fields = [self.summer_designday_schedule.name,
-                       self.winter_designday_schedule.name]
+        default_day = self.default_day_schedule
+        week_days = [
+            default_day if self._summer_designday_schedule is None
+            else self._summer_designday_schedule,
+            default_day if self._winter_designday_schedule is None
+            else self._winter_designday_schedule]
         for i in range(2):  # add extra 2 custom days that no one uses
-            week_fields.append(self.default_day_schedule.name)
-        return week_fields
+            week_days.append(default_day)
+        if day_idf_names is None:
+            return tuple(sch_day.name for sch_day in week_days)
+        return tuple(day_idf_names[sch_day._content_key()] for sch_day in week_days)
 
-    def _idf_week_schedule_from_rule_indices(self, rule_indices, week_index):
-        """Create an IDF string of a week schedule from a list of rules indices."""
-        week_sch_name = '{}_Week {}'.format(self.name, week_index)
-        week_fields = [week_sch_name]
-        # check rules that apply for the days of the week
-        week_fields.extend(self._get_week_list(rule_indices))
-        # add extra daus (including summer and winter design days)
-        week_fields.extend(self._get_extra_week_fields())
-        week_schedule = generate_idf_string(
-            'Schedule:Week:Daily', week_fields, self._schedule_week_comments)
-        return week_schedule, week_sch_name
+    @staticmethod
+    def _idf_shared_day_schedules(day_schedules, day_idf_names, used_day_names):
+        """Get IDF strings for ScheduleDays that are not equivalent to a written day.
+
+        Args:
+            day_schedules: A list of ScheduleDay objects to be written to the IDF.
+            day_idf_names: A dictionary of ScheduleDay content keys and the names of
+                the Schedule:Day objects already written to the IDF with that content.
+                This dictionary is updated with any new Schedule:Days.
+            used_day_names: A set of the lowercase names of all Schedule:Day objects
+                already written to the IDF, which is updated with any new names.
+                ScheduleDays with a name that is already used by a Schedule:Day with
+                different content are written with a numbered suffix on the name.
+
+        Returns:
+            A list of IDF strings for the Schedule:Days that have not yet been
+            written to the IDF.
+        """
+        day_strs = []
+        for sch_day in day_schedules:
+            content_key = sch_day._content_key()
+            if content_key in day_idf_names:
+                continue  # an equivalent Schedule:Day has already been written
+            idf_name, count = sch_day.name, 1
+            while idf_name.lower() in used_day_names:
+                count += 1
+                idf_name = '{}_{}'.format(sch_day.name, count)
+            if idf_name != sch_day.name:  # write a renamed copy of the ScheduleDay
+                sch_day = sch_day.duplicate()
+                sch_day.name = idf_name
+            day_idf_names[content_key] = idf_name
+            used_day_names.add(idf_name.lower())
+            day_strs.append(sch_day.to_idf())
+        return day_strs
 
     def _idf_week_schedule_from_week_list(self, week_list, week_index):
-        """Create an IDF string of a week schedule from a list ScheduleDay names."""
+        """Create an IDF string of a week schedule from a list of all of its day names.
+        """
         week_sch_name = '{}_Week {}'.format(self.name, week_index)
         week_fields = [week_sch_name]
         week_fields.extend(week_list)
-        week_fields.extend(self._get_extra_week_fields())
         week_schedule = generate_idf_string(
             'Schedule:Week:Daily', week_fields, self._schedule_week_comments)
         return week_schedule, week_sch_name
@@ -1117,6 +1351,41 @@ class ScheduleRuleset(object):
         assert isinstance(rule, ScheduleRule), \
             'Expected ScheduleRule for ScheduleRuleset. Got {}.'.format(type(rule))
 
+    @staticmethod
+    def _holiday_doys(holidays, leap_year=False, year=None):
+        """Get a set of the doys of a list of holidays.
+
+        Args:
+            holidays: A list of ladybug Date objects for holidays that occur every
+                year or None. When a year is specified, this can also include
+                datetime.date objects for holidays that only occur in that year.
+            leap_year: Boolean to note whether the doys are for a leap year.
+            year: An optional integer for the calendar year of the doys.
+        """
+        hol_doy = set()
+        if holidays is None:
+            return hol_doy
+        for hol in holidays:
+            if year is not None and not isinstance(hol, Date):  # specific year
+                if hol.year == year:
+                    hol_doy.add(hol.timetuple().tm_yday)
+            elif year is not None and not leap_year and (hol.month, hol.day) == (2, 29):
+                continue  # leap day holiday in a year that is not a leap year
+            elif hol.leap_year is not leap_year:
+                hol_doy.add(Date(hol.month, hol.day, leap_year).doy)
+            else:
+                hol_doy.add(hol.doy)
+        return hol_doy
+
+    @staticmethod
+    def _rule_doy_range(rule, leap_year=False):
+        """Get a tuple with the start and end doy of a ScheduleRule."""
+        if not leap_year:
+            return rule._start_doy, rule._end_doy
+        st_doy = rule._start_doy if rule._start_date.month <= 2 else rule._start_doy + 1
+        end_doy = rule._end_doy if rule._end_date.month <= 2 else rule._end_doy + 1
+        return st_doy, end_doy
+
     @staticmethod
     def _process_date_string(date_string):
         """Process DateTime strings from the OpenStudio standards gem format.
@@ -1211,26 +1480,14 @@ class ScheduleRuleset(object):
         return sch_type_dict
 
     @staticmethod
-    def _get_avg_week(name, schedules, weights, timestep_resolution, rule_indices):
-        """Get an average week schedule across several schedules and rule_indices."""
+    def _get_avg_week(name, schedules, weights, timestep_resolution, week_rules):
+        """Get an average week schedule across several schedules and their week_rules."""
         # get matrix with each ruleset schedule in rows and each day of week in cols
         val_mtx = []
         for s_i, sched in enumerate(schedules):
-            week_list = []
-            for dow in range(7):
-                for i in rule_indices[s_i]:  # see if rules apply
-                    if sched[i].week_apply_tuple[dow]:
-                        week_list.append(sched[i].schedule_day)
-                        break
-                else:  # no rule applies; use default_day_schedule.
-                    week_list.append(sched.default_day_schedule)
-            # check rules that apply on holidays
-            for i in rule_indices[s_i]:  # see if rules apply
-                if sched[i].apply_holiday:
-                    week_list.append(sched[i].schedule_day)
-                    break
-            else:  # no rule applies; use default_day_schedule.
-                week_list.append(sched.default_day_schedule)
+            # get the schedules applied on each day of the week and holidays
+            week_list = [sched[i].schedule_day if i != -1
+                         else sched.default_day_schedule for i in week_rules[s_i]]
             # check the rules applied for summer and winter design days
             summer = sched.default_day_schedule if sched._summer_designday_schedule \
                 is None else sched._summer_designday_schedule
@@ -2,16 +2,13 @@
 """Schedule type definition."""
 from __future__ import division
 
-from ..reader import parse_idf_string
+from ..reader import parse_idf_string, parse_idf_file, idf_objects_by_type
 from ..writer import generate_idf_string
 
 from honeybee.typing import valid_ep_string, valid_string, float_in_range
 from ladybug.datatype import fraction, temperature, temperaturedelta, power, \
     angle, speed, distance, uvalue
 
-import os
-import re
-
 
 class ScheduleTypeLimit(object):
     """Energy schedule type definition.
@@ -207,21 +204,19 @@ class ScheduleTypeLimit(object):
 
         Args:
             idf_file: A path to an IDF file containing objects for ScheduleTypeLimits.
+                This can also be a dictionary of IDF objects from the
+                reader.parse_idf_file method.
 
         Returns:
             schedule_type_limits: A list of all ScheduleTypeLimits objects in the
                 IDF file as honeybee_energy ScheduleTypeLimit objects.
         """
-        # check the file
-        assert os.path.isfile(idf_file), 'Cannot find an idf file at {}'.format(idf_file)
-        with open(idf_file, 'r') as ep_file:
-            file_contents = ep_file.read()
+        # parse the file into a dictionary of objects
+        idf_objects = idf_file if isinstance(idf_file, dict) else \
+            parse_idf_file(idf_file)
         # extract all of the ScheduleTypeLimit objects
-        type_pattern = re.compile(r"(?i)(ScheduleTypeLimits,[\s\S]*?;)")
-        type_idf_strings = type_pattern.findall(file_contents)
         schedule_type_limits = []
-        for type_str in type_idf_strings:
-            type_str = type_str.strip()
+        for type_str in idf_objects_by_type(idf_objects, 'ScheduleTypeLimits'):
             schedule_type_limits.append(ScheduleTypeLimit.from_idf(type_str))
         return schedule_type_limits
 
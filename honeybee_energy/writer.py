@@ -2,7 +2,34 @@
 from honeybee.boundarycondition import Surface
 
 
-def generate_idf_string(object_type, values, comments=None):
+# whether generate_idf_string writes compact strings when compact is not specified
+_compact_idf = False
+
+# cache of the format templates of commented IDF objects (see _idf_template)
+_idf_templates = {}
+_max_idf_templates = 1000
+
+# padding that aligns the comments of each field for each length of value text
+_idf_padding = tuple(' ' * (25 - i) for i in range(25))
+
+
+def set_compact_idf(compact=True):
+    """Set whether IDF strings are written in compact form by default.
+
+    Compact IDF strings have all fields of the object on one line without any
+    comments or padding (ie. 'Material,Brick,Rough,0.1,...;'). They are smaller and
+    faster to write but they are harder to read for people. This setting affects
+    all to_idf methods that do not explicitly request a format.
+
+    Args:
+        compact: Boolean to note whether compact IDF strings should be written
+            by default. Default: True.
+    """
+    global _compact_idf
+    _compact_idf = bool(compact)
+
+
+def generate_idf_string(object_type, values, comments=None, compact=None):
     """Get an IDF string representation of an EnergyPlus object.
 
     Args:
@@ -12,23 +39,105 @@ def generate_idf_string(object_type, values, comments=None):
             order that they are supposed to be written to IDF format.
         comments: A list of text comments with the same length as the values.
             If None, no comments will be written into the object.
+        compact: Boolean to note whether the object should be written on a single
+            line without any comments or padding. If None, the default set with
+            set_compact_idf will be used (False unless it has been changed).
 
     Returns:
         ep_str: Am EnergyPlus IDF string representing a single object.
     """
+    if compact or (compact is None and _compact_idf):
+        return '{},{};'.format(object_type, ','.join(str(val) for val in values))
     if comments is not None:
-        space_count = tuple((25 - len(str(n))) for n in values)
-        spaces = tuple(s_c * ' ' if s_c > 0 else ' ' for s_c in space_count)
-        ep_str = object_type + ',\n ' + '\n '.join(
-            '{},{}!- {}'.format(val, space, com) for val, space, com in
-            zip(values[:-1], spaces[:-1], comments[:-1]))
-        ep_str = ep_str + '\n {};{}!- {}'.format(
-            values[-1], spaces[-1], comments[-1])
-    else:
-        ep_str = object_type + ',\n ' + '\n '.join(
-            '{},'.format(val) for val in values[:-1])
-        ep_str = ep_str + '\n {};'.format(values[-1])
-    return ep_str
+        values = _commented_values(values, comments)
+        return _idf_template(object_type, comments, len(values)).format(
+            *_padded_values(values))
+    ep_str = object_type + ',\n ' + '\n '.join(
+        '{},'.format(val) for val in values[:-1])
+    return ep_str + '\n {};'.format(values[-1])
+
+
+def generate_idf_strings(object_type, values_list, comments=None, compact=None):
+    """Get IDF string representations of several EnergyPlus objects of the same type.
+
+    This is faster than calling generate_idf_string for each object since the
+    format of the object is only looked up once.
+
+    Args:
+        object_type: Text representing the expected start of the IDF objects.
+            (ie. WindowMaterial:Glazing).
+        values_list: A list of lists where each sub-list contains the values of one
+            EnergyPlus object. All sub-lists should have the same length.
+        comments: A list of text comments with the same length as each sub-list
+            of values. If None, no comments will be written into the objects.
+        compact: Boolean to note whether the objects should be written on a single
+            line without any comments or padding. If None, the default set with
+            set_compact_idf will be used.
+
+    Returns:
+        ep_strs: A list of EnergyPlus IDF strings with one for each list of values.
+    """
+    if compact or (compact is None and _compact_idf):
+        start = object_type + ','
+        return [start + ','.join(str(val) for val in values) + ';'
+                for values in values_list]
+    if comments is None:
+        return [generate_idf_string(object_type, values, None, False)
+                for values in values_list]
+    templates = {}  # templates by the number of values
+    ep_strs = []
+    for values in values_list:
+        values = _commented_values(values, comments)
+        try:
+            template = templates[len(values)]
+        except KeyError:
+            template = templates[len(values)] = \
+                _idf_template(object_type, comments, len(values))
+        ep_strs.append(template.format(*_padded_values(values)))
+    return ep_strs
+
+
+def _idf_template(object_type, comments, value_count):
+    """Get a format template for a commented IDF object with a number of values.
+
+    The template is formatted with the text of each value followed by its padding.
+    Templates are cached since the comments are the same for all objects of a type.
+    """
+    key = (object_type, value_count, tuple(comments))
+    try:
+        return _idf_templates[key]
+    except KeyError:
+        if len(_idf_templates) >= _max_idf_templates:
+            _idf_templates.clear()
+        coms = [str(com).replace('{', '{{').replace('}', '}}')
+                for com in comments]
+        lines = ['{{}},{{}}!- {}'.format(com) for com in coms[:value_count - 1]]
+        template = object_type.replace('{', '{{').replace('}', '}}') + \
+            ',\n ' + '\n '.join(lines) + '\n {{}};{{}}!- {}'.format(coms[-1])
+        _idf_templates[key] = template
+        return template
+
+
+def _commented_values(values, comments):
+    """Get the values that are written when there are fewer comments than values.
+
+    Like the zip of the values and comments, values without a comment are not
+    written except for the last value, which is written with the last comment.
+    """
+    if len(comments) < len(values):
+        return list(values[:len(comments) - 1]) + [values[-1]]
+    return values
+
+
+def _padded_values(values):
+    """Get a list with the text of each value followed by the padding after it."""
+    padding = _idf_padding
+    args = []
+    for val in values:
+        val = str(val)
+        args.append(val)
+        args.append(padding[len(val)] if len(val) < 25 else ' ')
+    return args
 
 
 def face_to_idf(face):
@@ -63,3 +172,86 @@ def face_to_idf(face):
             len(face.vertices),
             ',\n\t'.join('%f, %f, %f' % (v[0], v[1], v[2]) for v in face.upper_left_vertices)
         )
+
+
+def room_to_idf(room):
+    """Generate an IDF string representation of a Room as an EnergyPlus Zone.
+
+    Note that this method only outputs a string for the Zone object and, to write
+    everything needed to describe the Room into an IDF, the Room's Faces, loads
+    and HVAC must also be written.
+
+    Args:
+        room: A honeybee Room for which an IDF representation will be returned.
+    """
+    values = (room.name, 0, 0, 0, 0, 1, 1)
+    comments = ('name', 'direction of relative north {deg}', 'x origin {m}',
+                'y origin {m}', 'z origin {m}', 'type', 'multiplier')
+    return generate_idf_string('Zone', values, comments)
+
+
+def aperture_to_idf(aperture):
+    """Generate an IDF string representation of an Aperture.
+
+    Args:
+        aperture: A honeyee Aperture for which an IDF representation will be returned.
+    """
+    return _fenestration_to_idf(aperture, 'Window')
+
+
+def door_to_idf(door):
+    """Generate an IDF string representation of a Door.
+
+    Args:
+        door: A honeyee Door for which an IDF representation will be returned.
+    """
+    return _fenestration_to_idf(door, 'GlassDoor' if door.is_glass else 'Door')
+
+
+def shade_to_idf(shade):
+    """Generate an IDF string representation of a Shade.
+
+    Note that the ShadeConstruction of the Shade is not included in this string
+    since it is written as a separate ShadingProperty:Reflectance object.
+
+    Args:
+        shade: A honeyee Shade for which an IDF representation will be returned.
+    """
+    trans_sched = shade.properties.energy.transmittance_schedule
+    return 'Shading:Building:Detailed,' \
+        '\n\t%s,\t!- Name' \
+        '\n\t%s,\t!- Transmittance Schedule Name' \
+        '\n\t%d,\t!- Number of Vertices' \
+        '\n\t%s;' % (
+            shade.name,
+            trans_sched.name if trans_sched is not None else '',
+            len(shade.vertices),
+            ',\n\t'.join('%f, %f, %f' % (v[0], v[1], v[2])
+                         for v in shade.upper_left_vertices)
+        )
+
+
+def _fenestration_to_idf(fenestration, surface_type):
+    """Generate a FenestrationSurface:Detailed string for an Aperture or Door."""
+    return 'FenestrationSurface:Detailed,' \
+        '\n\t%s,\t!- Name' \
+        '\n\t%s,\t!- Surface Type' \
+        '\n\t%s,\t!- Construction Name' \
+        '\n\t%s,\t!- Building Surface Name' \
+        '\n\t%s,\t!- Outside Boundary Condition Object' \
+        '\n\t%s,\t!- View Factor to Ground' \
+        '\n\t,\t!- Frame and Divider Name' \
+        '\n\t1,\t!- Multiplier' \
+        '\n\t%d,\t!- Number of Vertices' \
+        '\n\t%s;' % (
+            fenestration.name,
+            surface_type,
+            fenestration.properties.energy.construction.name,
+            fenestration.parent.name if fenestration.parent else 'unknown',
+            fenestration.boundary_condition.boundary_condition_object if
+            isinstance(fenestration.boundary_condition, Surface) else '',
+            fenestration.boundary_condition.view_factor,
+            len(fenestration.vertices),
+            ',\n\t'.join('%f, %f, %f' % (v[0], v[1], v[2])
+                         for v in fenestration.upper_left_vertices)
+        )
@@ -0,0 +1,56 @@
+# coding=utf-8
+from honeybee_energy.cache import set_property_caching
+from honeybee_energy.material.opaque import EnergyMaterial
+from honeybee_energy.construction.opaque import OpaqueConstruction
+
+
+def test_cached_property_locked():
+    """Test that cached properties are only stored while an object is locked."""
+    concrete = EnergyMaterial('Concrete', 0.15, 2.31, 2322, 832)
+    insulation = EnergyMaterial('Insulation', 0.05, 0.049, 265, 836)
+    wall = OpaqueConstruction('Wall', [concrete, insulation])
+    r_value = wall.r_value
+    assert wall._cache == {}
+    wall.lock()
+    assert wall.r_value == r_value
+    assert wall.thickness == 0.2
+    assert set(wall._cache.keys()) == set(('r_value', 'thickness'))
+
+    wall.unlock()
+    assert wall._cache == {}
+    wall.materials = [concrete]
+    wall.lock()
+    assert wall.r_value == concrete.r_value
+    assert wall.thickness == 0.15
+
+
+def test_cached_property_material_edit():
+    """Test that editing a material of a locked construction updates the properties."""
+    concrete = EnergyMaterial('Concrete', 0.15, 2.31, 2322, 832)
+    insulation = EnergyMaterial('Insulation', 0.05, 0.049, 265, 836)
+    wall = OpaqueConstruction('Wall', [concrete, insulation])
+    wall.lock()
+    r_value = wall.r_value
+
+    insulation.unlock()
+    insulation.thickness = 0.1
+    assert wall.r_value != r_value  # material is unlocked
+    insulation.lock()
+    assert wall.r_value == concrete.r_value + insulation.r_value
+    assert wall.r_value != r_value
+
+
+def test_set_property_caching():
+    """Test turning off the caching of properties."""
+    concrete = EnergyMaterial('Concrete', 0.15, 2.31, 2322, 832)
+    insulation = EnergyMaterial('Insulation', 0.05, 0.049, 265, 836)
+    wall = OpaqueConstruction('Wall', [concrete, insulation])
+    wall.lock()
+    try:
+        set_property_caching(False)
+        assert wall.r_value == concrete.r_value + insulation.r_value
+        assert wall._cache == {}
+    finally:
+        set_property_caching(True)
+    wall.r_value
+    assert 'r_value' in wall._cache
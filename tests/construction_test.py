@@ -369,6 +369,95 @@ def test_window_temperature_profile():
     assert len(r_values) == 7
 
 
+def test_window_temperature_profiles():
+    """Test the window construction temperature profiles for many conditions."""
+    clear_glass = EnergyWindowMaterialGlazing(
+        'Clear Glass', 0.005715, 0.770675, 0.07, 0.8836, 0.0804,
+        0, 0.84, 0.84, 1.0)
+    gap = EnergyWindowMaterialGas('air gap', thickness=0.0127)
+    triple_clear = WindowConstruction(
+        'Triple Clear Window', [clear_glass, gap, clear_glass, gap, clear_glass])
+    outside_temps = [-18, -10, 0, 36, -18]
+    angles = [90, 90, 45, 180, 90]
+    temperatures, r_values = triple_clear.temperature_profiles(
+        outside_temps, 21, 6.7, 1.0, angles)
+
+    assert len(temperatures) == len(r_values) == 5
+    assert temperatures[0] == temperatures[-1]
+    for out_t, angle, temps, r_vals in zip(outside_temps, angles, temperatures,
+                                           r_values):
+        exp_temps, exp_r_vals = triple_clear.temperature_profile(
+            out_t, 21, angle=angle)
+        assert len(temps) == 8
+        assert len(r_vals) == 7
+        assert temps == exp_temps
+        assert r_vals == exp_r_vals
+
+    u_factors = triple_clear.u_factors(outside_temps, 21, 6.7, 1.0, angles)
+    assert u_factors == pytest.approx([1 / sum(r_vals) for r_vals in r_values])
+    single = WindowConstruction('Single Clear Window', [clear_glass])
+    assert single.temperature_profiles(-18, 21)[0] == \
+        [single.temperature_profile(-18, 21)[0]]
+    with pytest.raises(AssertionError):
+        triple_clear.temperature_profiles([-18, 0], [21, 21, 21])
+
+
+def test_window_temperature_profiles_order():
+    """Test that the profiles of non-smooth conditions do not depend on their order."""
+    clear_glass = EnergyWindowMaterialGlazing(
+        'Clear Glass', 0.005715, 0.770675, 0.07, 0.8836, 0.0804,
+        0, 0.84, 0.84, 1.0)
+    gap = EnergyWindowMaterialGas('air gap', thickness=0.0127)
+    triple_clear = WindowConstruction(
+        'Triple Clear Window', [clear_glass, gap, clear_glass, gap, clear_glass])
+    outside_temps = [-30, 40, -5, 35, -25, 10, 38, -18]
+    wind_speeds = [0.5, 12, 3, 0.1, 15, 6.7, 1, 9]
+    angles = [90, 0, 180, 45, 135, 90, 30, 90]
+    r_values = triple_clear.temperature_profiles(
+        outside_temps, 21, wind_speeds, 1.0, angles)[1]
+    rev_r_values = triple_clear.temperature_profiles(
+        outside_temps[::-1], 21, wind_speeds[::-1], 1.0, angles[::-1])[1]
+
+    assert r_values == rev_r_values[::-1]
+    for out_t, speed, angle, r_vals in zip(outside_temps, wind_speeds, angles,
+                                           r_values):
+        assert r_vals == triple_clear.temperature_profile(
+            out_t, 21, speed, angle=angle)[1]
+
+
+def test_window_stored_solutions():
+    """Test that locked window constructions reuse their solved R-values."""
+    clear_glass = EnergyWindowMaterialGlazing(
+        'Clear Glass', 0.005715, 0.770675, 0.07, 0.8836, 0.0804,
+        0, 0.84, 0.84, 1.0)
+    gap = EnergyWindowMaterialGas('air gap', thickness=0.0127)
+    double_clear = WindowConstruction(
+        'Double Clear Window', [clear_glass, gap, clear_glass])
+    r_factor, r_value = double_clear.r_factor, double_clear.r_value
+    temperatures, r_values = double_clear.temperature_profile()
+    assert len(double_clear._solutions) == 0  # nothing stored when unlocked
+
+    double_clear.lock()
+    assert double_clear.r_factor == r_factor
+    assert double_clear.r_value == r_value
+    assert double_clear.u_factor == pytest.approx(1 / r_factor, rel=1e-9)
+    assert double_clear.temperature_profile() == (temperatures, r_values)
+    assert len(double_clear._solutions) == 1
+    assert '_standard_r_values' in double_clear._cache
+    double_clear.temperature_profile()[1].append(0)  # returned lists are copies
+    assert double_clear.temperature_profile() == (temperatures, r_values)
+
+    # editing a material should not re-use the old solution
+    gap.unlock()
+    gap.thickness = 0.02
+    gap.lock()
+    assert double_clear.r_factor != r_factor
+    double_clear.unlock()
+    assert len(double_clear._solutions) == 0
+    assert double_clear.r_value == pytest.approx(WindowConstruction(
+        'Double Clear Window', [clear_glass, gap, clear_glass]).r_value, rel=1e-9)
+
+
 def test_window_construction_init_from_idf_file():
     """Test the initalization of WindowConstruction from file."""
     lbnl_window_idf_file = './tests/idf/GlzSys_Triple Clear_Avg.idf'
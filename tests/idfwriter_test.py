@@ -0,0 +1,158 @@
+# coding=utf-8
+from honeybee.model import Model
+from honeybee.room import Room
+from honeybee.shade import Shade
+from honeybee.door import Door
+
+from honeybee_energy.idfwriter import IDFWriter
+from honeybee_energy.construction.opaque import OpaqueConstruction
+from honeybee_energy.construction.shade import ShadeConstruction
+from honeybee_energy.material.opaque import EnergyMaterial
+from honeybee_energy.schedule.ruleset import ScheduleRuleset
+from honeybee_energy.schedule.day import ScheduleDay
+from honeybee_energy.idealair import IdealAirSystem
+from honeybee_energy.lib.programtypes import office_program
+import honeybee_energy.lib.scheduletypelimits as schedule_types
+
+from ladybug_geometry.geometry3d.pointvector import Point3D, Vector3D
+from ladybug_geometry.geometry3d.plane import Plane
+from ladybug_geometry.geometry3d.face import Face3D
+from ladybug.dt import Time
+
+import os
+
+
+def test_idf_writer_model():
+    """Test the IDFWriter write_model method."""
+    stone = EnergyMaterial('Thick Stone', 0.3, 2.31, 2322, 832, 'Rough',
+                           0.95, 0.75, 0.8)
+    mass_floor = OpaqueConstruction('Thermal Mass Floor', [stone])
+    stone_door = OpaqueConstruction('Stone Door', [stone])
+    light_shelf = ShadeConstruction('Outdoor Light Shelf', 0.5, 0.5, True)
+    humid_setpt = ScheduleRuleset.from_constant_value(
+        'Office Humid', 30, schedule_types.humidity)
+    dehumid_setpt = ScheduleRuleset.from_constant_value(
+        'Office Dehumid', 60, schedule_types.humidity)
+    setpoint = office_program.setpoint.duplicate()
+    setpoint.name = 'Humid Office Setpoint'
+    setpoint.humidifying_schedule = humid_setpt
+    setpoint.dehumidifying_schedule = dehumid_setpt
+    rooms = []
+    for i in range(2):
+        room = Room.from_box('Tiny House Zone {}'.format(i), 5, 10, 3,
+                             origin=Point3D(5 * i, 0, 0))
+        room.properties.energy.program_type = office_program
+        room.properties.energy.setpoint = setpoint
+        room.properties.energy.hvac = IdealAirSystem()
+        room[0].properties.energy.construction = mass_floor
+        room[3].apertures_by_ratio(0.4, 0.01)
+        room[3].apertures[0].overhang(0.5, indoor=False)
+        room[3].apertures[0].shades[0].properties.energy.construction = light_shelf
+        door_verts = [Point3D(5 * i + 2, 10, 0.1), Point3D(5 * i + 1, 10, 0.1),
+                      Point3D(5 * i + 1, 10, 2.5), Point3D(5 * i + 2, 10, 2.5)]
+        door = Door('Front Door {}'.format(i), Face3D(door_verts))
+        door.properties.energy.construction = stone_door
+        room[1].add_door(door)
+        rooms.append(room)
+    tree_canopy_geo = Face3D.from_regular_polygon(
+        6, 2, Plane(Vector3D(0, 0, 1), Point3D(5, -3, 4)))
+    tree_canopy = Shade('Tree Canopy', tree_canopy_geo)
+    tree_canopy.properties.energy.transmittance_schedule = \
+        ScheduleRuleset.from_constant_value(
+            'Tree Transmittance', 0.75, schedule_types.fractional)
+    model = Model('Tiny Houses', rooms, orphaned_shades=[tree_canopy])
+
+    idf_path = './tests/idf/idf_writer_model.idf'
+    try:
+        with open(idf_path, 'w') as idf_file:
+            writer = IDFWriter(idf_file, buffer_size=7)
+            writer.write_model(model)
+            assert writer.object_count > 0
+            assert idf_file.tell() > 0
+            writer.flush()
+        with open(idf_path) as idf_file:
+            idf_str = idf_file.read()
+    finally:
+        if os.path.isfile(idf_path):
+            os.remove(idf_path)
+
+    # check that every object was written and that the buffer was emptied
+    assert idf_str.count('\n\n') == writer.object_count
+    assert idf_str.count('Zone,\n') == 2
+    assert idf_str.count('BuildingSurface:Detailed,') == 12
+    assert idf_str.count('FenestrationSurface:Detailed,') == 4
+    assert idf_str.count('\tDoor,\t!- Surface Type') == 2
+    assert idf_str.count('Shading:Building:Detailed,') == 3
+    assert idf_str.count('People,\n') == 2
+    assert idf_str.count('HVACTemplate:Zone:IdealLoadsAirSystem,\n') == 2
+
+    # check that shared resources were only written once
+    assert idf_str.count('Material,\n Thick Stone,') == 1
+    assert idf_str.count('Construction,\n Thermal Mass Floor,') == 1
+    assert idf_str.count('Construction,\n Stone Door,') == 1
+    assert idf_str.count('HVACTemplate:Thermostat,') == 1
+    assert idf_str.count('ZoneControl:Humidistat,') == 2
+    assert idf_str.count('Humid Office Setpoint..TinyHouseZone0,') == 1
+    assert idf_str.count('Humid Office Setpoint..TinyHouseZone1,') == 1
+    assert idf_str.count('Schedule:Constant,\n Office Humid,') == 1
+    assert idf_str.count('DesignSpecification:OutdoorAir,') == 1
+    assert idf_str.count('Schedule:Constant,\n Tree Transmittance,') == 1
+    assert idf_str.count('ShadingProperty:Reflectance,') == 2
+    sched = office_program.people.occupancy_schedule
+    assert idf_str.count('Schedule:Year,\n {},'.format(sched.name)) == 1
+    assert idf_str.count('ScheduleTypeLimits,\n {},'.format(
+        schedule_types.fractional.name)) == 1
+
+
+def test_idf_writer_schedules():
+    """Test that IDFWriter shares equivalent days like to_idf_collective."""
+    schedules = [office_program.people.occupancy_schedule,
+                 office_program.lighting.schedule,
+                 office_program.electric_equipment.schedule]
+    idf_path = './tests/idf/idf_writer_schedules.idf'
+    try:
+        with open(idf_path, 'w') as idf_file:
+            writer = IDFWriter(idf_file)
+            for sched in schedules + schedules:
+                writer.write_schedule(sched)
+            writer.flush()
+        with open(idf_path) as idf_file:
+            idf_str = idf_file.read()
+    finally:
+        if os.path.isfile(idf_path):
+            os.remove(idf_path)
+
+    year_scheds, week_scheds, day_scheds = \
+        ScheduleRuleset.to_idf_collective(schedules)
+    type_limits = set(sch.schedule_type_limit.name for sch in schedules)
+    assert writer.object_count == len(year_scheds) + len(week_scheds) + \
+        len(day_scheds) + len(type_limits)
+    for sched_str in year_scheds + week_scheds + day_scheds:
+        assert sched_str in idf_str
+
+
+def test_idf_writer_schedules_same_day_name():
+    """Test that IDFWriter keeps different days that share the same name."""
+    day_a = ScheduleDay('Day', [0, 1, 0], [Time(0, 0), Time(9, 0), Time(17, 0)])
+    day_b = ScheduleDay('Day', [0.5, 0.2], [Time(0, 0), Time(12, 0)])
+    sched_a = ScheduleRuleset('Schedule A', day_a, None, schedule_types.fractional)
+    sched_b = ScheduleRuleset('Schedule B', day_b, None, schedule_types.fractional)
+    idf_path = './tests/idf/idf_writer_same_day_name.idf'
+    try:
+        with open(idf_path, 'w') as idf_file:
+            writer = IDFWriter(idf_file)
+            writer.write_schedule(sched_a)
+            writer.write_schedule(sched_b)
+            writer.flush()
+        with open(idf_path) as idf_file:
+            idf_str = idf_file.read()
+    finally:
+        if os.path.isfile(idf_path):
+            os.remove(idf_path)
+
+    assert idf_str.count('Schedule:Day:Interval,') == 2
+    assert sched_a.default_day_schedule.to_idf() in idf_str
+    day_b.unlock()
+    day_b.name = 'Day_2'
+    assert day_b.to_idf() in idf_str
+    assert idf_str.count('Schedule:Week:Daily,') == 2
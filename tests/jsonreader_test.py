@@ -0,0 +1,114 @@
+# coding=utf-8
+from honeybee.model import Model
+from honeybee.room import Room
+from honeybee.shade import Shade
+from honeybee.door import Door
+
+from honeybee_energy.jsonreader import model_from_json
+from honeybee_energy._jsonstream import JSONStream
+from honeybee_energy.construction.opaque import OpaqueConstruction
+from honeybee_energy.construction.shade import ShadeConstruction
+from honeybee_energy.material.opaque import EnergyMaterial
+from honeybee_energy.schedule.ruleset import ScheduleRuleset
+from honeybee_energy.idealair import IdealAirSystem
+from honeybee_energy.lib.programtypes import office_program
+import honeybee_energy.lib.scheduletypelimits as schedule_types
+
+from ladybug_geometry.geometry3d.pointvector import Point3D, Vector3D
+from ladybug_geometry.geometry3d.plane import Plane
+from ladybug_geometry.geometry3d.face import Face3D
+
+import io
+import os
+import json
+import pytest
+
+
+def test_json_stream():
+    """Test the JSONStream with values that span several chunks of the file."""
+    data = {'numbers': [1, -2.5e-07, 123456789012], 'text': u'a "quoted"\n\xe9',
+            'nested': {'empty': [], 'flags': [True, False, None], 'obj': {}}}
+    json_file = './tests/json_stream_test.json'
+    try:
+        with open(json_file, 'w') as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        for chunk_size in (1, 3, 64):
+            with open(json_file) as f:
+                stream = JSONStream(f, chunk_size)
+                assert stream.read_value() == data
+
+            with open(json_file) as f:
+                stream = JSONStream(f, chunk_size)
+                keys = []
+                for key in stream.iter_object():
+                    keys.append(key)
+                    if key == 'numbers':
+                        assert list(stream.iter_array()) == data['numbers']
+                    elif key == 'nested':
+                        for sub_key in stream.iter_object():
+                            if sub_key == 'flags':
+                                assert stream.read_value() == [True, False, None]
+            assert keys == ['nested', 'numbers', 'text']
+    finally:
+        if os.path.isfile(json_file):
+            os.remove(json_file)
+
+    with pytest.raises(ValueError):
+        for key in JSONStream(io.StringIO(u'{"a": 1 "b": 2}'), 4).iter_object():
+            pass
+
+
+def test_model_from_json():
+    """Test that model_from_json matches Model.from_dict for a Model JSON file."""
+    room = Room.from_box('Tiny House Zone', 5, 10, 3)
+    room.properties.energy.program_type = office_program
+    room.properties.energy.hvac = IdealAirSystem()
+    stone = EnergyMaterial('Thick Stone', 0.3, 2.31, 2322, 832, 'Rough',
+                           0.95, 0.75, 0.8)
+    room[0].properties.energy.construction = \
+        OpaqueConstruction('Thermal Mass Floor', [stone])
+    south_face = room[3]
+    south_face.apertures_by_ratio(0.4, 0.01)
+    south_face.apertures[0].overhang(0.5, indoor=False)
+    south_face.apertures[0].shades[0].properties.energy.construction = \
+        ShadeConstruction('Outdoor Light Shelf', 0.5, 0.5)
+    door_verts = [Point3D(2, 10, 0.1), Point3D(1, 10, 0.1),
+                  Point3D(1, 10, 2.5), Point3D(2, 10, 2.5)]
+    door = Door('Front Door', Face3D(door_verts))
+    door.properties.energy.construction = OpaqueConstruction('Stone Door', [stone])
+    room[1].add_door(door)
+
+    tree_canopy_geo = Face3D.from_regular_polygon(
+        6, 2, Plane(Vector3D(0, 0, 1), Point3D(5, -3, 4)))
+    tree_canopy = Shade('Tree Canopy', tree_canopy_geo)
+    tree_canopy.properties.energy.transmittance_schedule = \
+        ScheduleRuleset.from_constant_value(
+            'Tree Transmittance', 0.75, schedule_types.fractional)
+    model = Model('Tiny House', [room], orphaned_shades=[tree_canopy])
+    model.north_angle = 15
+    model_dict = model.to_dict()
+    # put the rooms before the properties to check that they are applied later
+    rooms_first_dict = {'type': 'Model', 'name': model_dict['name'],
+                        'rooms': model_dict['rooms'],
+                        'orphaned_shades': model_dict['orphaned_shades'],
+                        'properties': model_dict['properties'],
+                        'north_angle': model_dict['north_angle'],
+                        'display_name': model_dict['display_name']}
+    expected_dict = Model.from_dict(model_dict).to_dict()
+
+    model_file = './tests/json_stream_model.json'
+    try:
+        for file_dict in (model_dict, rooms_first_dict):
+            with open(model_file, 'w') as f:
+                json.dump(file_dict, f, indent=4)
+            for chunk_size in (16, 65536):
+                new_model = model_from_json(model_file, chunk_size)
+                assert new_model.to_dict() == expected_dict
+    finally:
+        if os.path.isfile(model_file):
+            os.remove(model_file)
+
+    door = new_model.rooms[0][1].doors[0]
+    assert door.properties.energy.construction.name == 'Stone Door'
+    assert new_model.orphaned_shades[0].properties.energy.transmittance_schedule.\
+        schedule_type_limit == schedule_types.fractional
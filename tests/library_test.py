@@ -0,0 +1,120 @@
+# coding=utf-8
+from honeybee_energy.lib._lazylibrary import LazyLibrary
+from honeybee_energy.lib._librarycache import library_files, load_cached_index
+import honeybee_energy.lib._librarycache as librarycache
+from honeybee_energy.lib.constructions import OPAQUE_CONSTRUCTIONS, \
+    opaque_construction_by_name
+from honeybee_energy.lib.schedules import SCHEDULES, schedule_by_name
+from honeybee_energy.lib._loadconstructions import _idf_opaque_constructions
+from honeybee_energy.construction.opaque import OpaqueConstruction
+from honeybee_energy.schedule.ruleset import ScheduleRuleset
+from honeybee_energy.material.opaque import EnergyMaterial
+
+import os
+import pytest
+
+
+def test_lazy_library():
+    """Test the LazyLibrary build-on-demand behavior."""
+    build_count = []
+    conductivities = {'Concrete': 0.5}
+
+    def _build_material(data):
+        build_count.append(data[0])
+        return EnergyMaterial(data[0], data[1], conductivities[data[0]], 800, 1200)
+
+    mat_lib = LazyLibrary(_build_material)
+    mat_lib.add_source('Concrete', ('Concrete', 0.2))
+    mat_lib.add_source('Bad Material', ('Bad Material', 0.2))
+
+    assert len(mat_lib) == 2
+    assert mat_lib.names == ('Concrete', 'Bad Material')
+    assert 'Concrete' in mat_lib
+    assert build_count == []
+
+    concrete = mat_lib['Concrete']
+    assert isinstance(concrete, EnergyMaterial)
+    with pytest.raises(AttributeError):
+        concrete.thickness = 0.3  # the object should be locked
+    assert mat_lib['Concrete'] is concrete
+    assert build_count == ['Concrete']
+
+    with pytest.raises(KeyError):
+        mat_lib['Bad Material']
+    assert 'Bad Material' not in mat_lib
+    assert mat_lib.names == ('Concrete',)
+    with pytest.raises(KeyError):
+        mat_lib['Not A Material']
+    assert mat_lib.get('Not A Material') is None
+
+
+def test_load_cached_index():
+    """Test that library indices are cached and rebuilt when the files change."""
+    index_count = []
+
+    def _index_files(file_paths):
+        index_count.append(len(file_paths))
+        index = []
+        for f_path in file_paths:
+            with open(f_path, 'r') as lib_file:
+                index.append((os.path.basename(f_path), lib_file.read()))
+        return index
+
+    package_folder = os.path.dirname(os.path.abspath(librarycache.__file__))
+    assert not os.path.abspath(librarycache.CACHE_FOLDER).startswith(package_folder)
+
+    lib_folder = './tests/idf/library_cache'
+    cache_folder = os.path.join(lib_folder, '__cache__')
+    cache_file = os.path.join(cache_folder, 'test_library.pickle')
+    lib_file = os.path.join(lib_folder, 'user_library.idf')
+    default_cache_folder = librarycache.CACHE_FOLDER
+    librarycache.CACHE_FOLDER = cache_folder
+    try:
+        os.makedirs(lib_folder)
+        with open(lib_file, 'w') as f:
+            f.write('ScheduleTypeLimits, Fractional, 0, 1, Continuous;')
+        file_paths = library_files(lib_folder, '.idf')
+        assert file_paths == [lib_file]
+
+        index = load_cached_index('test_library', file_paths, _index_files)
+        assert os.path.isfile(cache_file)
+        assert load_cached_index('test_library', file_paths, _index_files) == index
+        assert index_count == [1]  # second call should load from the cache
+
+        with open(lib_file, 'a') as f:
+            f.write('ScheduleTypeLimits, On-Off, 0, 1, Discrete;')
+        new_index = load_cached_index('test_library', file_paths, _index_files)
+        assert index_count == [1, 1]  # changed file should invalidate the cache
+        assert new_index != index
+
+        if hasattr(os, 'getuid'):  # caches writable by other users are not loaded
+            os.chmod(cache_file, 0o666)
+            load_cached_index('test_library', file_paths, _index_files)
+            assert index_count == [1, 1, 1]
+            load_cached_index('test_library', file_paths, _index_files)
+            assert index_count == [1, 1, 1]  # rewritten cache is private
+    finally:
+        librarycache.CACHE_FOLDER = default_cache_folder
+        for f_path in (cache_file, lib_file):
+            if os.path.isfile(f_path):
+                os.remove(f_path)
+        for folder in (cache_folder, lib_folder):
+            if os.path.isdir(folder):
+                os.rmdir(folder)
+
+
+def test_library_lookups():
+    """Test that library lookups build and memoize the requested objects."""
+    assert 'Generic Exterior Wall' in OPAQUE_CONSTRUCTIONS
+    ext_wall = opaque_construction_by_name('Generic Exterior Wall')
+    assert isinstance(ext_wall, OpaqueConstruction)
+    assert ext_wall is opaque_construction_by_name('Generic Exterior Wall')
+    assert ext_wall is _idf_opaque_constructions['Generic Exterior Wall']
+
+    assert 'Generic Office Occupancy' in SCHEDULES
+    office_occ = schedule_by_name('Generic Office Occupancy')
+    assert isinstance(office_occ, ScheduleRuleset)
+    assert office_occ is schedule_by_name('Generic Office Occupancy')
+
+    with pytest.raises(ValueError):
+        schedule_by_name('Not A Schedule')
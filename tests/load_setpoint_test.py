@@ -188,6 +188,8 @@ def test_setpoint_init_from_idf_humidity():
     zone_name = 'Test Zone'
     idf_str = setpoint.to_idf()
     humid_idf_str = setpoint.to_idf_humidistat(zone_name)
+    assert humid_idf_str.startswith(
+        'ZoneControl:Humidistat,\n Office Setpoint..Test Zone,')
     rebuilt_setpoint = Setpoint.from_idf(idf_str, sched_dict)
     rebuilt_setpoint.add_humidity_from_idf(humid_idf_str, sched_dict)
     assert setpoint == rebuilt_setpoint
@@ -126,6 +126,35 @@ def test_gas_mixture_properties_at_temperature():
     assert air_argon.prandtl_at_temperature(223) == pytest.approx(0.6558, rel=1e-2)
 
 
+def test_gas_mixture_coefficients():
+    """Test that mixture properties match the weighted average of each gas."""
+    air_argon = EnergyWindowMaterialGasMixture(
+        'Air Argon Gap', 0.0125, ('Air', 'Argon'), (0.1, 0.9))
+    air = EnergyWindowMaterialGas('Air Gap', 0.0125, 'Air')
+    argon = EnergyWindowMaterialGas('Argon Gap', 0.0125, 'Argon')
+    krypton = EnergyWindowMaterialGas('Krypton Gap', 0.0125, 'Krypton')
+
+    for t_kelvin in (223, 273.15, 330):
+        assert air_argon.conductivity_at_temperature(t_kelvin) == pytest.approx(
+            0.1 * air.conductivity_at_temperature(t_kelvin) +
+            0.9 * argon.conductivity_at_temperature(t_kelvin), rel=1e-12)
+        assert air_argon.viscosity_at_temperature(t_kelvin) == pytest.approx(
+            0.1 * air.viscosity_at_temperature(t_kelvin) +
+            0.9 * argon.viscosity_at_temperature(t_kelvin), rel=1e-12)
+        assert air_argon.specific_heat_at_temperature(t_kelvin) == pytest.approx(
+            0.1 * air.specific_heat_at_temperature(t_kelvin) +
+            0.9 * argon.specific_heat_at_temperature(t_kelvin), rel=1e-12)
+
+    air_argon.gas_types = ('Air', 'Krypton')  # coefficients follow the gases
+    assert air_argon.conductivity_at_temperature(273.15) == pytest.approx(
+        0.1 * air.conductivity_at_temperature(273.15) +
+        0.9 * krypton.conductivity_at_temperature(273.15), rel=1e-12)
+    air_argon.gas_fractions = (0.5, 0.5)
+    assert air_argon.conductivity_at_temperature(273.15) == pytest.approx(
+        0.5 * air.conductivity_at_temperature(273.15) +
+        0.5 * krypton.conductivity_at_temperature(273.15), rel=1e-12)
+
+
 def test_gas_mixture_invalid():
     """Test EnergyWindowMaterialGlazing objects with invalid properties."""
     air_argon = EnergyWindowMaterialGasMixture(
@@ -87,6 +87,30 @@ def test_shade_invalid():
         shade_mat.r_value = -1
 
 
+def test_shade_r_values():
+    """Test the R-value methods of shade materials with their air gap."""
+    shade_mat = EnergyWindowMaterialShade(
+        'Low-e Diffusing Shade', 0.005, 0.15, 0.5, 0.25, 0.5, 0, 0.4,
+        0.2, 0.1, 0.75, 0.25)
+    delta_ts, t_kelvins = [5, 10, 15], [263.15, 273.15, 283.15]
+
+    assert shade_mat.r_values(delta_ts, t_kelvins, 'Exterior') == \
+        [shade_mat.r_value_exterior(d_t, t_kelvin=t_k)
+         for d_t, t_k in zip(delta_ts, t_kelvins)]
+    assert shade_mat.r_values(delta_ts, 273.15, 'Interior', 0.2) == \
+        [shade_mat.r_value_interior(d_t, 0.2) for d_t in delta_ts]
+    assert shade_mat.r_values(7.5, t_kelvins, 'Between', 0.84, 0.2) == \
+        [shade_mat.r_value_between(7.5, 0.84, 0.2, t_kelvin=t_k) for t_k in t_kelvins]
+    with pytest.raises(AssertionError):
+        shade_mat.r_values(delta_ts, t_kelvins, 'Outside')
+    with pytest.raises(AssertionError):
+        shade_mat.r_values(delta_ts, t_kelvins[:2])
+
+    r_val = shade_mat.r_value_interior()
+    shade_mat.distance_to_glass = 0.01
+    assert shade_mat.r_value_interior() != r_val
+
+
 def test_shade_from_idf():
     """Test the initalization of shade material objects from EnergyPlus strings."""
     ep_str_1 = "WindowMaterial:Shade,\n" \
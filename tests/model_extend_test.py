@@ -8,7 +8,9 @@ from honeybee.door import Door
 from honeybee.boundarycondition import boundary_conditions, Ground, Outdoors
 from honeybee.facetype import face_types
 
-from honeybee_energy.properties.model import ModelEnergyProperties
+from honeybee_energy.properties.model import ModelEnergyProperties, \
+    set_loader_processes
+from honeybee_energy.properties._identityset import IdentitySet
 from honeybee_energy.constructionset import ConstructionSet
 from honeybee_energy.idealair import IdealAirSystem
 from honeybee_energy.construction.opaque import OpaqueConstruction
@@ -72,6 +74,52 @@ def test_energy_properties():
     assert len(model.properties.energy.program_types) == 1
 
 
+def test_energy_properties_shared_resources():
+    """Test that resources shared across many objects are only counted once."""
+    thick_stone = EnergyMaterial('Thick Stone', 0.3, 2.31, 2322, 832, 'Rough',
+                                 0.95, 0.75, 0.8)
+    thermal_mass_constr = OpaqueConstruction('Thermal Mass Floor', [thick_stone])
+    half_occ = ScheduleRuleset.from_constant_value(
+        'Half Occupied', 0.5, schedule_types.fractional)
+    rooms = []
+    for i in range(4):
+        room = Room.from_box('Zone {}'.format(i), 5, 10, 3, origin=Point3D(5 * i, 0, 0))
+        room[0].properties.energy.construction = thermal_mass_constr
+        room[3].apertures_by_ratio(0.4, 0.01)
+        room[3].apertures[0].overhang(0.5)
+        room[3].apertures[0].outdoor_shades[0].properties.energy.\
+            transmittance_schedule = half_occ
+        room.properties.energy.people = People('Occ {}'.format(i), 0.05, half_occ)
+        rooms.append(room)
+    model = Model('Row Houses', rooms)
+
+    assert model.properties.energy.face_constructions == [thermal_mass_constr]
+    assert model.properties.energy.shade_schedules == [half_occ]
+    assert thick_stone in model.properties.energy.materials
+    assert len([s for s in model.properties.energy.schedules if s is half_occ]) == 1
+    resources = model.properties.energy._resources()
+    assert resources.reference_count(thermal_mass_constr) == 4
+    assert resources.reference_count(half_occ) == 8  # occupancy and shades
+    assert resources.reference_count(office_program) == 0
+
+
+def test_identity_set():
+    """Test that the IdentitySet keeps equivalent instances and first-seen order."""
+    wall_1 = OpaqueConstruction('Wall', [wood, insulation, wood])
+    wall_2 = OpaqueConstruction('Wall', [wood, insulation, wood])
+    assert wall_1 == wall_2
+
+    constrs = IdentitySet([wall_2, None, wall_1, wall_2])
+    assert len(constrs) == 2
+    assert constrs.objects[0] is wall_2 and constrs.objects[1] is wall_1
+    assert wall_1 in constrs and generic_exterior_wall not in constrs
+    assert constrs.count(wall_2) == 2 and constrs.count(generic_exterior_wall) == 0
+    assert not constrs.add(wall_1)
+    assert constrs.add(generic_exterior_wall)
+    constrs.discard(wall_2)
+    assert list(constrs) == [wall_1, generic_exterior_wall]
+
+
 def test_check_duplicate_construction_set_names():
     """Test the check_duplicate_construction_set_names method."""
     first_floor = Room.from_box('First Floor', 10, 10, 3, origin=Point3D(0, 0, 0))
@@ -307,6 +355,68 @@ def test_to_from_dict():
     assert new_model.orphaned_shades[0].properties.energy.transmittance_schedule == tree_trans
 
 
+def test_from_dict_doors_and_consecutive_models():
+    """Test that Model.from_dict applies door constructions for several models."""
+    stone = EnergyMaterial('Thin Stone', 0.05, 2.31, 2322, 832, 'Rough',
+                           0.95, 0.75, 0.8)
+    door_constr = OpaqueConstruction('Stone Door', [stone])
+    door_verts = [Point3D(2, 10, 0.1), Point3D(1, 10, 0.1),
+                  Point3D(1, 10, 2.5), Point3D(2, 10, 2.5)]
+    room = Room.from_box('Tiny House Zone', 5, 10, 3)
+    door = Door('Front Door', Face3D(door_verts))
+    door.properties.energy.construction = door_constr
+    room[1].add_door(door)
+    door_model_dict = Model('Tiny House', [room]).to_dict()
+
+    thermal_mass_constr = OpaqueConstruction('Thermal Mass Floor', [stone])
+    other_room = Room.from_box('Shed Zone', 5, 10, 3)
+    other_room[0].properties.energy.construction = thermal_mass_constr
+    other_model_dict = Model('Shed', [other_room]).to_dict()
+
+    other_model = Model.from_dict(other_model_dict)
+    door_model = Model.from_dict(door_model_dict)
+    assert other_model.rooms[0][0].properties.energy.construction == \
+        thermal_mass_constr
+    assert door_model.rooms[0][0].properties.energy.construction != \
+        thermal_mass_constr
+    assert door_model.rooms[0][1].doors[0].properties.energy.construction == \
+        door_constr
+
+
+def test_from_dict_loader_processes():
+    """Test that Model resources created in a process pool match the serial ones."""
+    room = Room.from_box('Tiny House Zone', 5, 10, 3)
+    room.properties.energy.program_type = office_program
+    stone = EnergyMaterial('Thick Stone', 0.3, 2.31, 2322, 832, 'Rough',
+                           0.95, 0.75, 0.8)
+    thermal_mass_constr = OpaqueConstruction('Thermal Mass Floor', [stone])
+    room[0].properties.energy.construction = thermal_mass_constr
+    room[3].apertures_by_ratio(0.4, 0.01)
+    tree_canopy = Shade('Tree Canopy', Face3D.from_regular_polygon(
+        6, 2, Plane(Vector3D(0, 0, 1), Point3D(5, -3, 4))))
+    tree_trans = ScheduleRuleset.from_constant_value(
+        'Tree Transmittance', 0.75, schedule_types.fractional)
+    tree_canopy.properties.energy.transmittance_schedule = tree_trans
+    model_dict = Model('Tiny House', [room], orphaned_shades=[tree_canopy]).to_dict()
+
+    new_model = Model.from_dict(model_dict)
+    new_model.properties.energy.apply_properties_from_dict(model_dict, processes=2)
+    assert model_dict == new_model.to_dict()
+    assert new_model.rooms[0][0].properties.energy.construction == thermal_mass_constr
+    assert new_model.orphaned_shades[0].properties.energy.transmittance_schedule == \
+        tree_trans
+    assert new_model.orphaned_shades[0].properties.energy.transmittance_schedule \
+        .schedule_type_limit == schedule_types.fractional
+
+    set_loader_processes(2)
+    try:
+        assert Model.from_dict(model_dict).to_dict() == model_dict
+    finally:
+        set_loader_processes(1)
+    with pytest.raises(AssertionError):
+        set_loader_processes(0)
+
+
 def test_to_dict_single_zone():
     """Test the Model to_dict method with a single zone model."""
     room = Room.from_box('Tiny House Zone', 5, 10, 3)
@@ -0,0 +1,42 @@
+# coding=utf-8
+from honeybee_energy.reader import parse_idf_file, idf_objects_by_type, \
+    parse_idf_string
+from honeybee_energy.schedule.ruleset import ScheduleRuleset
+from honeybee_energy.schedule.typelimit import ScheduleTypeLimit
+
+
+def test_parse_idf_file():
+    """Test the parse_idf_file method."""
+    office_sched_idf = './tests/idf/OfficeOccupancySchedule.idf'
+    idf_objects = parse_idf_file(office_sched_idf)
+
+    assert 'scheduletypelimits' in idf_objects
+    assert len(idf_objects['schedule:year']) == 1
+    assert len(idf_objects['schedule:day:interval']) == 5
+    type_str = idf_objects['scheduletypelimits'][0]
+    assert type_str == 'ScheduleTypeLimits,Fractional,0,1,Continuous;'
+    assert parse_idf_string(type_str) == ['Fractional', '0', '1', 'Continuous']
+
+
+def test_idf_objects_by_type():
+    """Test the idf_objects_by_type method."""
+    office_sched_idf = './tests/idf/OfficeOccupancySchedule.idf'
+    idf_objects = parse_idf_file(office_sched_idf)
+
+    week_strs = idf_objects_by_type(
+        idf_objects, 'Schedule:Week:Daily', 'SCHEDULE:WEEK:COMPACT')
+    assert len(week_strs) == 1
+    assert week_strs[0].startswith('Schedule:Week:Daily,')
+    assert idf_objects_by_type(idf_objects, 'Construction') == []
+
+
+def test_extract_all_from_parsed_idf():
+    """Test that extract_all_from_idf_file accepts a parsed IDF file."""
+    office_sched_idf = './tests/idf/OfficeOccupancySchedule.idf'
+    idf_objects = parse_idf_file(office_sched_idf)
+
+    office_scheds = ScheduleRuleset.extract_all_from_idf_file(idf_objects)
+    sched_types = ScheduleTypeLimit.extract_all_from_idf_file(idf_objects)
+    assert office_scheds == ScheduleRuleset.extract_all_from_idf_file(office_sched_idf)
+    assert len(sched_types) == 1
+    assert office_scheds[0].schedule_type_limit == sched_types[0]
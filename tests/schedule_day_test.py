@@ -6,6 +6,7 @@ from ladybug.dt import Time, Date
 from ladybug.datacollection import HourlyContinuousCollection
 from ladybug.analysisperiod import AnalysisPeriod
 
+import pickle
 import pytest
 
 
@@ -132,6 +133,28 @@ def test_schedule_day_values_at_timestep_interpolate():
         assert hb_val == pytest.approx(ep_val, rel=1e-3)
 
 
+def test_schedule_day_values_at_timestep_edited():
+    """Test that ScheduleDay values_at_timestep reflects edits to the schedule."""
+    simple_office = ScheduleDay('Simple Office Occupancy', [0, 1, 0],
+                                [Time(0, 0), Time(9, 0), Time(17, 0)])
+    assert simple_office.values_at_timestep()[9:17] == [1] * 8
+    simple_office.values_at_timestep().append(1)  # returned lists are copies
+    assert len(simple_office.values_at_timestep()) == 24
+
+    simple_office.replace_value(1, 0.5)
+    assert simple_office.values_at_timestep()[9:17] == [0.5] * 8
+    simple_office.add_value(1, Time(12, 0))
+    assert simple_office.values_at_timestep()[9:17] == [0.5] * 3 + [1] * 5
+    simple_office.remove_value(2)
+    assert simple_office.values_at_timestep()[9:17] == [0.5] * 8
+    simple_office.values = [0, 0.25, 0]
+    assert simple_office.values_at_timestep()[9:17] == [0.25] * 8
+    simple_office.times = [Time(0, 0), Time(8, 0), Time(18, 0)]
+    assert simple_office.values_at_timestep()[8:18] == [0.25] * 10
+    simple_office.interpolate = True
+    assert simple_office.values_at_timestep()[8] == pytest.approx(0.025, rel=1e-3)
+
+
 def test_schedule_day_init_from_values():
     """Test the initialization of ScheduleDay from_values_at_timestep."""
     test_vals = [0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 1, 1, 1, 1, 1, 1,
@@ -330,6 +353,18 @@ def test_schedule_day_dict_methods():
     assert sch_dict == new_simple_office.to_dict()
 
 
+def test_schedule_day_pickle_locked():
+    """Test that a locked ScheduleDay with cached values can be pickled."""
+    simple_office = ScheduleDay('Simple Office Occupancy', [0, 1, 0],
+                                [Time(0, 0), Time(9, 0), Time(17, 0)])
+    simple_office.values_at_timestep(4)
+    simple_office.lock()
+    new_simple_office = pickle.loads(pickle.dumps(simple_office, 2))
+    assert new_simple_office == simple_office
+    assert new_simple_office.values_at_timestep(4) == \
+        simple_office.values_at_timestep(4)
+
+
 def test_schedule_day_average_schedules():
     """Test the average_schedules method."""
     open_office = ScheduleDay('Open Office Occupancy', [0, 1, 0.5, 0],
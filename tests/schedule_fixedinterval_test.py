@@ -12,6 +12,7 @@ from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.futil import csv_to_matrix
 
 import random
+from array import array
 import os
 import pytest
 import json
@@ -134,6 +135,56 @@ def test_schedule_fixedinterval_lockability():
     schedule.values = [1] * 8760
 
 
+def test_schedule_fixedinterval_values_cache():
+    """Test that the values_at_timestep of locked ScheduleFixedIntervals are cached."""
+    schedule = ScheduleFixedInterval(
+        'Custom Transmittance', [x / 8760 for x in range(8760)],
+        schedule_types.fractional)
+
+    base_vals = schedule.values_at_timestep(2)
+    schedule.lock()
+    assert schedule.values_at_timestep(2) == base_vals
+    assert schedule.values_at_timestep(2) == base_vals
+    assert schedule.values_cache.hits == 1
+    assert schedule.values_cache.misses == 1
+    assert schedule.values_cache.currsize == 1
+
+    schedule.unlock()  # unlocking the schedule should clear the cache
+    assert schedule.values_cache.currsize == 0
+    schedule.values = [1] * 8760
+    schedule.lock()
+    assert schedule.values_at_timestep(2) == [1] * 8760 * 2
+
+
+def test_schedule_fixedinterval_array_values():
+    """Test ScheduleFixedIntervals with values stored in an array."""
+    trans_sched = [x / 8760 for x in range(8760)]
+    arr_vals = array('d', trans_sched)
+    schedule = ScheduleFixedInterval('Custom Transmittance', arr_vals,
+                                     schedule_types.fractional)
+    arr_vals[0] = 1  # the schedule should keep its own copy of the array
+
+    assert isinstance(schedule.values, array)
+    assert schedule.values[0] == 0
+    assert schedule == ScheduleFixedInterval('Custom Transmittance', trans_sched,
+                                             schedule_types.fractional)
+    assert schedule.values_at_timestep() == trans_sched
+    assert schedule.values_at_timestep(2)[:4] == [0, 0, 1 / 8760, 1 / 8760]
+    assert schedule.values_at_timestep(1, Date(1, 2), Date(1, 2)) == trans_sched[24:48]
+    assert json.loads(json.dumps(schedule.to_dict()))['values'] == trans_sched
+
+    sched_dup = schedule.duplicate()
+    assert isinstance(sched_dup.values, array)
+    assert sched_dup.values is not schedule.values
+
+    schedule.lock()
+    assert schedule.values_at_timestep()[0] == 0
+    schedule.values[0] = 9  # the returned array is a copy of the locked values
+    assert schedule.values[0] == 0
+    assert schedule.values_at_timestep()[0] == 0
+    assert schedule == sched_dup
+
+
 def test_schedule_fixedinterval_values_at_timestep():
     """Test the ScheduleFixedInterval values_at_timestep method."""
     trans_sched = ScheduleFixedInterval(
@@ -275,6 +326,7 @@ def test_schedule_fixedinterval_from_idf():
 
     assert ec_schedule.name == 'Electrochromic Control'
     assert len(ec_schedule.values) == 8760
+    assert isinstance(ec_schedule.values, array)
     assert ec_schedule[0] == 0
     assert ec_schedule.schedule_type_limit is None
     assert ec_schedule.timestep == 1
@@ -349,9 +401,54 @@ def test_shcedule_fixedinterval_to_idf_collective_csv():
     assert len(all_data) == 8761
     assert len(all_data[0]) >= 4
 
+    csv_data = ScheduleFixedInterval._csv_data(collective_string)
+    assert len(csv_data) == 1  # the CSV file was only read once
+    assert len(list(csv_data.values())[0]) == 4
+    for i, sched_str in enumerate(collective_string):
+        sched = ScheduleFixedInterval._from_idf(sched_str, csv_data=csv_data)
+        assert sched.name == ec_scheds[i].name
+        assert sched.values == ec_scheds[i].values
+        assert ScheduleFixedInterval.from_idf(sched_str) == sched
+
+    lower_str = collective_string[0].replace('Comma', 'comma')
+    assert ScheduleFixedInterval.from_idf(lower_str).values == ec_scheds[0].values
+    with pytest.raises(ValueError):
+        ScheduleFixedInterval.from_idf(collective_string[0].replace('Comma', 'Pipe'))
+
     os.remove('./tests/csv/All_Electrochromic.csv')
 
 
+def test_shcedule_fixedinterval_to_idf_collective_csv_datetimes():
+    """Test the to_idf_collective_csv method with a column of datetimes."""
+    sched_1 = ScheduleFixedInterval('Sched 1', [x / 8760 for x in range(8760)])
+    sched_2 = ScheduleFixedInterval('Sched 2', [0, 1] * 8760, timestep=2)
+
+    collective_string = ScheduleFixedInterval.to_idf_collective_csv(
+        [sched_1, sched_2], './tests/csv/', 'Datetime Schedules', True)
+
+    assert len(collective_string) == 2
+    all_data = csv_to_matrix('./tests/csv/Datetime_Schedules.csv')
+    assert len(all_data) == 8760 * 2 + 1
+    assert all_data[0][:3] == ['', 'Sched 1', 'Sched 2']
+    assert all_data[1][:3] == ['01 Jan 00:00', '0.0', '0.0']
+    assert all_data[2][:3] == ['01 Jan 00:30', '0.0', '1.0']
+    assert all_data[-1][:3] == ['31 Dec 23:30', str(8759 / 8760), '1.0']
+
+    os.remove('./tests/csv/Datetime_Schedules.csv')
+
+
+def test_schedule_fixedinterval_write_csv_rows():
+    """Test that CSV rows are written in chunks without changing the file."""
+    rows = [str(x) for x in range(2500)]
+    file_path = './tests/csv/Chunked_Rows.csv'
+    for chunk_size in (1, 1000, 2500, 5000):
+        ScheduleFixedInterval._write_csv_rows(file_path, iter(rows), chunk_size)
+        with open(file_path) as csv_file:
+            assert csv_file.read() == ',\n'.join(rows)
+
+    os.remove(file_path)
+
+
 def test_schedule_fixedinterval_average_schedules():
     """Test the average_schedules method."""
     trans_sched_1 = ScheduleFixedInterval('Transmittance 1', [1 for i in range(8760)],
@@ -393,3 +490,19 @@ def test_schedule_fixedinterval_average_schedules_ruleset():
         'Transmittance Avg', [trans_sched_1, trans_sched_2], [0.75, 0.25])
     assert len(avg_trans.values) == 8760
     assert list(avg_trans.values) == [0.75] * 8760
+
+
+def test_schedule_fixedinterval_average_schedules_timestep():
+    """Test the average_schedules method with schedules of different timesteps."""
+    trans_sched_1 = ScheduleFixedInterval(
+        'Transmittance 1', array('d', [1, 0] * 8760), schedule_types.fractional, 2)
+    trans_sched_2 = ScheduleFixedInterval('Transmittance 2', [0.5] * 8760,
+                                          schedule_types.fractional)
+    trans_sched_3 = ScheduleRuleset.from_constant_value('Transmittance 3', 0)
+
+    avg_trans = ScheduleFixedInterval.average_schedules(
+        'Transmittance Avg', [trans_sched_1, trans_sched_2, trans_sched_3],
+        [0.5, 0.25, 0.25])
+    assert avg_trans.timestep == 2
+    assert len(avg_trans.values) == 8760 * 2
+    assert list(avg_trans.values[:4]) == [0.625, 0.125, 0.625, 0.125]
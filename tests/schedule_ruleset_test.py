@@ -3,6 +3,7 @@ from honeybee_energy.schedule.day import ScheduleDay
 from honeybee_energy.schedule.rule import ScheduleRule
 from honeybee_energy.schedule.ruleset import ScheduleRuleset
 from honeybee_energy.schedule.typelimit import ScheduleTypeLimit
+from honeybee_energy.reader import parse_idf_string
 import honeybee_energy.lib.scheduletypelimits as schedule_types
 
 from ladybug.dt import Date, Time
@@ -10,6 +11,7 @@ from ladybug.datatype import fraction
 from ladybug.analysisperiod import AnalysisPeriod
 
 import json
+import datetime
 import pytest
 
 
@@ -91,6 +93,66 @@ def test_schedule_ruleset_lockability():
     schedule.default_day_schedule.remove_value_by_time(Time(17, 0))
 
 
+def test_schedule_ruleset_values_cache():
+    """Test that the values of locked ScheduleRulesets are cached."""
+    weekday_office = ScheduleDay('Weekday Office Occupancy', [0, 1, 0],
+                                 [Time(0, 0), Time(9, 0), Time(17, 0)])
+    saturday_office = ScheduleDay('Saturday Office Occupancy', [0, 0.25, 0],
+                                  [Time(0, 0), Time(9, 0), Time(17, 0)])
+    sunday_office = ScheduleDay('Sunday Office Occupancy', [0])
+    sat_rule = ScheduleRule(saturday_office, apply_saturday=True)
+    sun_rule = ScheduleRule(sunday_office, apply_sunday=True)
+    schedule = ScheduleRuleset('Office Occupancy', weekday_office,
+                               [sat_rule, sun_rule], schedule_types.fractional)
+
+    base_vals = schedule.values()
+    assert schedule.values_cache.misses == 0  # no caching while unlocked
+    schedule.lock()
+    assert schedule.values() == base_vals
+    assert schedule.values() == base_vals
+    assert schedule.values_cache.hits == 1
+    assert schedule.values_cache.misses == 1
+    schedule.values()[0] = 100  # editing the returned list should not edit the cache
+    assert schedule.values() == base_vals
+    assert schedule.values(holidays=[Date(1, 2)]) == base_vals
+    assert schedule.values_cache.misses == 2
+    assert len(schedule.data_collection()) == 8760
+    assert schedule.values_cache.hits == 4
+
+    schedule.reorder_rule(1)  # editing the rules should clear the cache
+    assert schedule.values_cache.currsize == 0
+    schedule.unlock()
+    schedule.default_day_schedule.replace_value(1, 0.5)
+    schedule.lock()
+    assert schedule.values()[33] == 0.5
+
+
+def test_schedule_ruleset_values_cache_child_edits():
+    """Test that cached values reflect edits to the days and rules of a schedule."""
+    weekday_office = ScheduleDay('Weekday Office Occupancy', [0, 1, 0],
+                                 [Time(0, 0), Time(9, 0), Time(17, 0)])
+    weekend_office = ScheduleDay('Weekend Office Occupancy', [0])
+    weekend_rule = ScheduleRule(weekend_office, apply_saturday=True,
+                                apply_sunday=True)
+    schedule = ScheduleRuleset('Office Occupancy', weekday_office,
+                               [weekend_rule], schedule_types.fractional)
+    schedule.lock()
+    assert schedule.values()[33] == 1  # Monday 2 Jan at 9:00
+    assert schedule.values()[9] == 0  # Sunday 1 Jan at 9:00
+
+    weekday_office.unlock()
+    weekday_office.replace_value(1, 0.5)
+    weekday_office.lock()
+    assert schedule.values()[33] == 0.5
+    assert schedule.values() == schedule.duplicate().values()
+
+    weekend_rule.unlock()
+    weekend_rule.apply_weekend = False
+    weekend_rule.lock()
+    assert schedule.values()[9] == 0.5
+    assert schedule.values() == schedule.duplicate().values()
+
+
 def test_schedule_ruleset_values():
     """Test the ScheduleRuleset values method."""
     weekday_office = ScheduleDay('Weekday Office Occupancy', [0, 1, 0],
@@ -117,6 +179,113 @@ def test_schedule_ruleset_values():
     assert len(sch_week_vals_10_min) == 24 * 7 * 6
 
 
+def test_schedule_ruleset_values_date_range_holidays():
+    """Test the ScheduleRuleset values method with partial-year rules and holidays."""
+    weekday_school = ScheduleDay('Weekday School Year', [0, 1, 0],
+                                 [Time(0, 0), Time(8, 0), Time(15, 0)])
+    weekend_school = ScheduleDay('Weekend School Year', [0])
+    weekday_summer = ScheduleDay('Weekday Summer', [0, 0.5, 0],
+                                 [Time(0, 0), Time(9, 0), Time(17, 0)])
+    summer_weekday_rule = ScheduleRule(
+        weekday_summer, start_date=Date(7, 1), end_date=Date(9, 1))
+    summer_weekday_rule.apply_weekday = True
+    school_weekend_rule = ScheduleRule(weekend_school)
+    school_weekend_rule.apply_weekend = True
+    school_weekend_rule.apply_holiday = True
+    schedule = ScheduleRuleset('School Occupancy', weekday_school,
+                               [summer_weekday_rule, school_weekend_rule])
+
+    holidays = (Date(1, 2), Date(7, 4))
+    sch_vals = schedule.values(holidays=holidays)
+    weekday_vals = weekday_school.values_at_timestep()
+    weekend_vals = weekend_school.values_at_timestep()
+    summer_vals = weekday_summer.values_at_timestep()
+    assert sch_vals[:24] == weekend_vals  # sunday
+    assert sch_vals[24:48] == weekend_vals  # holiday on a monday
+    assert sch_vals[48:72] == weekday_vals  # tuesday
+    jul_3 = (Date(7, 3).doy - 1) * 24
+    assert sch_vals[jul_3:jul_3 + 24] == summer_vals  # summer monday
+    assert sch_vals[jul_3 + 24:jul_3 + 48] == weekend_vals  # holiday on a tuesday
+    assert sch_vals[-24:] == weekend_vals  # december 31 is a sunday
+
+    leap_vals = schedule.values(holidays=holidays, leap_year=True)
+    jul_4 = (Date(7, 4, True).doy - 1) * 24
+    assert leap_vals[jul_4 - 24:jul_4] == summer_vals  # summer tuesday
+    assert leap_vals[jul_4:jul_4 + 24] == weekend_vals  # holiday on a wednesday
+
+
+def test_schedule_ruleset_values_edited_rules():
+    """Test that ScheduleRuleset values reflect rules that are edited in place."""
+    weekday_office = ScheduleDay('Weekday Office Occupancy', [0, 1, 0],
+                                 [Time(0, 0), Time(9, 0), Time(17, 0)])
+    saturday_office = ScheduleDay('Saturday Office Occupancy', [0, 0.25, 0],
+                                  [Time(0, 0), Time(9, 0), Time(17, 0)])
+    sunday_office = ScheduleDay('Sunday Office Occupancy', [0])
+    sat_rule = ScheduleRule(saturday_office, apply_saturday=True)
+    sun_rule = ScheduleRule(sunday_office, apply_sunday=True)
+    schedule = ScheduleRuleset('Office Occupancy', weekday_office,
+                               [sat_rule, sun_rule], schedule_types.fractional)
+
+    assert schedule.values()[24:48] == weekday_office.values_at_timestep()
+    sun_rule.apply_monday = True
+    assert schedule.values()[24:48] == sunday_office.values_at_timestep()
+    sun_rule.start_date = Date(1, 3)
+    assert schedule.values()[24:48] == weekday_office.values_at_timestep()
+    sat_rule.apply_monday = True
+    assert schedule.values()[192:216] == saturday_office.values_at_timestep()
+    schedule.reorder_rule(1)
+    assert schedule.values()[24:48] == saturday_office.values_at_timestep()
+    assert schedule.values()[192:216] == sunday_office.values_at_timestep()
+    schedule.remove_rule(1)
+    assert schedule.values()[24:48] == weekday_office.values_at_timestep()
+    assert schedule.values()[192:216] == sunday_office.values_at_timestep()
+
+
+def test_schedule_ruleset_values_multi_year():
+    """Test the ScheduleRuleset values method over several years."""
+    weekday_office = ScheduleDay('Weekday Office Occupancy', [0, 1, 0],
+                                 [Time(0, 0), Time(9, 0), Time(17, 0)])
+    saturday_office = ScheduleDay('Saturday Office Occupancy', [0, 0.25, 0],
+                                  [Time(0, 0), Time(9, 0), Time(17, 0)])
+    sunday_office = ScheduleDay('Sunday Office Occupancy', [0])
+    sat_rule = ScheduleRule(saturday_office, apply_saturday=True)
+    sun_rule = ScheduleRule(sunday_office, apply_sunday=True, apply_holiday=True)
+    schedule = ScheduleRuleset('Office Occupancy', weekday_office,
+                               [sat_rule, sun_rule], schedule_types.fractional)
+
+    holidays = [Date(7, 4), datetime.date(2021, 3, 1)]
+    sch_vals = schedule.values(holidays=holidays, years=range(2020, 2023))
+    assert len(sch_vals) == (366 + 365 + 365) * 24
+    assert sch_vals[:24] == weekday_office.values_at_timestep()  # Wed 1 Jan 2020
+    assert sch_vals[72:96] == saturday_office.values_at_timestep()  # Sat 4 Jan 2020
+    assert sch_vals[366 * 24:367 * 24] == weekday_office.values_at_timestep()
+    assert sch_vals[367 * 24:368 * 24] == saturday_office.values_at_timestep()
+    mar_2020 = 61 * 24  # Mon 2 Mar 2020
+    assert sch_vals[mar_2020:mar_2020 + 24] == weekday_office.values_at_timestep()
+    mar_2021 = (366 + 59) * 24  # Mon 1 Mar 2021 is a holiday only in 2021
+    assert sch_vals[mar_2021:mar_2021 + 24] == sunday_office.values_at_timestep()
+    jul_2022 = (366 + 365 + 184) * 24  # Mon 4 Jul 2022 is an annual holiday
+    assert sch_vals[jul_2022:jul_2022 + 24] == sunday_office.values_at_timestep()
+
+    sch_vals = schedule.values(start_date=Date(12, 1), end_date=Date(1, 31),
+                               years=(2020, 2021))
+    assert len(sch_vals) == (31 + 31) * 24
+
+    sch_data = schedule.data_collection(years=(2020, 2021))
+    assert len(sch_data) == 2
+    assert len(sch_data[0]) == 8784
+    assert len(sch_data[1]) == 8760
+    assert sch_data[0].header.analysis_period.is_leap_year
+    assert sch_data[1].header.metadata['year'] == '2021'
+    all_vals = schedule.values(years=(2020, 2021))
+    assert list(sch_data[1].values) == all_vals[8784:]
+
+    with pytest.raises(AssertionError):
+        schedule.values(years=(2020, 2030))
+    with pytest.raises(AssertionError):
+        schedule.values(years=(2021, 2020))
+
+
 def test_schedule_ruleset_data_collection():
     """Test the ScheduleRuleset data_collection method."""
     weekday_office = ScheduleDay('Weekday Office Occupancy', [0, 1, 0],
@@ -333,6 +502,12 @@ def test_schedule_ruleset_to_idf_date_range():
 
     assert len(year_sched.split(',')) > 6
     assert len(week_scheds) == 2
+    week_fields = [parse_idf_string(wk_sch) for wk_sch in week_scheds]
+    for week_field in week_fields:  # holidays should follow the rules of the period
+        assert week_field[8] == week_field[7]
+    assert parse_idf_string(year_sched)[2] == week_fields[0][0]
+    assert week_fields[0][1:9] == ['Weekend School Year'] + \
+        ['Weekday School Year'] * 5 + ['Weekend School Year'] * 2
 
     """
     f_dir = 'C:/Users/chris/Documents/GitHub/energy-model-schema/app/models/samples/json'
@@ -342,6 +517,77 @@ def test_schedule_ruleset_to_idf_date_range():
     """
 
 
+def test_schedule_ruleset_to_idf_collective():
+    """Test the ScheduleRuleset to_idf_collective method with equivalent days."""
+    schedules = []
+    for bldg in ('Office', 'School'):
+        weekday = ScheduleDay('{} Weekday'.format(bldg), [0, 1, 0],
+                              [Time(0, 0), Time(9, 0), Time(17, 0)])
+        weekend = ScheduleDay('{} Weekend'.format(bldg), [0])
+        weekend_rule = ScheduleRule(weekend, apply_saturday=True, apply_sunday=True)
+        schedules.append(ScheduleRuleset('{} Occupancy'.format(bldg), weekday,
+                                         [weekend_rule], schedule_types.fractional))
+    schedules.append(ScheduleRuleset.from_constant_value('Always On', 1))
+
+    year_scheds, week_scheds, day_scheds = \
+        ScheduleRuleset.to_idf_collective(schedules)
+    assert len(year_scheds) == 3
+    assert len(week_scheds) == 1
+    assert len(day_scheds) == 2
+    assert year_scheds[2].startswith('Schedule:Constant')
+
+    week_fields = parse_idf_string(week_scheds[0])
+    assert week_fields[0] == 'Office Occupancy_Week 1'
+    assert week_fields[1:] == ['Office Weekend'] + ['Office Weekday'] * 5 + \
+        ['Office Weekend'] + ['Office Weekday'] * 5
+    for year_sched in year_scheds[:2]:
+        assert parse_idf_string(year_sched)[2] == 'Office Occupancy_Week 1'
+
+    sch_names = [parse_idf_string(day_str)[0] for day_str in day_scheds]
+    assert sch_names == ['Office Weekday', 'Office Weekend']
+
+
+def test_schedule_ruleset_to_idf_collective_shared_index():
+    """Test that to_idf_collective shares the rule index of similar schedules."""
+    schedules = []
+    for i, val in enumerate((0.5, 1)):
+        weekday = ScheduleDay('Weekday {}'.format(i), [0, val, 0],
+                              [Time(0, 0), Time(9, 0), Time(17, 0)])
+        summer = ScheduleDay('Summer {}'.format(i), [0])
+        summer_rule = ScheduleRule(summer, start_date=Date(7, 1), end_date=Date(8, 31))
+        summer_rule.apply_weekday = True
+        schedules.append(ScheduleRuleset('Schedule {}'.format(i), weekday,
+                                         [summer_rule], schedule_types.fractional))
+
+    year_scheds, week_scheds, day_scheds = \
+        ScheduleRuleset.to_idf_collective(schedules)
+    assert schedules[0]._get_rule_index()[0] is schedules[1]._get_rule_index()[0]
+    assert len(week_scheds) == 4
+    assert len(day_scheds) == 3
+    for sched, year_sched in zip(schedules, year_scheds):
+        assert year_sched == sched.to_idf()[0]
+
+
+def test_schedule_ruleset_to_idf_collective_same_day_name():
+    """Test that to_idf_collective keeps different days that share the same name."""
+    day_a = ScheduleDay('Day', [0, 1, 0], [Time(0, 0), Time(9, 0), Time(17, 0)])
+    day_b = ScheduleDay('Day', [0.5, 0.2], [Time(0, 0), Time(12, 0)])
+    sched_a = ScheduleRuleset('Schedule A', day_a, None, schedule_types.fractional)
+    sched_b = ScheduleRuleset('Schedule B', day_b, None, schedule_types.fractional)
+
+    year_scheds, week_scheds, day_scheds = \
+        ScheduleRuleset.to_idf_collective([sched_a, sched_b])
+    assert len(day_scheds) == 2
+    day_a_fields, day_b_fields = [parse_idf_string(d_str) for d_str in day_scheds]
+    assert day_a_fields[0] == 'Day'
+    assert day_a_fields[3:] == ['09:00', '0.0', '17:00', '1.0', '24:00', '0.0']
+    assert day_b_fields[0] == 'Day_2'
+    assert day_b_fields[3:] == ['12:00', '0.5', '24:00', '0.2']
+    assert len(week_scheds) == 2
+    assert parse_idf_string(week_scheds[0])[1:] == ['Day'] * 12
+    assert parse_idf_string(week_scheds[1])[1:] == ['Day_2'] * 12
+
+
 def test_schedule_from_standards_dict():
     """Test the ScheduleRuleset from_standards_dict method."""
     filename = './tests/standards/OpenStudio_Standards_schedule.json'
@@ -0,0 +1,46 @@
+# coding=utf-8
+from honeybee_energy.writer import generate_idf_string, generate_idf_strings, \
+    set_compact_idf
+from honeybee_energy.material.opaque import EnergyMaterial
+
+
+def test_generate_idf_string():
+    """Test the generate_idf_string method with and without comments."""
+    values = ('Thick Stone', 'Rough', 0.3, 'A name that is longer than 25 chars')
+    comments = ('name', 'roughness', 'thickness {m}', 'note')
+    idf_str = generate_idf_string('Material', values, comments)
+    assert idf_str == 'Material,\n Thick Stone,              !- name\n' \
+        ' Rough,                    !- roughness\n' \
+        ' 0.3,                      !- thickness {m}\n' \
+        ' A name that is longer than 25 chars; !- note'
+    assert generate_idf_string('Material', values) == \
+        'Material,\n Thick Stone,\n Rough,\n 0.3,\n A name that is longer than 25 chars;'
+    assert generate_idf_string('Material', values, comments, compact=True) == \
+        'Material,Thick Stone,Rough,0.3,A name that is longer than 25 chars;'
+
+
+def test_generate_idf_strings():
+    """Test that generate_idf_strings matches generate_idf_string."""
+    values_list = [('Stone {}'.format(i), 'Rough', 0.1 * i) for i in range(5)]
+    comments = ('name', 'roughness', 'thickness {m}')
+    for compact in (False, True):
+        assert generate_idf_strings('Material', values_list, comments, compact) == \
+            [generate_idf_string('Material', values, comments, compact)
+             for values in values_list]
+    assert generate_idf_strings('Material', values_list) == \
+        [generate_idf_string('Material', values) for values in values_list]
+
+
+def test_set_compact_idf():
+    """Test that set_compact_idf changes the strings from to_idf methods."""
+    stone = EnergyMaterial('Thick Stone', 0.3, 2.31, 2322, 832, 'Rough',
+                           0.95, 0.75, 0.8)
+    try:
+        set_compact_idf(True)
+        idf_str = stone.to_idf()
+        assert idf_str == \
+            'Material,Thick Stone,Rough,0.3,2.31,2322.0,832.0,0.95,0.75,0.8;'
+        assert EnergyMaterial.from_idf(idf_str) == stone
+    finally:
+        set_compact_idf(False)
+    assert '!- name' in stone.to_idf()